@@ -65,7 +65,8 @@ async def fetch_pr_data(state: CodeReviewState) -> dict:
 
     try:
         diff = github.get_pr_diff(state["repository"], state["pr_number"])
-        files = github.get_pr_files(state["repository"], state["pr_number"])
+        # The diff already carries the patches; only per-file stats are needed here
+        files = github.get_pr_files(state["repository"], state["pr_number"], include_patches=False)
 
         logger.info(
             "Fetched PR #%d: %d files changed, %d char diff",
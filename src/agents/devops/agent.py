@@ -9,6 +9,7 @@ Flow:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -71,19 +72,24 @@ async def fetch_pipeline_data(state: DevOpsState) -> dict:
     all_runs: list[dict[str, Any]] = []
     failed_runs: list[dict[str, Any]] = []
 
-    for repo in repositories:
-        try:
-            runs = await graphql.get_workflow_runs(repo, limit=20)
-            for run in runs:
-                run["repository"] = repo
-            all_runs.extend(runs)
+    # Repos are independent; fetch them concurrently over the shared client
+    results = await asyncio.gather(
+        *(graphql.get_workflow_runs(repo, limit=20) for repo in repositories),
+        return_exceptions=True,
+    )
+
+    for repo, runs in zip(repositories, results):
+        if isinstance(runs, BaseException):
+            logger.warning("Failed to fetch workflow runs from %s: %s", repo, runs)
+            continue
+        for run in runs:
+            run["repository"] = repo
+        all_runs.extend(runs)
 
-            # Collect failed runs
-            for run in runs:
-                if run.get("conclusion") == "failure":
-                    failed_runs.append(run)
-        except Exception as e:
-            logger.warning("Failed to fetch workflow runs from %s: %s", repo, e)
+        # Collect failed runs
+        for run in runs:
+            if run.get("conclusion") == "failure":
+                failed_runs.append(run)
 
     logger.info("Fetched %d total runs, %d failed across %d repos", len(all_runs), len(failed_runs), len(repositories))
     return {"workflow_runs": all_runs, "failed_runs": failed_runs, "repositories": repositories}
@@ -100,28 +106,29 @@ async def analyze_failures(state: DevOpsState) -> dict:
     failed_runs = state.get("failed_runs", [])
     failure_details: list[dict[str, Any]] = []
 
-    # Get job details for up to 5 most recent failures
-    for run in failed_runs[:5]:
-        repo = run.get("repository", "")
-        run_id = run.get("id")
-        if not run_id or not repo:
+    # Get job details for up to 5 most recent failures, concurrently
+    runs = [r for r in failed_runs[:5] if r.get("id") and r.get("repository")]
+    results = await asyncio.gather(
+        *(graphql.get_workflow_run_jobs(r["repository"], r["id"]) for r in runs),
+        return_exceptions=True,
+    )
+
+    for run, jobs in zip(runs, results):
+        run_id = run["id"]
+        if isinstance(jobs, BaseException):
+            logger.warning("Failed to get job details for run %s: %s", run_id, jobs)
             continue
 
-        try:
-            jobs = await graphql.get_workflow_run_jobs(repo, run_id)
-            failed_jobs = [j for j in jobs if j.get("conclusion") == "failure"]
-
-            failure_details.append({
-                "run_id": run_id,
-                "repository": repo,
-                "workflow_name": run.get("name", ""),
-                "branch": run.get("branch", ""),
-                "commit_sha": run.get("commit_sha", ""),
-                "html_url": run.get("html_url", ""),
-                "failed_jobs": failed_jobs,
-            })
-        except Exception as e:
-            logger.warning("Failed to get job details for run %s: %s", run_id, e)
+        failed_jobs = [j for j in jobs if j.get("conclusion") == "failure"]
+        failure_details.append({
+            "run_id": run_id,
+            "repository": run["repository"],
+            "workflow_name": run.get("name", ""),
+            "branch": run.get("branch", ""),
+            "commit_sha": run.get("commit_sha", ""),
+            "html_url": run.get("html_url", ""),
+            "failed_jobs": failed_jobs,
+        })
 
     return {"failure_details": failure_details}
 
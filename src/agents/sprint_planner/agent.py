@@ -11,16 +11,19 @@ Flow:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-import re
+import string
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import Any, TypedDict
 
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import AzureChatOpenAI, ChatOpenAI
 from langgraph.graph import END, StateGraph
+from pydantic import TypeAdapter
 
 from src.agents.sprint_planner.models import (
     BayesSOWSummary,
@@ -42,6 +45,47 @@ from src.integrations.github_client import GitHubClient
 
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Reused validator/serializer for batches of deliverables
+_DELIVERABLE_LIST_ADAPTER = TypeAdapter(list[Deliverable])
+
+_BLOCKED_LABELS = frozenset({"blocked", "bayes-blocked"})
+_BAYES_LABELS = frozenset(
+    {"bayes", "bayes-assigned", "bayes-in-progress", "bayes-review", "bayes-blocked"}
+)
+
+
+# ── Prompt Templates ──
+
+
+def _compile_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Pre-parse a ``str.format`` template into ``(literal, field_name)`` pairs.
+
+    Only bare ``{name}`` fields are supported, which is all the sprint
+    prompts use; rendering then becomes a single ``str.join``.
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if spec or conversion:
+            raise ValueError(f"Unsupported format spec in prompt field {field!r}")
+        parts.append((literal, field))
+    return tuple(parts)
+
+
+def _render_template(parts: tuple[tuple[str, str | None], ...], **fields: Any) -> str:
+    """Render a template pre-parsed by ``_compile_template``."""
+    out: list[str] = []
+    for literal, field in parts:
+        out.append(literal)
+        if field is not None:
+            out.append(str(fields[field]))
+    return "".join(out)
+
+
+_REC_PROMPT_PARTS = _compile_template(SPRINT_RECOMMENDATIONS_PROMPT)
+_RETRO_PROMPT_PARTS = _compile_template(SPRINT_RETROSPECTIVE_PROMPT)
+
 
 # ── Agent State ──
 
@@ -80,7 +124,6 @@ async def fetch_sprint_data(state: SprintPlannerState) -> dict:
     """Fetch sprint data from GitHub Projects V2 (preferred) or Issues (fallback)."""
     from src.config import settings
 
-    github = GitHubClient()
     use_projects_v2 = False
     sprint_start_date = None
     sprint_end_date = None
@@ -90,11 +133,21 @@ async def fetch_sprint_data(state: SprintPlannerState) -> dict:
         issues = []
         repositories = []
 
-        # Get repositories to scan
+        # Get repositories to scan (deduplicated, order preserved)
         if state.get("repository"):
             repositories = [state["repository"]]
         else:
-            repositories = settings.monitored_repos or []
+            repositories = list(dict.fromkeys(settings.monitored_repos or []))
+
+        if not repositories and not settings.has_projects_v2:
+            logger.info("No repositories or Projects V2 configured — skipping sprint fetch")
+            return {
+                "issues": [],
+                "project_items": [],
+                "use_projects_v2": False,
+                "sprint_start_date": None,
+                "sprint_end_date": None,
+            }
 
         # Try Projects V2 first
         if settings.has_projects_v2:
@@ -128,25 +181,28 @@ async def fetch_sprint_data(state: SprintPlannerState) -> dict:
             except Exception as e:
                 logger.warning("Projects V2 fetch failed, falling back to Issues: %s", e)
 
-        # Always fetch issues (needed for velocity and Bayes tracking)
-        for repo in repositories:
-            try:
-                repo_issues = github.get_repository_issues(repo, state="open")
-                issues.extend(repo_issues)
-                logger.info("Fetched %d issues from %s", len(repo_issues), repo)
-            except Exception as e:
-                logger.warning("Failed to fetch issues from %s: %s", repo, e)
+        # Always fetch issues (needed for velocity and Bayes tracking), plus
+        # closed issues from the last 30 days for velocity. PyGithub is
+        # blocking, so each repo fetch runs in a worker thread and all of
+        # them overlap.
+        github = GitHubClient()
+        since = (datetime.utcnow() - timedelta(days=30)).isoformat()
 
-        # Also fetch closed issues from last 30 days for velocity calculation
-        for repo in repositories:
+        async def _fetch_issues(repo: str, **kwargs: Any) -> list[dict[str, Any]]:
             try:
-                since = datetime.utcnow() - timedelta(days=30)
-                closed_issues = github.get_repository_issues(
-                    repo, state="closed", since=since.isoformat()
-                )
-                issues.extend(closed_issues)
+                return await asyncio.to_thread(github.get_repository_issues, repo, **kwargs)
             except Exception as e:
-                logger.warning("Failed to fetch closed issues: %s", e)
+                logger.warning("Failed to fetch %s issues from %s: %s", kwargs["state"], repo, e)
+                return []
+
+        open_results = [_fetch_issues(repo, state="open") for repo in repositories]
+        closed_results = [_fetch_issues(repo, state="closed", since=since) for repo in repositories]
+        results = await asyncio.gather(*open_results, *closed_results)
+
+        for repo, repo_issues in zip(repositories, results):
+            logger.info("Fetched %d issues from %s", len(repo_issues), repo)
+        for repo_issues in results:
+            issues.extend(repo_issues)
 
         return {
             "issues": issues,
@@ -275,16 +331,8 @@ async def track_bayes_deliverables(state: SprintPlannerState) -> dict:
     issues = state.get("issues", [])
 
     try:
-        bayes_issues = []
-        bayes_labels = {"bayes", "bayes-assigned", "bayes-in-progress", "bayes-review", "bayes-blocked"}
-
-        for issue in issues:
-            labels = [l.get("name", "").lower() for l in issue.get("labels", [])]
-            if any(bayes_label in labels for bayes_label in bayes_labels):
-                bayes_issues.append(issue)
-
         # Categorize Bayes deliverables
-        deliverables = []
+        raw_deliverables: list[dict[str, Any]] = []
         status_counts = {
             "not_started": 0,
             "in_progress": 0,
@@ -293,8 +341,11 @@ async def track_bayes_deliverables(state: SprintPlannerState) -> dict:
             "blocked": 0,
         }
 
-        for issue in bayes_issues:
+        # Single scan: filter to Bayes issues and classify them in the same pass
+        for issue in issues:
             labels = [l.get("name", "").lower() for l in issue.get("labels", [])]
+            if _BAYES_LABELS.isdisjoint(labels):
+                continue
             state_label = issue.get("state", "open").lower()
 
             # Determine status
@@ -321,24 +372,27 @@ async def track_bayes_deliverables(state: SprintPlannerState) -> dict:
                         points = 1
                     break
 
-            deliverable = Deliverable(
-                deliverable_id=str(issue.get("number", 0)),
-                title=issue.get("title", ""),
-                vendor=VendorType.BAYES_CONSULTING,
-                status=status,
-                story_points=points,
-                labels=labels,
-                github_issue_id=issue.get("number"),
-            )
-            deliverables.append(deliverable)
+            raw_deliverables.append({
+                "deliverable_id": str(issue.get("number", 0)),
+                "title": issue.get("title", ""),
+                "vendor": VendorType.BAYES_CONSULTING,
+                "status": status,
+                "story_points": points,
+                "labels": labels,
+                "github_issue_id": issue.get("number"),
+            })
+
+        # Validate the whole batch in one pydantic-core call
+        deliverables = _DELIVERABLE_LIST_ADAPTER.validate_python(raw_deliverables)
 
         # Create Bayes summary
+        now = datetime.utcnow()
         sow_summary = BayesSOWSummary(
-            total_deliverables=len(bayes_issues),
+            total_deliverables=len(deliverables),
             completed_deliverables=status_counts["done"],
             in_progress_deliverables=status_counts["in_progress"],
             blocked_deliverables=status_counts["blocked"],
-            overdue_deliverables=sum(1 for d in deliverables if d.is_overdue),
+            overdue_deliverables=sum(1 for d in deliverables if d.is_overdue_at(now)),
         )
 
         logger.info(
@@ -350,7 +404,7 @@ async def track_bayes_deliverables(state: SprintPlannerState) -> dict:
 
         return {
             "bayes_summary": {
-                "deliverables": [d.model_dump() for d in deliverables],
+                "deliverables": _DELIVERABLE_LIST_ADAPTER.dump_python(deliverables),
                 "status_counts": status_counts,
                 "sow_summary": sow_summary.model_dump(),
             }
@@ -392,6 +446,15 @@ def _get_llm():
     return None
 
 
+def _parse_json_object(content: str) -> dict:
+    """Parse the first top-level JSON object embedded in LLM output."""
+    start = content.find("{")
+    if start == -1:
+        return json.loads(content.strip())
+    parsed, _ = _JSON_DECODER.raw_decode(content, start)
+    return parsed
+
+
 def _static_recommendations(metrics_data: dict, bayes_summary: dict) -> list[str]:
     """Generate static rule-based recommendations as LLM fallback."""
     recommendations = []
@@ -448,19 +511,20 @@ async def generate_recommendations(state: SprintPlannerState) -> dict:
 
     metrics_data = state.get("metrics", {})
     bayes_summary = state.get("bayes_summary", {})
-    issues = state.get("issues", [])
     query_type = state.get("query_type", "")
 
     # Use retrospective prompt if query type is retrospective
     if query_type == SprintQueryType.RETROSPECTIVE.value:
         return await _generate_retrospective(state)
 
-    # Try LLM-powered recommendations
+    # Try LLM-powered recommendations; bail out before any prompt formatting
     llm = _get_llm()
     if not llm:
         logger.info("No LLM available — using static recommendations")
         return {"recommendations": _static_recommendations(metrics_data, bayes_summary)}
 
+    issues = state.get("issues", [])
+
     try:
         # Build metrics summary
         metrics_text = "No metrics available."
@@ -489,13 +553,14 @@ async def generate_recommendations(state: SprintPlannerState) -> dict:
 
         # Build issue highlights (top blocked/overdue)
         highlights = []
-        for issue in issues[:20]:
+        for issue in islice(issues, 20):
             labels = [l.get("name", "").lower() for l in issue.get("labels", [])]
             if "blocked" in labels or "bayes-blocked" in labels:
                 highlights.append(f"- [BLOCKED] #{issue.get('number')}: {issue.get('title', '')}")
         issue_text = "\n".join(highlights[:10]) if highlights else "No blocked issues."
 
-        user_prompt = SPRINT_RECOMMENDATIONS_PROMPT.format(
+        user_prompt = _render_template(
+            _REC_PROMPT_PARTS,
             metrics_summary=metrics_text,
             bayes_summary=bayes_text,
             issue_highlights=issue_text,
@@ -508,37 +573,7 @@ async def generate_recommendations(state: SprintPlannerState) -> dict:
         response = await llm.ainvoke(messages)
         content = response.content
 
-        # Parse JSON
-        json_match = re.search(r"\{", content)
-        if json_match:
-            start = json_match.start()
-            depth = 0
-            in_str = False
-            esc = False
-            end = start
-            for i in range(start, len(content)):
-                c = content[i]
-                if esc:
-                    esc = False
-                    continue
-                if c == "\\":
-                    esc = True
-                    continue
-                if c == '"':
-                    in_str = not in_str
-                    continue
-                if in_str:
-                    continue
-                if c == "{":
-                    depth += 1
-                elif c == "}":
-                    depth -= 1
-                    if depth == 0:
-                        end = i + 1
-                        break
-            parsed = json.loads(content[start:end])
-        else:
-            parsed = json.loads(content.strip())
+        parsed = _parse_json_object(content)
 
         recommendations = parsed.get("recommendations", [])
         logger.info("Generated %d LLM recommendations", len(recommendations))
@@ -551,6 +586,12 @@ async def generate_recommendations(state: SprintPlannerState) -> dict:
 
 async def _generate_retrospective(state: SprintPlannerState) -> dict:
     """Generate a sprint retrospective using LLM."""
+    llm = _get_llm()
+    if not llm:
+        return {"recommendations": [
+            "Sprint retrospective requires an LLM. Configure ANTHROPIC_API_KEY or ZAI_API_KEY."
+        ]}
+
     metrics_data = state.get("metrics", {})
     bayes_summary = state.get("bayes_summary", {})
     issues = state.get("issues", [])
@@ -565,12 +606,6 @@ async def _generate_retrospective(state: SprintPlannerState) -> dict:
     in_progress = len(issues) - completed - blocked
     overdue = metrics_data.get("overdue_items", 0)
 
-    llm = _get_llm()
-    if not llm:
-        return {"recommendations": [
-            "Sprint retrospective requires an LLM. Configure ANTHROPIC_API_KEY or ZAI_API_KEY."
-        ]}
-
     try:
         metrics_text = (
             f"- Completion rate: {metrics_data.get('completion_rate', 0):.1f}%\n"
@@ -583,7 +618,8 @@ async def _generate_retrospective(state: SprintPlannerState) -> dict:
             sow = bayes_summary.get("sow_summary", {})
             bayes_text = f"Completed: {sow.get('completed_deliverables', 0)}/{sow.get('total_deliverables', 0)}"
 
-        user_prompt = SPRINT_RETROSPECTIVE_PROMPT.format(
+        user_prompt = _render_template(
+            _RETRO_PROMPT_PARTS,
             metrics_summary=metrics_text,
             completed_count=completed,
             in_progress_count=in_progress,
@@ -599,37 +635,7 @@ async def _generate_retrospective(state: SprintPlannerState) -> dict:
         response = await llm.ainvoke(messages)
         content = response.content
 
-        # Parse JSON
-        json_match = re.search(r"\{", content)
-        if json_match:
-            start = json_match.start()
-            depth = 0
-            in_str = False
-            esc = False
-            end = start
-            for i in range(start, len(content)):
-                c = content[i]
-                if esc:
-                    esc = False
-                    continue
-                if c == "\\":
-                    esc = True
-                    continue
-                if c == '"':
-                    in_str = not in_str
-                    continue
-                if in_str:
-                    continue
-                if c == "{":
-                    depth += 1
-                elif c == "}":
-                    depth -= 1
-                    if depth == 0:
-                        end = i + 1
-                        break
-            parsed = json.loads(content[start:end])
-        else:
-            parsed = json.loads(content.strip())
+        parsed = _parse_json_object(content)
 
         # Flatten retrospective into recommendations list + store full retro in report
         retro_recs = parsed.get("recommendations", [])
@@ -673,22 +679,23 @@ async def generate_report(state: SprintPlannerState) -> dict:
 
         now = datetime.utcnow()
 
+        # Single pass: closed issues need no label or due-date work at all
         for issue in issues:
-            labels = [l.get("name", "").lower() for l in issue.get("labels", [])]
-            state_label = issue.get("state", "open").lower()
-
-            if state_label == "closed":
+            if issue.get("state", "open").lower() == "closed":
                 completed.append(issue)
-            elif "blocked" in labels or "bayes-blocked" in labels:
-                blocked.append(issue)
-            else:
+                continue
+
+            labels = {l.get("name", "").lower() for l in issue.get("labels", [])}
+            if labels.isdisjoint(_BLOCKED_LABELS):
                 in_progress.append(issue)
+            else:
+                blocked.append(issue)
 
             # Check overdue
             milestone = issue.get("milestone")
             if milestone and milestone.get("due_on"):
                 due_date = datetime.fromisoformat(milestone["due_on"].replace("Z", "+00:00"))
-                if due_date < now and state_label != "closed":
+                if due_date < now:
                     overdue.append(issue)
 
         # Build summary text
@@ -749,10 +756,18 @@ async def generate_report(state: SprintPlannerState) -> dict:
 # ── Build the Graph ──
 
 
+def _route_after_fetch(state: SprintPlannerState) -> str:
+    """Skip straight to the report when fetching failed — every other node is a no-op."""
+    if state.get("error"):
+        return "generate_report"
+    return "calculate_metrics"
+
+
 def build_sprint_planner_graph() -> StateGraph:
     """Construct the Sprint Planner agent as a LangGraph StateGraph.
 
     Flow: fetch_sprint_data → calculate_metrics → track_bayes → generate_recommendations → generate_report
+    (a fetch error routes directly to generate_report)
     """
     graph = StateGraph(SprintPlannerState)
 
@@ -763,9 +778,13 @@ def build_sprint_planner_graph() -> StateGraph:
     graph.add_node("generate_recommendations", generate_recommendations)
     graph.add_node("generate_report", generate_report)
 
-    # Define edges (linear pipeline)
+    # Define edges (linear pipeline, short-circuited on fetch errors)
     graph.set_entry_point("fetch_sprint_data")
-    graph.add_edge("fetch_sprint_data", "calculate_metrics")
+    graph.add_conditional_edges(
+        "fetch_sprint_data",
+        _route_after_fetch,
+        {"calculate_metrics": "calculate_metrics", "generate_report": "generate_report"},
+    )
     graph.add_edge("calculate_metrics", "track_bayes")
     graph.add_edge("track_bayes", "generate_recommendations")
     graph.add_edge("generate_recommendations", "generate_report")
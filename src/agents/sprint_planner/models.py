@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
 from enum import Enum
+from functools import cached_property, lru_cache
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 
 class DeliverableStatus(str, Enum):
@@ -27,9 +29,29 @@ class VendorType(str, Enum):
     OTHER = "other"
 
 
+@lru_cache(maxsize=1)
+def _utcnow_for_tick(tick: int) -> datetime:
+    return datetime.utcnow()
+
+
+def _coarse_utcnow() -> datetime:
+    """Current (naive) UTC time, refreshed at most once per monotonic second.
+
+    Overdue checks only need day-level precision, so bulk scans can share a
+    single datetime instead of building a new one per item.
+    """
+    return _utcnow_for_tick(int(time.monotonic()))
+
+
+# Indexed by the number of health checks a sprint passes (see SprintMetrics.health_status)
+_HEALTH_STATUSES = ("critical", "at_risk", "healthy")
+
+
 class SprintMetrics(BaseModel):
     """Sprint velocity and health metrics."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=False)
+
     sprint_id: str
     sprint_name: str
     start_date: datetime
@@ -43,27 +65,31 @@ class SprintMetrics(BaseModel):
     overdue_items: int = 0
     total_issues: int = 0
 
-    @property
+    @cached_property
     def completion_rate(self) -> float:
         """Calculate completion percentage."""
         if self.total_story_points == 0:
             return 0.0
         return (self.completed_story_points / self.total_story_points) * 100
 
-    @property
+    @cached_property
     def health_status(self) -> str:
-        """Determine sprint health status."""
-        if self.completion_rate >= 70 and self.blocked_items == 0:
-            return "healthy"
-        elif self.completion_rate >= 50 or self.blocked_items <= 2:
-            return "at_risk"
-        else:
-            return "critical"
+        """Determine sprint health status.
+
+        The "healthy" condition implies the "at_risk" one, so summing the two
+        checks indexes straight into the status table.
+        """
+        rate = self.completion_rate
+        healthy = rate >= 70 and self.blocked_items == 0
+        not_critical = rate >= 50 or self.blocked_items <= 2
+        return _HEALTH_STATUSES[healthy + not_critical]
 
 
 class Deliverable(BaseModel):
     """A vendor deliverable with tracking information."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=False)
+
     deliverable_id: str
     title: str
     vendor: VendorType = VendorType.INTERNAL
@@ -84,19 +110,39 @@ class Deliverable(BaseModel):
     @property
     def is_overdue(self) -> bool:
         """Check if deliverable is overdue."""
-        if self.due_date and self.status not in [DeliverableStatus.DONE]:
-            return datetime.utcnow() > self.due_date
+        return self.is_overdue_at(_coarse_utcnow())
+
+    def is_overdue_at(self, now: datetime) -> bool:
+        """Check if deliverable is overdue at ``now``.
+
+        Bulk scans should capture ``now`` once and call this per item.
+        """
+        # Validated fields always hold enum members, so identity checks suffice
+        if self.due_date and self.status is not DeliverableStatus.DONE:
+            return now > self.due_date
         return False
 
+    # Computed once at validation time; the model is frozen so it cannot go stale.
+    _is_bayes: bool = PrivateAttr(default=False)
+
+    @model_validator(mode="after")
+    def _compute_is_bayes(self) -> Deliverable:
+        self._is_bayes = self.vendor is VendorType.BAYES_CONSULTING or any(
+            "bayes" in label.lower() for label in self.labels
+        )
+        return self
+
     @property
     def is_bayes(self) -> bool:
         """Check if this is a Bayes Consulting deliverable."""
-        return self.vendor == VendorType.BAYES_CONSULTING or "bayes" in " ".join(self.labels).lower()
+        return self._is_bayes
 
 
 class SprintReport(BaseModel):
     """Generated sprint report."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", defer_build=False)
+
     report_id: str
     sprint_id: str
     sprint_name: str
@@ -129,6 +175,8 @@ class SprintReport(BaseModel):
 class BayesSOWSummary(BaseModel):
     """Summary of Bayes Consulting SOW tracking."""
 
+    model_config = ConfigDict(defer_build=False)
+
     total_budget: float = 527807.0  # From SOW
     total_deliverables: int = 0
     completed_deliverables: int = 0
@@ -165,6 +213,8 @@ class SprintQueryType(str, Enum):
 class SprintPlannerInput(BaseModel):
     """Input for Sprint Planner agent."""
 
+    model_config = ConfigDict(defer_build=False)
+
     query_type: SprintQueryType
     repository: str | None = None
     sprint_id: str | None = None
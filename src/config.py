@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from functools import cached_property, lru_cache
+from typing import Any
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -144,33 +147,56 @@ class Settings(BaseSettings):
         description="Requests per minute per IP for rate limiting",
     )
 
+    # ── Production: Health Checks ──
+    health_cache_ttl_s: float = Field(
+        default=10.0,
+        description="Seconds to reuse deep health check results (0 disables caching)",
+    )
+
     # ── Production: Retry Configuration ──
     retry_max_attempts: int = Field(default=3, description="Maximum retry attempts for transient failures")
     retry_base_delay: float = Field(default=1.0, description="Base delay for exponential backoff (seconds)")
 
-    @property
-    def monitored_repos(self) -> list[str]:
-        """Parse comma-separated repo list into a list of 'owner/repo' strings."""
+    # Derived values are computed on first access and cached on the instance;
+    # settings are never mutated after load.
+
+    @cached_property
+    def monitored_repos(self) -> tuple[str, ...]:
+        """Parse comma-separated repo list into a tuple of 'owner/repo' strings."""
         if not self.github_repos:
-            return []
-        return [r.strip() for r in self.github_repos.split(",") if r.strip()]
+            return ()
+        return tuple(r.strip() for r in self.github_repos.split(",") if r.strip())
 
-    @property
+    @cached_property
     def has_azure_openai(self) -> bool:
         return bool(self.azure_openai_api_key and self.azure_openai_endpoint)
 
-    @property
+    @cached_property
     def has_anthropic(self) -> bool:
         return bool(self.anthropic_api_key)
 
-    @property
+    @cached_property
     def has_zai(self) -> bool:
         return bool(self.zai_api_key)
 
-    @property
+    @cached_property
     def has_projects_v2(self) -> bool:
         return bool(self.github_org and self.github_project_number > 0)
 
 
-# Singleton instance — import this everywhere
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance.
+
+    The .env file is parsed and validated once per process; call
+    ``get_settings.cache_clear()`` to force a reload (e.g. in tests).
+    """
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    # Singleton instance — `from src.config import settings` everywhere.
+    # Resolved lazily so the .env parse happens on first use, not on import.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,36 +5,110 @@ Provides comprehensive health checks for all external dependencies.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 
 import httpx
-from github import GithubException
+from sqlalchemy import text
 
 from src.config import settings
-from src.integrations.github_client import GitHubClient
+from src.memory.postgres_store import PostgresStore
+from src.memory.qdrant_store import QdrantStore
+from src.memory.redis_store import RedisStore
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
+_GITHUB_PROBE_TTL_S = 30.0
+_EXTERNAL_CHECKS_BUDGET_S = 6.0
+
+
+# ── Result Caching ──
+
+# key -> (monotonic timestamp, result)
+_cache: dict[str, tuple[float, Any]] = {}
+# key -> probe currently running for that key
+_inflight: dict[str, asyncio.Future[Any]] = {}
+
+
+async def _cached(key: str, ttl: float, fn: Callable[[], Awaitable[T]]) -> T:
+    """Return the cached result for ``key`` if it is younger than ``ttl`` seconds.
+
+    On a miss, callers arriving while a probe for ``key`` is already running
+    attach to that probe instead of starting their own. This coalescing
+    applies even when ``ttl <= 0`` disables the cache itself.
+    """
+    if ttl > 0:
+        entry = _cache.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+    inflight = _inflight.get(key)
+    if inflight is None:
+        inflight = _inflight[key] = asyncio.ensure_future(_run_probe(key, ttl, fn))
+    # Shielded so one cancelled caller doesn't cancel the probe for the others
+    return await asyncio.shield(inflight)
+
+
+async def _run_probe(key: str, ttl: float, fn: Callable[[], Awaitable[T]]) -> T:
+    try:
+        result = await fn()
+        if ttl > 0:
+            _cache[key] = (time.monotonic(), result)
+        return result
+    finally:
+        _inflight.pop(key, None)
+
+
+def _short_err(e: BaseException) -> str:
+    """Compact error text: exception type plus at most 80 chars of its first arg."""
+    detail = str(e.args[0])[:80] if e.args else ""
+    return f"{type(e).__name__}: {detail}" if detail else type(e).__name__
+
+
+# ── Shared HTTP Client ──
+
+_http: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP client shared by all health probes (lazy)."""
+    global _http
+    if _http is None or _http.is_closed:
+        _http = httpx.AsyncClient(
+            timeout=httpx.Timeout(5.0, connect=2.0),
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+            http2=True,
+        )
+    return _http
+
+
+async def close_http_client() -> None:
+    """Close the shared health check HTTP client."""
+    global _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+
+
+@dataclass(slots=True)
 class HealthCheckResult:
     """Result of a health check."""
 
-    def __init__(
-        self,
-        service: str,
-        healthy: bool,
-        latency_ms: float | None = None,
-        message: str = "",
-        details: dict[str, Any] | None = None,
-    ):
-        self.service = service
-        self.healthy = healthy
-        self.latency_ms = latency_ms
-        self.message = message
-        self.details = details or {}
+    service: str
+    healthy: bool
+    latency_ms: float | None = None
+    message: str = ""
+    details: dict[str, Any] | None = None
+
+    def __post_init__(self) -> None:
+        self.details = self.details or {}
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -46,142 +120,124 @@ class HealthCheckResult:
         }
 
 
-async def check_llm_api() -> HealthCheckResult:
-    """Check if LLM API is accessible and responding.
+async def _probe_models_endpoint(
+    client: httpx.AsyncClient,
+    service: str,
+    url: str,
+    headers: dict[str, str],
+) -> HealthCheckResult:
+    """Probe a provider's ``GET /models`` listing.
 
-    Tries Anthropic, then Azure OpenAI, then z.ai.
+    Listing models is cheap and idempotent, so liveness polls don't spend
+    tokens or hit the inference path. Any 2xx is healthy.
     """
-    start = time.time()
-
-    # Try Anthropic (Claude)
-    if settings.has_anthropic:
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.post(
-                    "https://api.anthropic.com/v1/messages",
-                    headers={
-                        "x-api-key": settings.anthropic_api_key,
-                        "anthropic-version": "2023-06-01",
-                    },
-                    json={
-                        "model": "claude-3-haiku-20240307",
-                        "max_tokens": 1,
-                        "messages": [{"role": "user", "content": "Hi"}],
-                    },
-                )
-                latency_ms = (time.time() - start) * 1000
-
-                if response.status_code == 200:
-                    return HealthCheckResult(
-                        service="anthropic",
-                        healthy=True,
-                        latency_ms=latency_ms,
-                        message="API responding",
-                    )
-                elif response.status_code == 401:
-                    return HealthCheckResult(
-                        service="anthropic",
-                        healthy=False,
-                        latency_ms=latency_ms,
-                        message="Authentication failed",
-                    )
-                else:
-                    return HealthCheckResult(
-                        service="anthropic",
-                        healthy=False,
-                        latency_ms=latency_ms,
-                        message=f"HTTP {response.status_code}",
-                    )
-        except Exception as e:
-            return HealthCheckResult(
-                service="anthropic",
-                healthy=False,
-                latency_ms=None,
-                message=f"Connection failed: {str(e)[:100]}",
-            )
-
-    # Try Azure OpenAI
-    if settings.has_azure_openai:
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.post(
-                    f"{settings.azure_openai_endpoint}/openai/deployments/{settings.azure_openai_deployment}/chat/completions?api-version={settings.azure_openai_api_version}",
-                    headers={
-                        "api-key": settings.azure_openai_api_key,
-                    },
-                    json={
-                        "messages": [{"role": "user", "content": "Hi"}],
-                        "max_tokens": 1,
-                    },
-                )
-                latency_ms = (time.time() - start) * 1000
-
-                if response.status_code == 200:
-                    return HealthCheckResult(
-                        service="azure_openai",
-                        healthy=True,
-                        latency_ms=latency_ms,
-                        message="API responding",
-                    )
-                else:
-                    return HealthCheckResult(
-                        service="azure_openai",
-                        healthy=False,
-                        latency_ms=latency_ms,
-                        message=f"HTTP {response.status_code}",
-                    )
-        except Exception as e:
-            return HealthCheckResult(
-                service="azure_openai",
-                healthy=False,
-                latency_ms=None,
-                message=f"Connection failed: {str(e)[:100]}",
-            )
-
-    # Try z.ai
-    if settings.has_zai:
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.post(
-                    f"{settings.zai_base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {settings.zai_api_key}",
-                    },
-                    json={
-                        "model": settings.zai_model,
-                        "messages": [{"role": "user", "content": "Hi"}],
-                        "max_tokens": 1,
-                    },
-                )
-                latency_ms = (time.time() - start) * 1000
-
-                if response.status_code == 200:
-                    return HealthCheckResult(
-                        service="zai",
-                        healthy=True,
-                        latency_ms=latency_ms,
-                        message="API responding",
-                    )
-        except Exception as e:
-            return HealthCheckResult(
-                service="zai",
-                healthy=False,
-                latency_ms=None,
-                message=f"Connection failed: {str(e)[:100]}",
-            )
-
-    # No LLM configured
+    start = time.perf_counter()
+    try:
+        response = await client.get(url, headers=headers)
+    except Exception as e:
+        return HealthCheckResult(
+            service=service,
+            healthy=False,
+            latency_ms=None,
+            message=f"Connection failed: {_short_err(e)}",
+        )
+
+    latency_ms = (time.perf_counter() - start) * 1000
+    if response.is_success:
+        message = "API responding"
+    elif response.status_code == 401:
+        message = "Authentication failed"
+    else:
+        message = f"HTTP {response.status_code}"
     return HealthCheckResult(
-        service="llm",
-        healthy=False,
-        message="No LLM API configured",
+        service=service,
+        healthy=response.is_success,
+        latency_ms=latency_ms,
+        message=message,
+    )
+
+
+async def _check_anthropic(client: httpx.AsyncClient) -> HealthCheckResult:
+    """Probe the Anthropic (Claude) API."""
+    return await _probe_models_endpoint(
+        client,
+        "anthropic",
+        "https://api.anthropic.com/v1/models",
+        {
+            "x-api-key": settings.anthropic_api_key,
+            "anthropic-version": "2023-06-01",
+        },
     )
 
 
+async def _check_azure_openai(client: httpx.AsyncClient) -> HealthCheckResult:
+    """Probe the Azure OpenAI resource."""
+    return await _probe_models_endpoint(
+        client,
+        "azure_openai",
+        f"{settings.azure_openai_endpoint}/openai/models?api-version={settings.azure_openai_api_version}",
+        {"api-key": settings.azure_openai_api_key},
+    )
+
+
+async def _check_zai(client: httpx.AsyncClient) -> HealthCheckResult:
+    """Probe the z.ai API."""
+    return await _probe_models_endpoint(
+        client,
+        "zai",
+        f"{settings.zai_base_url}/models",
+        {"Authorization": f"Bearer {settings.zai_api_key}"},
+    )
+
+
+async def check_llm_api() -> HealthCheckResult:
+    """Check if any configured LLM API is accessible and responding.
+
+    Anthropic, Azure OpenAI and z.ai are probed concurrently. The first
+    healthy provider wins and the remaining probes are cancelled; if none
+    is healthy, the failure of the highest-priority provider is returned.
+    """
+    probes = [
+        probe
+        for configured, probe in (
+            (settings.has_anthropic, _check_anthropic),
+            (settings.has_azure_openai, _check_azure_openai),
+            (settings.has_zai, _check_zai),
+        )
+        if configured
+    ]
+
+    if not probes:
+        return HealthCheckResult(
+            service="llm",
+            healthy=False,
+            message="No LLM API configured",
+        )
+
+    client = _get_http_client()
+    tasks = [asyncio.create_task(probe(client)) for probe in probes]
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                if result.healthy:
+                    return result
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    return tasks[0].result()
+
+
 async def check_github_api() -> HealthCheckResult:
-    """Check if GitHub API is accessible."""
-    start = time.time()
+    """Check if GitHub API is accessible.
 
+    Uses ``GET /rate_limit``, which doesn't count against the rate limit,
+    and caches the result for ``_GITHUB_PROBE_TTL_S`` seconds.
+    """
     if not settings.github_token:
         return HealthCheckResult(
             service="github",
@@ -189,39 +245,51 @@ async def check_github_api() -> HealthCheckResult:
             message="No GitHub token configured",
         )
 
-    try:
-        client = GitHubClient()
-        user = client.github.get_user()
-        latency_ms = (time.time() - start) * 1000
+    return await _cached("github", _GITHUB_PROBE_TTL_S, _probe_github_rate_limit)
 
-        return HealthCheckResult(
-            service="github",
-            healthy=True,
-            latency_ms=latency_ms,
-            message=f"Authenticated as {user.login}",
-            details={"login": user.login},
+
+async def _probe_github_rate_limit() -> HealthCheckResult:
+    start = time.perf_counter()
+    try:
+        response = await _get_http_client().get(
+            "https://api.github.com/rate_limit",
+            headers={
+                "Authorization": f"Bearer {settings.github_token}",
+                "Accept": "application/vnd.github+json",
+            },
+            timeout=3.0,
         )
-    except GithubException as e:
-        latency_ms = (time.time() - start) * 1000
+    except Exception as e:
+        latency_ms = (time.perf_counter() - start) * 1000
         return HealthCheckResult(
             service="github",
             healthy=False,
             latency_ms=latency_ms,
-            message=f"GitHub API error: {str(e)[:100]}",
+            message=f"Connection failed: {_short_err(e)}",
         )
-    except Exception as e:
-        latency_ms = (time.time() - start) * 1000
+
+    latency_ms = (time.perf_counter() - start) * 1000
+    if response.status_code != 200:
         return HealthCheckResult(
             service="github",
             healthy=False,
             latency_ms=latency_ms,
-            message=f"Connection failed: {str(e)[:100]}",
+            message=f"GitHub API error: HTTP {response.status_code}",
         )
 
+    core = response.json().get("resources", {}).get("core", {})
+    return HealthCheckResult(
+        service="github",
+        healthy=True,
+        latency_ms=latency_ms,
+        message="API responding",
+        details={"rate_limit_remaining": core.get("remaining")},
+    )
+
 
 async def check_openclaw_gateway() -> HealthCheckResult:
     """Check if OpenClaw Gateway is reachable."""
-    start = time.time()
+    start = time.perf_counter()
 
     if not settings.openclaw_enabled:
         return HealthCheckResult(
@@ -231,11 +299,11 @@ async def check_openclaw_gateway() -> HealthCheckResult:
         )
 
     try:
-        from src.integrations.openclaw_client import OpenClawClient
+        from src.integrations.openclaw_client import get_openclaw_client
 
-        client = OpenClawClient()
-        ok = await client.health_check()
-        latency_ms = (time.time() - start) * 1000
+        # The shared client keeps its HTTP connection alive across probes
+        ok = await get_openclaw_client().health_check()
+        latency_ms = (time.perf_counter() - start) * 1000
 
         return HealthCheckResult(
             service="openclaw",
@@ -244,18 +312,18 @@ async def check_openclaw_gateway() -> HealthCheckResult:
             message="Connected" if ok else "Connection failed",
         )
     except Exception as e:
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter() - start) * 1000
         return HealthCheckResult(
             service="openclaw",
             healthy=False,
             latency_ms=latency_ms,
-            message=f"Health check failed: {str(e)[:100]}",
+            message=f"Health check failed: {_short_err(e)}",
         )
 
 
 async def check_knowledge_graph() -> HealthCheckResult:
     """Check if knowledge graph is accessible."""
-    start = time.time()
+    start = time.perf_counter()
 
     if not settings.knowledge_graph_enabled:
         return HealthCheckResult(
@@ -269,7 +337,7 @@ async def check_knowledge_graph() -> HealthCheckResult:
 
         store = KnowledgeGraphStore()
         ok = await store.health_check()
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter() - start) * 1000
 
         return HealthCheckResult(
             service="knowledge_graph",
@@ -278,91 +346,156 @@ async def check_knowledge_graph() -> HealthCheckResult:
             message="Graph accessible" if ok else "Graph not accessible",
         )
     except Exception as e:
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter() - start) * 1000
         return HealthCheckResult(
             service="knowledge_graph",
             healthy=False,
             latency_ms=latency_ms,
-            message=f"Health check failed: {str(e)[:100]}",
+            message=f"Health check failed: {_short_err(e)}",
         )
 
 
 async def check_all_external_services() -> dict[str, HealthCheckResult]:
-    """Run all external service health checks in parallel."""
-    results = {}
+    """Run all external service health checks in parallel.
 
-    # Run all checks in parallel
-    import asyncio
+    Results are cached for ``settings.health_cache_ttl_s`` seconds.
+    """
+    return await _cached("external", settings.health_cache_ttl_s, _check_all_external_services)
 
+
+async def _check_all_external_services() -> dict[str, HealthCheckResult]:
+    results: dict[str, HealthCheckResult] = {}
+
+    # Run all checks in parallel
     checks = {
         "llm": check_llm_api(),
         "github": check_github_api(),
         "openclaw": check_openclaw_gateway(),
         "knowledge_graph": check_knowledge_graph(),
     }
+    name_by_task = {asyncio.create_task(coro): name for name, coro in checks.items()}
+
+    # Collect results as they finish, within one overall budget
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + _EXTERNAL_CHECKS_BUDGET_S
+    pending = set(name_by_task)
+    while pending:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            name = name_by_task[task]
+            try:
+                results[name] = task.result()
+            except Exception as e:
+                results[name] = HealthCheckResult(
+                    service=name,
+                    healthy=False,
+                    message=f"Check failed: {_short_err(e)}",
+                )
 
-    # Execute in parallel
-    tasks = {name: asyncio.create_task(coro) for name, coro in checks.items()}
-
-    for name, task in tasks.items():
-        try:
-            results[name] = await task
-        except Exception as e:
-            results[name] = HealthCheckResult(
-                service=name,
-                healthy=False,
-                message=f"Check failed: {str(e)[:100]}",
-            )
+    for task in pending:
+        task.cancel()
+        name = name_by_task[task]
+        results[name] = HealthCheckResult(service=name, healthy=False, message="check timed out")
 
-    return results
+    # Preserve the declared order for stable output
+    return {name: results[name] for name in checks}
 
 
 async def get_deep_health_status() -> dict[str, Any]:
     """Get comprehensive health status including external services.
 
+    Results are cached for ``settings.health_cache_ttl_s`` seconds so that
+    concurrent or rapid polls share a single round of probes.
+
     Returns:
         Dict with overall status and detailed component health
     """
-    from src.memory.postgres_store import PostgresStore
-    from src.memory.qdrant_store import QdrantStore
-    from src.memory.redis_store import RedisStore
+    return await _cached("deep", settings.health_cache_ttl_s, _get_deep_health_status)
+
+
+# ── Store Probes ──
+
+_stores: tuple[RedisStore, PostgresStore, QdrantStore] | None = None
 
-    overall_status = "healthy"
-    components = {}
 
-    # Check internal stores
-    redis_store = RedisStore()
-    postgres_store = PostgresStore()
-    qdrant_store = QdrantStore()
+def register_stores(redis: RedisStore, postgres: PostgresStore, qdrant: QdrantStore) -> None:
+    """Probe the application's own store instances (and their pools)."""
+    global _stores
+    _stores = (redis, postgres, qdrant)
 
+
+def _get_stores() -> tuple[RedisStore, PostgresStore, QdrantStore]:
+    """Return the stores to probe, creating default ones once if none were registered."""
+    global _stores
+    if _stores is None:
+        _stores = (RedisStore(), PostgresStore(), QdrantStore())
+    return _stores
+
+
+async def _check_redis() -> tuple[str, dict[str, Any], bool]:
+    """Probe Redis. Returns (name, component status, degraded)."""
     try:
-        redis_ok = await asyncio.wait_for(redis_store.health_check(), timeout=2.0)
-        components["redis"] = {"status": "ok" if redis_ok else "down"}
-        if not redis_ok:
-            overall_status = "degraded"
+        ok = await asyncio.wait_for(_get_stores()[0].health_check(), timeout=2.0)
+        return "redis", {"status": "ok" if ok else "down"}, not ok
     except Exception as e:
-        components["redis"] = {"status": "error", "message": str(e)[:100]}
-        overall_status = "degraded"
+        return "redis", {"status": "error", "message": _short_err(e)}, True
+
+
+async def _check_postgres() -> tuple[str, dict[str, Any], bool]:
+    """Probe PostgreSQL with ``SELECT 1``. Returns (name, component status, degraded)."""
+
+    async def _ping() -> None:
+        async with _get_stores()[1]._engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
 
     try:
-        async with postgres_store._engine.connect() as conn:
-            await conn.execute(__import__("sqlalchemy").text("SELECT 1"))
-        components["postgres"] = {"status": "ok"}
+        await asyncio.wait_for(_ping(), timeout=2.0)
+        return "postgres", {"status": "ok"}, False
     except Exception as e:
-        components["postgres"] = {"status": "error", "message": str(e)[:100]}
-        overall_status = "degraded"
+        return "postgres", {"status": "error", "message": _short_err(e)}, True
+
 
+async def _check_qdrant() -> tuple[str, dict[str, Any], bool]:
+    """Probe Qdrant. Returns (name, component status, degraded)."""
     try:
-        qdrant_ok = await asyncio.wait_for(qdrant_store.health_check(), timeout=2.0)
-        components["qdrant"] = {"status": "ok" if qdrant_ok else "down"}
-        if not qdrant_ok:
-            overall_status = "degraded"
+        ok = await asyncio.wait_for(_get_stores()[2].health_check(), timeout=2.0)
+        return "qdrant", {"status": "ok" if ok else "down"}, not ok
     except Exception as e:
-        components["qdrant"] = {"status": "error", "message": str(e)[:100]}
-        overall_status = "degraded"
+        return "qdrant", {"status": "error", "message": _short_err(e)}, True
+
+
+_INTERNAL_CHECKS = ("redis", "postgres", "qdrant")
+
+
+async def _get_deep_health_status() -> dict[str, Any]:
+    overall_status = "healthy"
+    components: dict[str, Any] = {}
+
+    # Internal stores and external services are independent; probe them all at once
+    *internal, external = await asyncio.gather(
+        _check_redis(),
+        _check_postgres(),
+        _check_qdrant(),
+        check_all_external_services(),
+        return_exceptions=True,
+    )
+
+    for name, result in zip(_INTERNAL_CHECKS, internal):
+        if isinstance(result, BaseException):
+            components[name] = {"status": "error", "message": _short_err(result)}
+            overall_status = "degraded"
+            continue
+        _, status, degraded = result
+        components[name] = status
+        if degraded:
+            overall_status = "degraded"
 
-    # Check external services
-    external = await check_all_external_services()
+    if isinstance(external, BaseException):
+        logger.error("External health checks failed: %s", external)
+        external = {}
 
     for name, result in external.items():
         components[name] = result.to_dict()
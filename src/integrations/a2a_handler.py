@@ -15,43 +15,96 @@ Reference: https://agents.google.com/agent-to-agent
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import hmac
 import json
 import logging
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any
 
 import httpx
+import orjson
 
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Inbound directives larger than this are rejected before parsing
+MAX_DIRECTIVE_BYTES = 64 * 1024
+
+# Agent-card discovery: parallel fetch cap and per-card timeout (seconds)
+DISCOVERY_CONCURRENCY = 16
+DISCOVERY_TIMEOUT = 3.0
+
+_REQUIRED_DIRECTIVE_FIELDS = frozenset({"directive_id", "type", "sender", "recipient"})
+
+
+def _utcnow() -> datetime:
+    """Naive UTC now, matching the previous ``datetime.utcnow()`` output."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _memo_isoformat(obj: A2ADirective | A2AResponse) -> str:
+    """Return ``obj.timestamp.isoformat()``, formatting each timestamp only once."""
+    cached = obj._ts_iso
+    if cached is None or cached[0] is not obj.timestamp:
+        cached = obj._ts_iso = (obj.timestamp, obj.timestamp.isoformat())
+    return cached[1]
+
+
+# ── Directive Signing ──
+
+# v2 signatures HMAC a field-ordered byte stream instead of sorted JSON.
+# The prefix keeps the sha256= scheme so v1-only peers reject rather than misparse.
+SIGNATURE_V2_PREFIX = "sha256=v2:"
+
+_SIGNED_FIELDS = ("directive_id", "type", "sender", "recipient", "timestamp", "priority", "requires_response")
+
+# Non-str dict keys are stringified, as json.dumps did
+_PAYLOAD_OPTS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _canonical_v2(data: dict[str, Any]) -> list[bytes]:
+    """Length-prefixed signing chunks for a directive dict.
+
+    Scalar fields are fed in a fixed order as their JSON encoding, so
+    ``True``, ``"True"`` and ``None`` stay distinct; a missing field is an
+    empty chunk. The payload is reduced to the SHA-256 of its sorted-key
+    orjson form. Length prefixes keep field boundaries unambiguous even if
+    values contain separator bytes.
+
+    Raises ``TypeError`` for values orjson can't encode (e.g. ints wider
+    than 64 bits).
+    """
+    parts = [orjson.dumps(data[name]) if name in data else b"" for name in _SIGNED_FIELDS]
+    parts.append(hashlib.sha256(orjson.dumps(data.get("payload"), option=_PAYLOAD_OPTS)).digest())
+    chunks = []
+    for part in parts:
+        chunks.append(len(part).to_bytes(4, "big"))
+        chunks.append(part)
+    return chunks
+
 
 # ── Agent Card Model ──
 
 
+@dataclass(slots=True)
 class AgentCard:
     """Agent card for A2A protocol discovery."""
 
-    def __init__(
-        self,
-        name: str,
-        version: str,
-        description: str,
-        capabilities: list[str],
-        contact: dict[str, str],
-        protocols: list[str] | None = None,
-        authentication: str = "bearer_token",
-    ):
-        self.name = name
-        self.version = version
-        self.description = description
-        self.capabilities = capabilities
-        self.contact = contact
-        self.protocols = protocols or ["a2a", "rest"]
-        self.authentication = authentication
+    name: str
+    version: str
+    description: str
+    capabilities: list[str]
+    contact: dict[str, str]
+    protocols: list[str] | None = None
+    authentication: str = "bearer_token"
+
+    def __post_init__(self) -> None:
+        self.protocols = self.protocols or ["a2a", "rest"]
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -69,30 +122,23 @@ class AgentCard:
 # ── A2A Directive Model ──
 
 
+@dataclass(slots=True)
 class A2ADirective:
     """Directive message in A2A protocol format."""
 
-    def __init__(
-        self,
-        directive_id: str,
-        type: str,
-        payload: dict[str, Any],
-        sender: str,
-        recipient: str,
-        timestamp: datetime | None = None,
-        priority: str = "normal",
-        requires_response: bool = True,
-        signature: str | None = None,
-    ):
-        self.directive_id = directive_id
-        self.type = type
-        self.payload = payload
-        self.sender = sender
-        self.recipient = recipient
-        self.timestamp = timestamp or datetime.utcnow()
-        self.priority = priority
-        self.requires_response = requires_response
-        self.signature = signature
+    directive_id: str
+    type: str
+    payload: dict[str, Any]
+    sender: str
+    recipient: str
+    timestamp: datetime | None = None
+    priority: str = "normal"
+    requires_response: bool = True
+    signature: str | None = None
+    _ts_iso: tuple[datetime, str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.timestamp = self.timestamp or _utcnow()
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -101,7 +147,7 @@ class A2ADirective:
             "payload": self.payload,
             "sender": self.sender,
             "recipient": self.recipient,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _memo_isoformat(self),
             "priority": self.priority,
             "requires_response": self.requires_response,
             "signature": self.signature,
@@ -130,24 +176,21 @@ class A2ADirective:
         )
 
 
+@dataclass(slots=True)
 class A2AResponse:
     """Response message in A2A protocol format."""
 
-    def __init__(
-        self,
-        response_to: str,
-        status: str,
-        result: dict[str, Any] | None = None,
-        error: str | None = None,
-        timestamp: datetime | None = None,
-        sender: str = "digital_cto",
-    ):
-        self.response_to = response_to
-        self.status = status  # completed, failed, in_progress, needs_approval
-        self.result = result or {}
-        self.error = error
-        self.timestamp = timestamp or datetime.utcnow()
-        self.sender = sender
+    response_to: str
+    status: str  # completed, failed, in_progress, needs_approval
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    timestamp: datetime | None = None
+    sender: str = "digital_cto"
+    _ts_iso: tuple[datetime, str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.result = self.result or {}
+        self.timestamp = self.timestamp or _utcnow()
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -155,7 +198,7 @@ class A2AResponse:
             "status": self.status,
             "result": self.result,
             "error": self.error,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _memo_isoformat(self),
             "sender": self.sender,
         }
 
@@ -177,6 +220,9 @@ A2A_TYPE_MAP: dict[str, str] = {
     "health_check": "health_check",
 }
 
+# Bound once so inbound dispatch skips the attribute lookup; sees in-place updates
+_MAP_GET = A2A_TYPE_MAP.get
+
 
 class A2AProtocolHandler:
     """Google Agent-to-Agent protocol handler.
@@ -185,56 +231,102 @@ class A2AProtocolHandler:
     communication with other A2A-compatible agents.
     """
 
-    def __init__(self, shared_secret: str | None = None):
+    def __init__(
+        self,
+        shared_secret: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         """Initialize the A2A handler.
 
         Args:
             shared_secret: Shared secret for signing messages
+            http_client: Optional pooled client to reuse; the handler owns
+                (and closes) a client only when none is injected
         """
         self.shared_secret = shared_secret
+        # Key schedule done once; each signature copies this keyed template
+        self._hmac_template = (
+            hmac.new(shared_secret.encode(), b"", hashlib.sha256) if shared_secret else None
+        )
         self.agent_cards: dict[str, dict[str, Any]] = {}
-        self.http_client = httpx.AsyncClient(timeout=30.0)
-
-    def map_directive_type(self, a2a_type: str) -> str:
+        self._agent_card_etags: dict[str, str] = {}
+        # Resolved JARVIS endpoint, valid while _jarvis_resolved_gen == _discovery_gen
+        self._discovery_gen = 0
+        self._jarvis_endpoint: str | None = None
+        self._jarvis_resolved_gen = -1
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(timeout=30.0)
+
+    @staticmethod
+    def map_directive_type(a2a_type: str) -> str:
         """Map an A2A directive type to an internal supervisor event type.
 
         Falls back to the original type if no mapping exists.
         """
-        return A2A_TYPE_MAP.get(a2a_type, a2a_type)
+        return _MAP_GET(a2a_type, a2a_type)
 
     async def discover_agents(self, endpoints: list[str]) -> dict[str, AgentCard]:
         """Discover agents via their agent cards.
 
+        Agent cards are fetched concurrently (at most
+        ``DISCOVERY_CONCURRENCY`` at a time). Cards that were served with an
+        ETag are re-requested with ``If-None-Match``; a 304 reuses the
+        cached card.
+
         Args:
             endpoints: List of agent base URLs
 
         Returns:
             Dictionary mapping endpoint to AgentCard
         """
-        discovered = {}
-
-        for endpoint in endpoints:
-            try:
-                agent_card_url = f"{endpoint}/.well-known/agent.json"
-                response = await self.http_client.get(agent_card_url)
-
-                if response.status_code == 200:
-                    card_data = response.json()
-                    self.agent_cards[endpoint] = card_data
-                    discovered[endpoint] = AgentCard(
-                        name=card_data.get("name", "Unknown"),
-                        version=card_data.get("version", "0.0.0"),
-                        description=card_data.get("description", ""),
-                        capabilities=card_data.get("capabilities", []),
-                        contact=card_data.get("contact", {}),
-                        protocols=card_data.get("protocols", []),
-                        authentication=card_data.get("authentication", "bearer_token"),
+        sem = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+        async def _fetch(endpoint: str) -> dict[str, Any] | None:
+            async with sem:
+                try:
+                    headers = {}
+                    if etag := self._agent_card_etags.get(endpoint):
+                        headers["If-None-Match"] = etag
+                    response = await self.http_client.get(
+                        f"{endpoint}/.well-known/agent.json",
+                        headers=headers,
+                        timeout=DISCOVERY_TIMEOUT,
                     )
-                    logger.info("Discovered agent: %s at %s", card_data.get("name"), endpoint)
 
-            except Exception as e:
-                logger.warning("Failed to discover agent at %s: %s", endpoint, e)
+                    if response.status_code == 304 and endpoint in self.agent_cards:
+                        return self.agent_cards[endpoint]
+                    if response.status_code == 200:
+                        card_data = response.json()
+                        etag = response.headers.get("ETag")
+                        if isinstance(etag, str):
+                            self._agent_card_etags[endpoint] = etag
+                        else:
+                            self._agent_card_etags.pop(endpoint, None)
+                        return card_data
+
+                except Exception as e:
+                    logger.warning("Failed to discover agent at %s: %s", endpoint, e)
+                return None
 
+        results = await asyncio.gather(*(_fetch(endpoint) for endpoint in endpoints))
+
+        discovered = {}
+        for endpoint, card_data in zip(endpoints, results):
+            if card_data is None:
+                continue
+            self.agent_cards[endpoint] = card_data
+            discovered[endpoint] = AgentCard(
+                name=card_data.get("name", "Unknown"),
+                version=card_data.get("version", "0.0.0"),
+                description=card_data.get("description", ""),
+                capabilities=card_data.get("capabilities", []),
+                contact=card_data.get("contact", {}),
+                protocols=card_data.get("protocols", []),
+                authentication=card_data.get("authentication", "bearer_token"),
+            )
+            logger.info("Discovered agent: %s at %s", card_data.get("name"), endpoint)
+
+        self._discovery_gen += 1
         return discovered
 
     async def receive_directive(self, directive_data: dict[str, Any]) -> A2ADirective:
@@ -249,11 +341,10 @@ class A2AProtocolHandler:
         Raises:
             ValueError: If directive is invalid
         """
-        # Validate required fields
-        required_fields = ["directive_id", "type", "sender", "recipient"]
-        for field in required_fields:
-            if field not in directive_data:
-                raise ValueError(f"Missing required field: {field}")
+        # Validate required fields before any signature work
+        missing = _REQUIRED_DIRECTIVE_FIELDS - directive_data.keys()
+        if missing:
+            raise ValueError(f"Missing required field: {', '.join(sorted(missing))}")
 
         # Verify signature if shared secret is configured
         if self.shared_secret and directive_data.get("signature"):
@@ -287,19 +378,19 @@ class A2AProtocolHandler:
         Returns:
             A2AResponse if successful, None otherwise
         """
-        # Sign the directive
-        if self.shared_secret:
-            directive.signature = self._sign_directive(directive)
-
         # Prepare request
         headers = {"Content-Type": "application/json"}
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
 
         try:
+            # Sign the directive
+            if self.shared_secret:
+                directive.signature = self._sign_directive(directive)
+
             response = await self.http_client.post(
                 f"{recipient_endpoint}/webhook/a2a",
-                json=directive.to_dict(),
+                content=orjson.dumps(directive.to_dict(), option=orjson.OPT_NON_STR_KEYS),
                 headers=headers,
             )
 
@@ -338,6 +429,19 @@ class A2AProtocolHandler:
         Returns:
             A2AResponse if successful, None otherwise
         """
+        jarvis_endpoint = self._resolve_jarvis_endpoint()
+        if not jarvis_endpoint:
+            logger.warning("No JARVIS endpoint found for A2A directive")
+            return None
+
+        logger.info("Sending A2A directive to JARVIS at %s", jarvis_endpoint)
+        return await self.send_directive(jarvis_endpoint, directive)
+
+    def _resolve_jarvis_endpoint(self) -> str | None:
+        """Find the JARVIS endpoint, reusing the last hit until the next discovery."""
+        if self._jarvis_endpoint and self._jarvis_resolved_gen == self._discovery_gen:
+            return self._jarvis_endpoint
+
         jarvis_endpoint = None
 
         # Search discovered agent cards for JARVIS
@@ -354,57 +458,59 @@ class A2AProtocolHandler:
                     jarvis_endpoint = endpoint
                     break
 
-        if not jarvis_endpoint:
-            logger.warning("No JARVIS endpoint found for A2A directive")
-            return None
+        self._jarvis_endpoint = jarvis_endpoint
+        self._jarvis_resolved_gen = self._discovery_gen
+        return jarvis_endpoint
 
-        logger.info("Sending A2A directive to JARVIS at %s", jarvis_endpoint)
-        return await self.send_directive(jarvis_endpoint, directive)
+    def _signature_digest(self, *chunks: bytes) -> str:
+        """HMAC-SHA256 hex digest over ``chunks`` using the prebuilt key."""
+        h = self._hmac_template.copy()
+        for chunk in chunks:
+            h.update(chunk)
+        return h.hexdigest()
 
     def _sign_directive(self, directive: A2ADirective) -> str:
-        """Sign a directive with HMAC."""
+        """Sign a directive with HMAC (v2 canonical form)."""
         if not self.shared_secret:
             return ""
 
-        # Create payload for signing - match to_dict() format
-        payload_str = json.dumps(directive.to_dict(), sort_keys=True)
-
-        # Remove signature field from payload for signing
-        payload_obj = json.loads(payload_str)
-        payload_obj.pop("signature", None)
-        payload_str = json.dumps(payload_obj, sort_keys=True)
-
-        signature = hmac.new(
-            self.shared_secret.encode(),
-            payload_str.encode(),
-            hashlib.sha256,
-        ).hexdigest()
-
-        return f"sha256={signature}"
+        return f"{SIGNATURE_V2_PREFIX}{self._signature_digest(*_canonical_v2(directive.to_dict()))}"
 
     def _verify_signature(self, directive_data: dict[str, Any]) -> bool:
-        """Verify a directive's signature."""
+        """Verify a directive's signature.
+
+        v2 signatures use the field-ordered canonical form. Plain
+        ``sha256=`` signatures are checked against the orjson and legacy
+        ``json.dumps(sort_keys=True)`` forms used by older peers.
+        """
         signature = directive_data.get("signature", "")
+        if signature.startswith(SIGNATURE_V2_PREFIX):
+            expected_sig = signature[len(SIGNATURE_V2_PREFIX):]
+            try:
+                chunks = _canonical_v2(directive_data)
+            except TypeError:
+                return False
+            return hmac.compare_digest(self._signature_digest(*chunks), expected_sig)
+
         if not signature.startswith("sha256="):
             return False
 
         expected_sig = signature.split("=", 1)[1]
+        payload = {k: v for k, v in directive_data.items() if k != "signature"}
+        try:
+            body = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            body = None
+        if body is not None and hmac.compare_digest(self._signature_digest(body), expected_sig):
+            return True
 
-        # Recreate payload - match to_dict() format
-        payload_data = {k: v for k, v in directive_data.items() if k != "signature"}
-        payload_str = json.dumps(payload_data, sort_keys=True)
-
-        computed_sig = hmac.new(
-            self.shared_secret.encode(),
-            payload_str.encode(),
-            hashlib.sha256,
-        ).hexdigest()
-
-        return hmac.compare_digest(computed_sig, expected_sig)
+        legacy_body = json.dumps(payload, sort_keys=True).encode()
+        return hmac.compare_digest(self._signature_digest(legacy_body), expected_sig)
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.http_client.aclose()
+        """Close the HTTP client if this handler owns it."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
 
 
 # ── Digital CTO Agent Card ──
@@ -444,3 +550,13 @@ def get_digital_cto_agent_card(base_url: str = "https://cto.afcen.org") -> Agent
         protocols=["a2a", "rest", "websocket"],
         authentication="bearer_token",
     )
+
+
+@functools.lru_cache(maxsize=8)
+def get_digital_cto_agent_card_json(base_url: str = "https://cto.afcen.org") -> bytes:
+    """Serialized Digital CTO agent card, built once per ``base_url``.
+
+    The card is static for the life of the process, so discovery hits can
+    return these bytes directly instead of rebuilding and re-encoding it.
+    """
+    return orjson.dumps(get_digital_cto_agent_card(base_url).to_dict())
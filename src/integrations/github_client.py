@@ -2,20 +2,83 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
 import hashlib
 import hmac
+import inspect
 import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
 from typing import Any
+from urllib.parse import quote
 
 import httpx
 from github import Auth, Github, GithubException
 from github.PullRequest import PullRequest
+from github.Repository import Repository
 
 from src.config import settings
-from src.models.schemas import PRWebhookEvent, PullRequestData, PRUser, PRHead, PRBase
+from src.integrations.github_graphql import next_link
+from src.models.schemas import PRWebhookEvent
 
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+
+# Newer PyGithub releases accept lazy= on get_pull/get_issue; older ones always GET
+_PULL_ACCEPTS_LAZY = "lazy" in inspect.signature(Repository.get_pull).parameters
+_ISSUE_ACCEPTS_LAZY = "lazy" in inspect.signature(Repository.get_issue).parameters
+
+_INLINE_COMMENT_KEYS = frozenset({"path", "line", "body"})
+
+# Repository handles are reused for this long; a renamed/transferred repo may
+# keep resolving to its old URL for up to this window
+_REPO_CACHE_TTL_S = 300.0
+_REPO_CACHE_MAX = 256
+
+# (token, repo_full_name) -> (monotonic timestamp, Repository)
+_repo_cache: dict[tuple[str, str], tuple[float, Repository]] = {}
+
+# (token, url, ref) -> (ETag, decoded content), least recently used first
+_etag_cache: OrderedDict[tuple[str, str, str], tuple[str, str]] = OrderedDict()
+_ETAG_CACHE_MAX = 256
+
+# Client methods run in asyncio.to_thread / executor workers; guards every
+# lookup, eviction and insert on the two caches above
+_cache_lock = threading.Lock()
+
+
+# ── Shared HTTP Client ──
+
+_http: httpx.Client | None = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the pooled sync HTTP client shared by all GitHubClient instances (lazy).
+
+    Agents build a GitHubClient per operation, so the keep-alive pool lives
+    at module level; auth headers are passed per request.
+    """
+    global _http
+    if _http is None or _http.is_closed:
+        _http = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            http2=True,
+        )
+    return _http
+
+
+def close_http_client() -> None:
+    """Close the shared GitHub REST HTTP client."""
+    global _http
+    if _http is not None:
+        _http.close()
+        _http = None
+
 
 class GitHubClient:
     """Client for GitHub API operations: read PRs, post reviews, manage labels."""
@@ -28,6 +91,12 @@ class GitHubClient:
         else:
             self._webhook_secret = webhook_secret or settings.github_webhook_secret
         self._github: Github | None = None
+        # Built once; the shared HTTP client is token-agnostic so these go per request
+        self._headers = {
+            "Authorization": f"Bearer {self._token}",
+            "Accept": "application/vnd.github+json",
+        }
+        self._diff_headers = {**self._headers, "Accept": "application/vnd.github.diff"}
 
     @property
     def github(self) -> Github:
@@ -37,6 +106,37 @@ class GitHubClient:
             self._github = Github(auth=auth)
         return self._github
 
+    def _repo(self, repo_full_name: str) -> Repository:
+        """Lazy Repository handle; no GET until a repo attribute is read.
+
+        Handles are cached per token for ``_REPO_CACHE_TTL_S`` so that once a
+        repo's metadata has been loaded (e.g. ``default_branch``) bursts of
+        webhook work against the same repo don't load it again.
+        """
+        key = (self._token, repo_full_name)
+        with _cache_lock:
+            entry = _repo_cache.get(key)
+            if entry and time.monotonic() - entry[0] < _REPO_CACHE_TTL_S:
+                return entry[1]
+
+            repo = self.github.get_repo(repo_full_name, lazy=True)
+            if key not in _repo_cache and len(_repo_cache) >= _REPO_CACHE_MAX:
+                # Evict the oldest insertion
+                del _repo_cache[next(iter(_repo_cache))]
+            _repo_cache[key] = (time.monotonic(), repo)
+            return repo
+
+    def _forget_repo(self, repo_full_name: str, exc: Exception) -> None:
+        """Drop a cached repo handle after an auth or not-found error."""
+        if getattr(exc, "status", None) in (401, 404):
+            with _cache_lock:
+                _repo_cache.pop((self._token, repo_full_name), None)
+
+    @property
+    def http(self) -> httpx.Client:
+        """Pooled sync HTTP client for REST calls PyGithub doesn't cover."""
+        return _get_http_client()
+
     # ── Webhook Verification ──
 
     def verify_webhook_signature(self, payload_body: bytes, signature_header: str) -> bool:
@@ -56,91 +156,145 @@ class GitHubClient:
         if not signature_header:
             return False
 
-        expected_sig = "sha256=" + hmac.new(
+        scheme, _, hex_sig = signature_header.partition("=")
+        if scheme != "sha256" or len(hex_sig) != 64:
+            return False
+        try:
+            provided = bytes.fromhex(hex_sig)
+        except ValueError:
+            return False
+
+        expected = hmac.new(
             self._webhook_secret.encode("utf-8"),
             payload_body,
             hashlib.sha256,
-        ).hexdigest()
+        ).digest()
 
-        return hmac.compare_digest(expected_sig, signature_header)
+        # Both sides are raw 32-byte SHA-256 digests
+        return hmac.compare_digest(expected, provided)
 
     # ── Parse Webhook Events ──
 
     @staticmethod
     def parse_pr_event(payload: dict[str, Any]) -> PRWebhookEvent:
-        """Parse a raw GitHub pull_request webhook payload into our model."""
-        pr = payload["pull_request"]
-        repo = payload["repository"]
-
-        return PRWebhookEvent(
-            action=payload["action"],
-            repository_full_name=repo["full_name"],
-            pull_request=PullRequestData(
-                number=pr["number"],
-                title=pr["title"],
-                body=pr.get("body") or "",
-                html_url=pr["html_url"],
-                diff_url=pr["diff_url"],
-                user=PRUser(
-                    login=pr["user"]["login"],
-                    avatar_url=pr["user"].get("avatar_url", ""),
-                ),
-                head=PRHead(ref=pr["head"]["ref"], sha=pr["head"]["sha"]),
-                base=PRBase(ref=pr["base"]["ref"], sha=pr["base"]["sha"]),
-                created_at=pr.get("created_at", ""),
-                updated_at=pr.get("updated_at", ""),
-            ),
-        )
+        """Parse a raw GitHub pull_request webhook payload into our model.
+
+        The schema's aliases mirror GitHub's field names, so the whole
+        nested event is built by one pydantic-core validation pass.
+        """
+        return PRWebhookEvent.model_validate(payload)
 
     # ── PR Operations ──
 
-    def get_pr(self, repo_full_name: str, pr_number: int) -> PullRequest:
-        """Fetch a PullRequest object from GitHub."""
-        repo = self.github.get_repo(repo_full_name)
+    def get_pr(self, repo_full_name: str, pr_number: int, lazy: bool = False) -> PullRequest:
+        """Fetch a PullRequest object from GitHub.
+
+        With ``lazy=True`` (and a PyGithub that supports it) no request is
+        made until a PR attribute is read; sub-resource calls such as
+        ``get_files`` or ``create_review`` only need the PR URL.
+        """
+        repo = self._repo(repo_full_name)
+        if lazy and _PULL_ACCEPTS_LAZY:
+            return repo.get_pull(pr_number, lazy=True)
         return repo.get_pull(pr_number)
 
     def get_pr_diff(self, repo_full_name: str, pr_number: int) -> str:
-        """Fetch the diff of a PR as a string."""
-        pr = self.get_pr(repo_full_name, pr_number)
-        # PyGithub doesn't directly provide diff, use httpx
-        diff_url = f"https://api.github.com/repos/{repo_full_name}/pulls/{pr_number}"
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Accept": "application/vnd.github.diff",
-        }
-        resp = httpx.get(diff_url, headers=headers, timeout=30)
+        """Fetch the diff of a PR as a string.
+
+        Goes straight to the diff media type of the pulls endpoint; no
+        PyGithub repo/PR objects are needed.
+        """
+        diff_url = f"{GITHUB_API_URL}/repos/{repo_full_name}/pulls/{pr_number}"
+        resp = self.http.get(diff_url, headers=self._diff_headers)
         resp.raise_for_status()
         return resp.text
 
-    def get_pr_files(self, repo_full_name: str, pr_number: int) -> list[dict[str, Any]]:
-        """Get list of changed files in a PR with patch data."""
-        pr = self.get_pr(repo_full_name, pr_number)
-        files = []
-        for f in pr.get_files():
-            files.append({
-                "filename": f.filename,
-                "status": f.status,  # added, removed, modified, renamed
-                "additions": f.additions,
-                "deletions": f.deletions,
-                "changes": f.changes,
-                "patch": f.patch or "",
-                "contents_url": f.contents_url,
-            })
-        return files
+    def iter_pr_files(
+        self,
+        repo_full_name: str,
+        pr_number: int,
+        include_patches: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the changed files of a PR one at a time, optionally with patch data.
+
+        Lists files straight from ``GET /pulls/{n}/files`` at 100 per page
+        (PyGithub pages at 30); only one page is held at a time and later
+        pages are not fetched if the caller stops early. Pass
+        ``include_patches=False`` when only names/statuses/counts are
+        needed; patches dominate the payload on large PRs.
+        """
+        url: str | None = f"{GITHUB_API_URL}/repos/{repo_full_name}/pulls/{pr_number}/files"
+        params: dict[str, Any] | None = {"per_page": 100}
+        while url:
+            resp = self.http.get(url, headers=self._headers, params=params)
+            resp.raise_for_status()
+            for f in resp.json():
+                entry = {
+                    "filename": f["filename"],
+                    "status": f["status"],  # added, removed, modified, renamed
+                    "additions": f["additions"],
+                    "deletions": f["deletions"],
+                    "changes": f["changes"],
+                    "contents_url": f.get("contents_url", ""),
+                }
+                if include_patches:
+                    entry["patch"] = f.get("patch") or ""
+                yield entry
+            # The next link already carries the query string
+            url = next_link(resp.headers.get("Link"))
+            params = None
+
+    def get_pr_files(
+        self,
+        repo_full_name: str,
+        pr_number: int,
+        include_patches: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Get list of changed files in a PR, optionally with patch data."""
+        return list(self.iter_pr_files(repo_full_name, pr_number, include_patches))
 
     def get_file_content(self, repo_full_name: str, path: str, ref: str = "main") -> str:
-        """Fetch the full content of a file at a specific ref/sha."""
-        repo = self.github.get_repo(repo_full_name)
+        """Fetch the full content of a file at a specific ref/sha.
+
+        Revalidates with ``If-None-Match``; an unchanged file comes back as
+        a 304, which GitHub doesn't count against the rate limit.
+        """
+        # Quote the path so "#" / "?" in a filename aren't read as a URL
+        # fragment or query string
+        url = f"{GITHUB_API_URL}/repos/{repo_full_name}/contents/{quote(path, safe='/')}"
+        key = (self._token, url, ref)
+        with _cache_lock:
+            cached = _etag_cache.get(key)
+        headers = {**self._headers, "If-None-Match": cached[0]} if cached else self._headers
+
         try:
-            content = repo.get_contents(path, ref=ref)
-            if isinstance(content, list):
+            resp = self.http.get(url, headers=headers, params={"ref": ref})
+            if resp.status_code == 304 and cached:
+                with _cache_lock:
+                    # Another thread may have evicted it meanwhile
+                    if key in _etag_cache:
+                        _etag_cache.move_to_end(key)
+                return cached[1]
+            resp.raise_for_status()
+
+            data = resp.json()
+            if isinstance(data, list):
                 # It's a directory — shouldn't happen for a file path
                 return ""
-            return content.decoded_content.decode("utf-8")
-        except GithubException as e:
+            content = base64.b64decode(data.get("content", "")).decode("utf-8")
+        except (httpx.HTTPError, ValueError, binascii.Error, UnicodeDecodeError) as e:
+            # Malformed JSON, bad base64 or a binary file: skip it like a fetch error
             logger.warning("Could not fetch %s:%s — %s", repo_full_name, path, e)
             return ""
 
+        if etag := resp.headers.get("ETag"):
+            with _cache_lock:
+                _etag_cache[key] = (etag, content)
+                _etag_cache.move_to_end(key)
+                if len(_etag_cache) > _ETAG_CACHE_MAX:
+                    _etag_cache.popitem(last=False)
+        return content
+
     # ── Issue Operations ──
 
     def get_repository_issues(
@@ -163,7 +317,7 @@ class GitHubClient:
         Returns:
             List of issue dictionaries with relevant fields
         """
-        repo = self.github.get_repo(repo_full_name)
+        repo = self._repo(repo_full_name)
         issues = []
 
         try:
@@ -202,6 +356,7 @@ class GitHubClient:
             return issues
 
         except GithubException as e:
+            self._forget_repo(repo_full_name, e)
             logger.warning("Could not fetch issues from %s — %s", repo_full_name, e)
             return []
 
@@ -224,22 +379,22 @@ class GitHubClient:
             event: 'APPROVE', 'REQUEST_CHANGES', or 'COMMENT'
             comments: List of inline comments with 'path', 'position'/'line', 'body'
         """
-        pr = self.get_pr(repo_full_name, pr_number)
+        pr = self.get_pr(repo_full_name, pr_number, lazy=True)
 
         if comments:
-            # Post review with inline comments
-            pr.create_review(
-                body=body,
-                event=event,
-                comments=[
+            # Comments from the review graph already have exactly the API
+            # shape; only rebuild when keys are missing or extra
+            if not all(c.keys() == _INLINE_COMMENT_KEYS for c in comments):
+                comments = [
                     {
                         "path": c["path"],
                         "line": c.get("line", 1),
                         "body": c["body"],
                     }
                     for c in comments
-                ],
-            )
+                ]
+            # Post review with inline comments
+            pr.create_review(body=body, event=event, comments=comments)
         else:
             # Post review without inline comments
             pr.create_review(body=body, event=event)
@@ -252,11 +407,12 @@ class GitHubClient:
     # ── Labels ──
 
     def add_labels(self, repo_full_name: str, pr_number: int, labels: list[str]) -> None:
-        """Add labels to a PR/issue."""
-        repo = self.github.get_repo(repo_full_name)
-        issue = repo.get_issue(pr_number)
-        for label in labels:
-            issue.add_to_labels(label)
+        """Add labels to a PR/issue in a single API call."""
+        if not labels:
+            return
+        repo = self._repo(repo_full_name)
+        issue = repo.get_issue(pr_number, lazy=True) if _ISSUE_ACCEPTS_LAZY else repo.get_issue(pr_number)
+        issue.add_to_labels(*labels)
 
     # ── Authenticated User ──
 
@@ -295,7 +451,7 @@ class GitHubClient:
             Dict with branch info
         """
         try:
-            repo = self.github.get_repo(repo_full_name)
+            repo = self._repo(repo_full_name)
 
             # Get default branch SHA if not specified
             if source_sha is None:
@@ -307,14 +463,15 @@ class GitHubClient:
                 sha=source_sha
             )
 
-            logger.info(f"Created branch {branch_name} in {repo_full_name}")
+            logger.info("Created branch %s in %s", branch_name, repo_full_name)
             return {
                 "name": branch_name,
                 "sha": ref.object.sha,
                 "url": ref.url,
             }
         except GithubException as e:
-            logger.error(f"Failed to create branch: {e}")
+            self._forget_repo(repo_full_name, e)
+            logger.error("Failed to create branch: %s", e)
             raise
 
     def create_pull_request(
@@ -340,7 +497,7 @@ class GitHubClient:
             Dict with PR details (number, html_url, state, etc.)
         """
         try:
-            repo = self.github.get_repo(repo_full_name)
+            repo = self._repo(repo_full_name)
 
             pr = repo.create_pull(
                 title=title,
@@ -350,7 +507,7 @@ class GitHubClient:
                 draft=draft
             )
 
-            logger.info(f"Created PR #{pr.number} in {repo_full_name}")
+            logger.info("Created PR #%s in %s", pr.number, repo_full_name)
             return {
                 "number": pr.number,
                 "html_url": pr.html_url,
@@ -359,7 +516,8 @@ class GitHubClient:
                 "created_at": pr.created_at.isoformat() if pr.created_at else None,
             }
         except GithubException as e:
-            logger.error(f"Failed to create PR: {e}")
+            self._forget_repo(repo_full_name, e)
+            logger.error("Failed to create PR: %s", e)
             raise
 
     def get_file_content_at_sha(
@@ -379,7 +537,7 @@ class GitHubClient:
             File content as string
         """
         try:
-            repo = self.github.get_repo(repo_full_name)
+            repo = self._repo(repo_full_name)
             contents = repo.get_contents(file_path, ref=sha)
 
             if isinstance(contents, list):
@@ -388,7 +546,8 @@ class GitHubClient:
 
             return contents.decoded_content.decode("utf-8")
         except Exception as e:
-            logger.warning(f"Failed to get {file_path} at {sha}: {e}")
+            self._forget_repo(repo_full_name, e)
+            logger.warning("Failed to get %s at %s: %s", file_path, sha, e)
             return ""
 
     def get_default_branch_sha(self, repo_full_name: str) -> str | None:
@@ -401,8 +560,9 @@ class GitHubClient:
             Commit SHA or None
         """
         try:
-            repo = self.github.get_repo(repo_full_name)
+            repo = self._repo(repo_full_name)
             return repo.get_branch(repo.default_branch).commit.sha
         except Exception as e:
-            logger.warning(f"Failed to get default branch SHA: {e}")
+            self._forget_repo(repo_full_name, e)
+            logger.warning("Failed to get default branch SHA: %s", e)
             return None
@@ -6,18 +6,236 @@ Dual-mode: returns None when no project exists, enabling graceful fallback.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 
 import httpx
+import orjson
 
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 GITHUB_REST_URL = "https://api.github.com"
 
+# Project field names that may hold an item's estimate, in preference order
+_STORY_POINT_FIELDS = ("story points", "points", "estimate")
+
+_LINK_NEXT = re.compile(r'<([^<>]+)>;\s*rel="next"')
+
+
+def next_link(link_header: str | None) -> str | None:
+    """Return the ``rel="next"`` URL from a REST ``Link`` header, if any.
+
+    The substring test rejects last pages (and missing headers) without
+    running the regex.
+    """
+    if not link_header or 'rel="next"' not in link_header:
+        return None
+    match = _LINK_NEXT.search(link_header)
+    return match.group(1) if match else None
+
+
+# The active iteration changes at most once per sprint, so a minute of
+# staleness is harmless
+_ITERATION_CACHE_TTL_S = 60.0
+
+# (token, org, project_number) -> (monotonic timestamp, iteration)
+_iteration_cache: dict[tuple[str, str, int], tuple[float, dict[str, Any]]] = {}
+
+# (token, url, sorted params) -> (ETag, parsed body), least recently used first
+_etag_cache: OrderedDict[tuple[str, str, tuple], tuple[str, Any]] = OrderedDict()
+_ETAG_CACHE_MAX = 128
+
+# key -> request currently running for that key
+_inflight: dict[tuple, asyncio.Future[Any]] = {}
+
+
+async def _single_flight(key: tuple, fn: Callable[[], Awaitable[T]]) -> T:
+    """Run ``fn`` once for concurrent callers sharing ``key``.
+
+    Callers arriving while a request for ``key`` is running await that
+    request instead of issuing their own.
+    """
+    inflight = _inflight.get(key)
+    if inflight is None:
+        inflight = _inflight[key] = asyncio.ensure_future(fn())
+        inflight.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so one cancelled caller doesn't cancel the request for the others
+    return await asyncio.shield(inflight)
+
+
+# ── GraphQL Queries ──
+
+
+def _minify(query: str) -> str:
+    """Collapse a pretty-printed GraphQL document onto one line.
+
+    None of the queries contain string literals, so any whitespace run can
+    become a single space.
+    """
+    return " ".join(query.split())
+
+
+_QUERY_GET_PROJECT_V2 = _minify("""
+query($org: String!, $number: Int!) {
+  organization(login: $org) {
+    projectV2(number: $number) {
+      id
+      title
+      shortDescription
+      url
+      fields(first: 20) {
+        nodes {
+          ... on ProjectV2Field {
+            id
+            name
+            dataType
+          }
+          ... on ProjectV2IterationField {
+            id
+            name
+            configuration {
+              iterations {
+                id
+                title
+                startDate
+                duration
+              }
+            }
+          }
+          ... on ProjectV2SingleSelectField {
+            id
+            name
+            options {
+              id
+              name
+            }
+          }
+        }
+      }
+    }
+  }
+}
+""")
+
+# Only the iteration field(s); non-iteration field nodes come back empty
+_QUERY_CURRENT_ITERATION = _minify("""
+query($org: String!, $number: Int!) {
+  organization(login: $org) {
+    projectV2(number: $number) {
+      fields(first: 20) {
+        nodes {
+          ... on ProjectV2IterationField {
+            id
+            name
+            configuration {
+              iterations {
+                id
+                title
+                startDate
+                duration
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+""")
+
+_QUERY_GET_PROJECT_ITEMS = _minify("""
+query($org: String!, $number: Int!, $first: Int!) {
+  organization(login: $org) {
+    projectV2(number: $number) {
+      items(first: $first) {
+        nodes {
+          id
+          content {
+            ... on Issue {
+              number
+              title
+              state
+              labels(first: 10) {
+                nodes { name }
+              }
+              assignees(first: 5) {
+                nodes { login }
+              }
+              milestone {
+                title
+                dueOn
+              }
+            }
+            ... on PullRequest {
+              number
+              title
+              state
+            }
+          }
+          fieldValues(first: 10) {
+            nodes {
+              ... on ProjectV2ItemFieldIterationValue {
+                iterationId
+                title
+                startDate
+                duration
+              }
+              ... on ProjectV2ItemFieldSingleSelectValue {
+                name
+                field { ... on ProjectV2SingleSelectField { name } }
+              }
+              ... on ProjectV2ItemFieldNumberValue {
+                number
+                field { ... on ProjectV2Field { name } }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+""")
+
+
+# ── Shared HTTP Client ──
+
+_http: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP client shared by all GraphQL/REST calls (lazy).
+
+    Clients are cheap per-call objects (agents build one per query), so the
+    keep-alive pool lives at module level and survives across instances.
+    """
+    global _http
+    if _http is None or _http.is_closed:
+        _http = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=40, max_keepalive_connections=20),
+            http2=True,
+        )
+    return _http
+
+
+async def close_http_client() -> None:
+    """Close the shared GitHub HTTP client."""
+    global _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+
 
 class GitHubGraphQLClient:
     """Client for GitHub GraphQL API (Projects V2) and REST (Actions)."""
@@ -28,74 +246,40 @@ class GitHubGraphQLClient:
             "Authorization": f"Bearer {self._token}",
             "Accept": "application/vnd.github+json",
         }
+        self._post_headers = {**self._headers, "Content-Type": "application/json"}
 
     async def execute(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any] | None:
         """Execute a raw GraphQL query.
 
         Returns the 'data' portion of the response, or None on error.
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(
-                GITHUB_GRAPHQL_URL,
-                headers=self._headers,
-                json={"query": query, "variables": variables or {}},
-            )
-            resp.raise_for_status()
-            body = resp.json()
+        resp = await _get_http_client().post(
+            GITHUB_GRAPHQL_URL,
+            headers=self._post_headers,
+            content=orjson.dumps({"query": query, "variables": variables or {}}),
+        )
+        resp.raise_for_status()
+        body = orjson.loads(resp.content)
 
-            if "errors" in body:
-                logger.error("GraphQL errors: %s", body["errors"])
-                return None
+        if "errors" in body:
+            logger.error("GraphQL errors: %s", body["errors"])
+            return None
 
-            return body.get("data")
+        return body.get("data")
 
     async def get_project_v2(self, org: str, project_number: int) -> dict[str, Any] | None:
         """Fetch a Projects V2 board by org and number.
 
-        Returns project metadata or None if not found.
-        """
-        query = """
-        query($org: String!, $number: Int!) {
-          organization(login: $org) {
-            projectV2(number: $number) {
-              id
-              title
-              shortDescription
-              url
-              fields(first: 20) {
-                nodes {
-                  ... on ProjectV2Field {
-                    id
-                    name
-                    dataType
-                  }
-                  ... on ProjectV2IterationField {
-                    id
-                    name
-                    configuration {
-                      iterations {
-                        id
-                        title
-                        startDate
-                        duration
-                      }
-                    }
-                  }
-                  ... on ProjectV2SingleSelectField {
-                    id
-                    name
-                    options {
-                      id
-                      name
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
+        Returns project metadata or None if not found. Concurrent calls for
+        the same board share one request.
         """
-        data = await self.execute(query, {"org": org, "number": project_number})
+        return await _single_flight(
+            ("project", self._token, org, project_number),
+            lambda: self._fetch_project_v2(org, project_number),
+        )
+
+    async def _fetch_project_v2(self, org: str, project_number: int) -> dict[str, Any] | None:
+        data = await self.execute(_QUERY_GET_PROJECT_V2, {"org": org, "number": project_number})
         if not data:
             return None
 
@@ -112,9 +296,34 @@ class GitHubGraphQLClient:
         """Get the currently active iteration (sprint) from a Projects V2 board.
 
         Returns iteration dict with id, title, startDate, duration, or None.
+        Found iterations are cached for ``_ITERATION_CACHE_TTL_S`` seconds and
+        concurrent misses share one request.
         """
-        project = await self.get_project_v2(org, project_number)
+        key = (self._token, org, project_number)
+        entry = _iteration_cache.get(key)
+        if entry and time.monotonic() - entry[0] < _ITERATION_CACHE_TTL_S:
+            return dict(entry[1])
+
+        iteration = await _single_flight(
+            ("iteration", *key),
+            lambda: self._fetch_current_sprint_iteration(org, project_number),
+        )
+        if iteration is not None:
+            _iteration_cache[key] = (time.monotonic(), iteration)
+            return dict(iteration)
+        return None
+
+    async def _fetch_current_sprint_iteration(
+        self, org: str, project_number: int
+    ) -> dict[str, Any] | None:
+        # Slim query: only iteration fields, not the full board metadata
+        data = await self.execute(_QUERY_CURRENT_ITERATION, {"org": org, "number": project_number})
+        if not data:
+            return None
+
+        project = data.get("organization", {}).get("projectV2")
         if not project:
+            logger.warning("Project V2 #%d not found in org %s", project_number, org)
             return None
 
         # Find the iteration field
@@ -155,60 +364,9 @@ class GitHubGraphQLClient:
 
         Returns list of item dicts with title, status, assignees, etc.
         """
-        query = """
-        query($org: String!, $number: Int!, $first: Int!) {
-          organization(login: $org) {
-            projectV2(number: $number) {
-              items(first: $first) {
-                nodes {
-                  id
-                  content {
-                    ... on Issue {
-                      number
-                      title
-                      state
-                      labels(first: 10) {
-                        nodes { name }
-                      }
-                      assignees(first: 5) {
-                        nodes { login }
-                      }
-                      milestone {
-                        title
-                        dueOn
-                      }
-                    }
-                    ... on PullRequest {
-                      number
-                      title
-                      state
-                    }
-                  }
-                  fieldValues(first: 10) {
-                    nodes {
-                      ... on ProjectV2ItemFieldIterationValue {
-                        iterationId
-                        title
-                        startDate
-                        duration
-                      }
-                      ... on ProjectV2ItemFieldSingleSelectValue {
-                        name
-                        field { ... on ProjectV2SingleSelectField { name } }
-                      }
-                      ... on ProjectV2ItemFieldNumberValue {
-                        number
-                        field { ... on ProjectV2Field { name } }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
-        data = await self.execute(query, {"org": org, "number": project_number, "first": limit})
+        data = await self.execute(
+            _QUERY_GET_PROJECT_ITEMS, {"org": org, "number": project_number, "first": limit}
+        )
         if not data:
             return []
 
@@ -233,14 +391,14 @@ class GitHubGraphQLClient:
                     continue
 
             # Extract status and story points from field values
-            status = None
-            story_points = None
-            for fv in field_values:
-                field_info = fv.get("field", {})
-                if field_info.get("name", "").lower() == "status":
-                    status = fv.get("name")
-                if field_info.get("name", "").lower() in ("story points", "points", "estimate"):
-                    story_points = fv.get("number")
+            fv_by_field = {
+                (fv.get("field") or {}).get("name", "").lower(): fv for fv in field_values
+            }
+            status = fv_by_field.get("status", {}).get("name")
+            story_points = next(
+                (fv_by_field[k].get("number") for k in _STORY_POINT_FIELDS if k in fv_by_field),
+                None,
+            )
 
             items.append({
                 "id": item["id"],
@@ -277,10 +435,24 @@ class GitHubGraphQLClient:
         if status:
             params["status"] = status
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(url, headers=self._headers, params=params)
+        key = (self._token, url, tuple(sorted(params.items())))
+        cached = _etag_cache.get(key)
+        headers = {**self._headers, "If-None-Match": cached[0]} if cached else self._headers
+
+        resp = await _get_http_client().get(url, headers=headers, params=params)
+        if resp.status_code == 304 and cached:
+            # Unchanged since last poll; 304s don't count against the rate limit
+            _etag_cache.move_to_end(key)
+            data = cached[1]
+        else:
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
+            etag = resp.headers.get("ETag")
+            if isinstance(etag, str):
+                _etag_cache[key] = (etag, data)
+                _etag_cache.move_to_end(key)
+                if len(_etag_cache) > _ETAG_CACHE_MAX:
+                    _etag_cache.popitem(last=False)
 
         runs = []
         for run in data.get("workflow_runs", [])[:limit]:
@@ -313,10 +485,9 @@ class GitHubGraphQLClient:
         """
         url = f"{GITHUB_REST_URL}/repos/{repo}/actions/runs/{run_id}/jobs"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(url, headers=self._headers)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _get_http_client().get(url, headers=self._headers)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
 
         jobs = []
         for job in data.get("jobs", []):
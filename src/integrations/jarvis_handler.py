@@ -10,7 +10,9 @@ Framework only — no live gateway testing required.
 from __future__ import annotations
 
 import logging
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Any
 
@@ -23,23 +25,63 @@ from src.models.schemas import (
 
 logger = logging.getLogger(__name__)
 
-# Map directive types to supervisor event_types
-DIRECTIVE_TO_EVENT: dict[str, str] = {
-    JarvisDirectiveType.SPRINT_REPORT.value: "sprint_report",
-    JarvisDirectiveType.REVIEW_PR.value: "pull_request",
-    JarvisDirectiveType.TRACK_BAYES.value: "bayes_tracking",
-    JarvisDirectiveType.ARCHITECTURE_QUERY.value: "architecture_query",
-    JarvisDirectiveType.DEVOPS_STATUS.value: "devops_status",
-    JarvisDirectiveType.GENERAL_QUERY.value: "general_query",
+# Map directive types to supervisor event_types. Keyed by the enum members,
+# which hash like their string values, so plain-string lookups still work.
+DIRECTIVE_TO_EVENT: dict[JarvisDirectiveType | str, str] = {
+    JarvisDirectiveType.SPRINT_REPORT: "sprint_report",
+    JarvisDirectiveType.REVIEW_PR: "pull_request",
+    JarvisDirectiveType.TRACK_BAYES: "bayes_tracking",
+    JarvisDirectiveType.ARCHITECTURE_QUERY: "architecture_query",
+    JarvisDirectiveType.DEVOPS_STATUS: "devops_status",
+    JarvisDirectiveType.GENERAL_QUERY: "general_query",
 }
 
+# Approvals JARVIS never answers are dropped after this long, oldest first
+# once more than _MAX_PENDING_APPROVALS are outstanding
+_PENDING_APPROVAL_TTL_S = 24 * 3600
+_MAX_PENDING_APPROVALS = 1024
+
+
+class _PendingApprovals:
+    """Bounded, expiring map of directive_id -> agent result awaiting approval.
+
+    Supports the ``in`` / ``[key] = value`` / ``pop`` subset the handler
+    uses; expired entries are treated as absent and pruned on insert.
+    """
+
+    def __init__(self, ttl: float = _PENDING_APPROVAL_TTL_S, maxsize: int = _MAX_PENDING_APPROVALS) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        # directive_id -> (monotonic timestamp, result), in insertion order
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def __setitem__(self, key: str, value: dict[str, Any]) -> None:
+        now = time.monotonic()
+        self._entries.pop(key, None)
+        while self._entries:
+            oldest_key, (ts, _) = next(iter(self._entries.items()))
+            if now - ts < self._ttl and len(self._entries) < self._maxsize:
+                break
+            del self._entries[oldest_key]
+        self._entries[key] = (now, value)
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._entries.get(key)  # type: ignore[arg-type]
+        return entry is not None and time.monotonic() - entry[0] < self._ttl
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def pop(self, key: str) -> dict[str, Any]:
+        return self._entries.pop(key)[1]
+
 
 class JarvisDirectiveHandler:
     """Handles directives from JARVIS by routing through the supervisor graph."""
 
     def __init__(self, openclaw_client: Any | None = None) -> None:
         self._openclaw_client = openclaw_client
-        self._pending_approvals: dict[str, dict[str, Any]] = {}
+        self._pending_approvals = _PendingApprovals()
 
     async def handle_directive(self, directive: JarvisDirective) -> CTOResponse:
         """Main entry: parse directive, route through supervisor, return response.
@@ -66,7 +108,7 @@ class JarvisDirectiveHandler:
             return await self.handle_approval_response(directive)
 
         # Map to supervisor event type
-        event_type = DIRECTIVE_TO_EVENT.get(directive.type.value)
+        event_type = DIRECTIVE_TO_EVENT.get(directive.type)
         if not event_type:
             return CTOResponse(
                 response_to=directive.directive_id,
@@ -191,9 +233,9 @@ class JarvisDirectiveHandler:
             logger.info("No OpenClaw client — skipping event handler registration")
             return
 
-        async def on_agent_message(event: Any) -> None:
+        async def on_agent_message(event: dict[str, Any]) -> None:
             """Handle incoming agent.message events from JARVIS."""
-            payload = event.payload if hasattr(event, "payload") else event
+            payload = event.get("payload") or {}
             try:
                 directive = JarvisDirective(
                     directive_id=payload.get("directive_id", str(uuid.uuid4())),
@@ -16,13 +16,16 @@ Phase 2: JARVIS Integration
 from __future__ import annotations
 
 import asyncio
-import json
+import itertools
 import logging
+import time
 import uuid
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Callable
 
 import httpx
+import orjson
 import websockets
 from pydantic import BaseModel
 from websockets.asyncio.client import ClientConnection
@@ -31,6 +34,15 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Largest inbound message accepted, and frames buffered before the socket
+# stops reading (websockets defaults: 1 MiB / 16)
+_WS_MAX_FRAME_BYTES = 2**24
+_WS_MAX_QUEUE = 256
+
+# Event handlers (e.g. JARVIS directives running the supervisor graph) allowed
+# to run at once; later events wait their turn and start in arrival order
+_EVENT_HANDLER_CONCURRENCY = 4
+
 
 # ── Message Models ──
 
@@ -44,8 +56,13 @@ class OpenClawRequest(BaseModel):
     params: dict[str, Any]
 
 
-class OpenClawResponse(BaseModel):
-    """Response frame from OpenClaw WebSocket."""
+@dataclass(slots=True)
+class OpenClawResponse:
+    """Response frame from OpenClaw WebSocket.
+
+    A plain slotted dataclass rather than a pydantic model: one is built per
+    RPC in the receive loop, and callers only read the attributes.
+    """
 
     type: str
     id: str | None = None
@@ -72,6 +89,31 @@ class JARVISResponse(BaseModel):
     suggested_actions: list[str] = []
 
 
+def _encode_request(request_id: str, method: str, params: dict[str, Any]) -> bytes:
+    """Serialize an ``OpenClawRequest`` frame straight to wire bytes.
+
+    Skips building/validating the pydantic model on every RPC; the key
+    order and shape match ``OpenClawRequest.model_dump_json()``.
+    """
+    return orjson.dumps({"type": "req", "id": request_id, "method": method, "params": params})
+
+
+# Message timestamps only need second resolution; bursts within the same
+# second reuse the formatted string
+_last_ts_s = 0
+_last_ts_str = ""
+
+
+def _iso_now() -> str:
+    """Current UTC time as ISO 8601, truncated to the second and memoized per second."""
+    global _last_ts_s, _last_ts_str
+    now_s = int(time.time())
+    if now_s != _last_ts_s:
+        _last_ts_s = now_s
+        _last_ts_str = datetime.fromtimestamp(now_s, timezone.utc).isoformat()
+    return _last_ts_str
+
+
 # ── OpenClaw Client ──
 
 
@@ -102,16 +144,27 @@ class OpenClawClient:
         self._ws_connected = False
         self._ws_task: asyncio.Task | None = None
         self._receive_task: asyncio.Task | None = None
+        # Loop the socket was opened on; RPC futures are created on it directly
+        self._loop: asyncio.AbstractEventLoop | None = None
 
-        # Request/response correlation
+        # Request/response correlation. Ids only need to be unique per client,
+        # so a counter replaces a UUID per RPC
+        self._request_ids = itertools.count(1)
         self._pending_requests: dict[str, asyncio.Future[OpenClawResponse]] = {}
         self._message_handlers: dict[str, Callable] = {}
+        # Strong refs to running event-handler tasks (the loop only keeps weak ones)
+        self._handler_tasks: set[asyncio.Task] = set()
+        self._handler_slots = asyncio.Semaphore(_EVENT_HANDLER_CONCURRENCY)
 
     @property
     def http_client(self) -> httpx.AsyncClient:
-        """Lazy-init HTTP client."""
+        """Lazy-init HTTP client; keeps connections alive between health probes."""
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=30.0)
+            self._http_client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60.0),
+                http2=True,
+            )
         return self._http_client
 
     @property
@@ -132,14 +185,20 @@ class OpenClawClient:
 
         try:
             logger.info("Connecting to OpenClaw Gateway: %s", self._ws_url)
+            self._loop = asyncio.get_running_loop()
             self._ws = await websockets.connect(
                 self._ws_url,
                 additional_headers={"User-Agent": f"digital-cto/1.0 ({self._node_id})"},
+                # Small JSON frames over the tailnet: deflate costs more CPU
+                # than it saves bandwidth
+                compression=None,
+                max_size=_WS_MAX_FRAME_BYTES,
+                max_queue=_WS_MAX_QUEUE,
             )
 
             # Wait for challenge
-            challenge = await asyncio.wait_for(self._ws.recv(), timeout=10.0)
-            challenge_data = json.loads(challenge)
+            challenge = await asyncio.wait_for(self._ws.recv(decode=False), timeout=10.0)
+            challenge_data = orjson.loads(challenge)
 
             if challenge_data.get("event") != "connect.challenge":
                 logger.error("Expected connect.challenge, got: %s", challenge_data)
@@ -170,17 +229,11 @@ class OpenClawClient:
             if self._gateway_token:
                 connect_params["auth"] = {"token": self._gateway_token}
 
-            request = OpenClawRequest(
-                id=str(uuid.uuid4()),
-                method="connect",
-                params=connect_params,
-            )
-
-            await self._ws.send(request.model_dump_json())
+            await self._ws.send(_encode_request(str(uuid.uuid4()), "connect", connect_params), text=True)
 
             # Wait for response
-            response = await asyncio.wait_for(self._ws.recv(), timeout=10.0)
-            response_data = json.loads(response)
+            response = await asyncio.wait_for(self._ws.recv(decode=False), timeout=10.0)
+            response_data = orjson.loads(response)
 
             if response_data.get("ok"):
                 self._ws_connected = True
@@ -228,6 +281,15 @@ class OpenClawClient:
                 pass
             self._receive_task = None
 
+        # Stop in-flight event handlers before the socket (and, from close(),
+        # the HTTP client) they may be using goes away
+        current = asyncio.current_task()
+        handler_tasks = [t for t in self._handler_tasks if t is not current]
+        for task in handler_tasks:
+            task.cancel()
+        if handler_tasks:
+            await asyncio.gather(*handler_tasks, return_exceptions=True)
+
         if self._ws:
             await self._ws.close()
             self._ws = None
@@ -246,50 +308,93 @@ class OpenClawClient:
 
     async def _receive_loop(self) -> None:
         """Background task to receive messages from WebSocket."""
+        # Consecutive failed frames; only the first of a run is logged in
+        # full so a burst of garbage (e.g. mid-reconnect) can't make the
+        # loop log-bound
+        bad_frames = 0
         try:
             while self._ws and self._ws_connected:
                 try:
-                    message = await self._ws.recv()
-                    data = json.loads(message)
+                    # Raw bytes even for text frames: orjson parses them
+                    # directly, so websockets needn't build a str first
+                    message = await self._ws.recv(decode=False)
+                    data = orjson.loads(message)
+                    if bad_frames:
+                        if bad_frames > 1:
+                            logger.warning("Skipped %d more bad WebSocket frames", bad_frames - 1)
+                        bad_frames = 0
 
                     if data.get("type") == "res":
                         # Response to a request
                         request_id = data.get("id")
-                        if request_id and request_id in self._pending_requests:
-                            future = self._pending_requests.pop(request_id)
+                        future = self._pending_requests.get(request_id)
+                        if future is not None:
+                            # The future's done-callback drops it from _pending_requests
                             if not future.done():
-                                future.set_result(OpenClawResponse(**data))
+                                future.set_result(
+                                    OpenClawResponse(
+                                        type="res",
+                                        id=request_id,
+                                        ok=data.get("ok", True),
+                                        payload=data.get("payload"),
+                                        error=data.get("error"),
+                                    )
+                                )
 
                     elif data.get("type") == "event":
-                        # Async event from gateway
+                        # Async event from gateway. Handlers (e.g. a JARVIS
+                        # directive running the supervisor graph) can take
+                        # seconds, so they run as tasks and never hold up the
+                        # frames, and RPC responses, queued behind them
                         event = data.get("event", "")
                         handler = self._message_handlers.get(event)
                         if handler:
-                            try:
-                                await handler(OpenClawEvent(**data))
-                            except Exception as e:
-                                logger.error("Event handler error for %s: %s", event, e)
+                            task = asyncio.create_task(self._dispatch_event(handler, event, data))
+                            self._handler_tasks.add(task)
+                            task.add_done_callback(self._handler_tasks.discard)
 
                 except websockets.ConnectionClosed:
                     logger.warning("OpenClaw WebSocket connection closed")
                     self._ws_connected = False
                     break
-                except json.JSONDecodeError as e:
-                    logger.error("Failed to decode WebSocket message: %s", e)
+                except orjson.JSONDecodeError as e:
+                    bad_frames += 1
+                    if bad_frames == 1:
+                        logger.error("Failed to decode WebSocket message: %s", e)
                 except Exception as e:
-                    logger.error("Error in receive loop: %s", e)
+                    bad_frames += 1
+                    if bad_frames == 1:
+                        logger.error("Error in receive loop: %s", e)
 
         except asyncio.CancelledError:
             pass
         finally:
             self._ws_connected = False
 
+    async def _dispatch_event(self, handler: Callable, event: str, data: dict[str, Any]) -> None:
+        """Run one event handler on the raw frame dict, logging rather than propagating its errors.
+
+        At most ``_EVENT_HANDLER_CONCURRENCY`` handlers run at once.
+        """
+        async with self._handler_slots:
+            try:
+                await handler(data)
+            except Exception as e:
+                logger.error("Event handler error for %s: %s", event, e)
+
     # ── Health Check (HTTP) ──
 
     async def health_check(self) -> bool:
-        """Check if OpenClaw Gateway is reachable via HTTP."""
+        """Check if OpenClaw Gateway is reachable via HTTP.
+
+        Probes with HEAD so no body is transferred, retrying as GET if the
+        gateway doesn't route HEAD for /health.
+        """
+        url = f"{self._gateway_url}/health"
         try:
-            resp = await self.http_client.get(f"{self._gateway_url}/health", timeout=5.0)
+            resp = await self.http_client.head(url, timeout=5.0)
+            if resp.status_code == 405:
+                resp = await self.http_client.get(url, timeout=5.0)
             return resp.status_code == 200
         except Exception as e:
             logger.warning("OpenClaw Gateway health check failed: %s", e)
@@ -322,26 +427,24 @@ class OpenClawClient:
                     error="Not connected to OpenClaw Gateway",
                 )
 
-        request_id = str(uuid.uuid4())
-        request = OpenClawRequest(
-            id=request_id,
-            method=method,
-            params=params,
-        )
+        request_id = str(next(self._request_ids))
 
         # Create future for response
-        future: asyncio.Future[OpenClawResponse] = asyncio.get_event_loop().create_future()
+        future: asyncio.Future[OpenClawResponse] = self._loop.create_future()
         self._pending_requests[request_id] = future
+        # However the future ends (answered, timed out, or cancelled), its
+        # correlation entry goes with it
+        future.add_done_callback(lambda _f: self._pending_requests.pop(request_id, None))
 
         try:
-            await self._ws.send(request.model_dump_json())
+            # Text frame, as the gateway expects; orjson output is valid UTF-8
+            await self._ws.send(_encode_request(request_id, method, params), text=True)
 
             # Wait for response
             response = await asyncio.wait_for(future, timeout=timeout)
             return response
 
         except asyncio.TimeoutError:
-            self._pending_requests.pop(request_id, None)
             return OpenClawResponse(
                 type="res",
                 id=request_id,
@@ -349,13 +452,16 @@ class OpenClawClient:
                 error=f"Request timed out after {timeout}s",
             )
         except Exception as e:
-            self._pending_requests.pop(request_id, None)
             return OpenClawResponse(
                 type="res",
                 id=request_id,
                 ok=False,
                 error=str(e),
             )
+        finally:
+            # No-op once answered; otherwise (send failed, or the caller was
+            # cancelled mid-send) this fires the cleanup callback
+            future.cancel()
 
     # ── JARVIS Communication ──
 
@@ -382,7 +488,7 @@ class OpenClawClient:
                 "message": message,
                 "context": context or {},
                 "sender": self._node_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _iso_now(),
             },
         )
 
@@ -472,20 +578,24 @@ class OpenClawClient:
 
     # ── Event Handlers ──
 
-    def on_event(self, event_name: str, handler: Callable[[OpenClawEvent], Any]) -> None:
+    def on_event(self, event_name: str, handler: Callable[[dict[str, Any]], Any]) -> None:
         """Register a handler for a specific event type.
 
+        The handler receives the decoded event frame as a plain dict (the
+        shape of ``OpenClawEvent``: ``event``, ``payload``, ``seq``); no
+        model is built per event.
+
         Args:
             event_name: Event name (e.g., "agent.message", "exec.approval.requested")
-            handler: Async or sync function to handle the event
+            handler: Async function to handle the event
         """
         self._message_handlers[event_name] = handler
 
     def on_jarvis_message(self, handler: Callable[[dict[str, Any]], Any]) -> None:
         """Register handler for messages from JARVIS."""
-        async def wrapper(event: OpenClawEvent) -> None:
-            if event.payload:
-                await handler(event.payload)
+        async def wrapper(event: dict[str, Any]) -> None:
+            if payload := event.get("payload"):
+                await handler(payload)
 
         self._message_handlers["agent.message"] = wrapper
 
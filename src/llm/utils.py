@@ -7,76 +7,69 @@ Provides:
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
 from typing import Any
 
-from langchain_anthropic import ChatAnthropic
-from langchain_openai import AzureChatOpenAI, ChatOpenAI
-
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Markdown fences an LLM wraps JSON in: ```json ... ``` and bare ``` ... ```
+_JSON_FENCE = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+_CODE_FENCE = re.compile(r"```\s*(.*?)\s*```", re.DOTALL)
+_DECODER = json.JSONDecoder()
 
-def get_default_llm(temperature: float = 0.7):
-    """Get default LLM respecting the preferred provider from onboarding.
-
-    If PREFERRED_LLM_PROVIDER is set, use that provider if its key is available.
-    Otherwise, fall back to auto-detection: Claude > GLM-5 > Azure OpenAI.
-
-    Args:
-        temperature: Sampling temperature for generation
 
-    Returns:
-        LangChain LLM instance
-    """
+def _resolve_provider() -> str:
+    """Pick the LLM provider: the onboarding preference if its key is set, else Claude > GLM-5 > Azure OpenAI."""
     preferred = settings.preferred_llm_provider.lower() if settings.preferred_llm_provider else ""
 
     # If user set a preferred provider during onboarding, try that first
     if preferred == "zai" and settings.has_zai:
         logger.debug("Using preferred LLM: z.ai (GLM-5)")
-        return ChatOpenAI(
-            model=settings.zai_model,
-            api_key=settings.zai_api_key,
-            base_url=settings.zai_base_url,
-            temperature=temperature,
-            max_tokens=8192,
-        )
+        return "zai"
 
     if preferred == "anthropic" and settings.has_anthropic:
         logger.debug("Using preferred LLM: Anthropic (Claude)")
-        return ChatAnthropic(
-            model="claude-sonnet-4-20250514",
-            api_key=settings.anthropic_api_key,
-            temperature=temperature,
-            max_tokens=8192,
-        )
+        return "anthropic"
 
     if preferred == "azure_openai" and settings.has_azure_openai:
         logger.debug("Using preferred LLM: Azure OpenAI")
-        return AzureChatOpenAI(
-            azure_deployment=settings.azure_openai_deployment,
-            azure_endpoint=settings.azure_openai_endpoint,
-            api_key=settings.azure_openai_api_key,
-            api_version=settings.azure_openai_api_version,
-            temperature=temperature,
-            max_tokens=8192,
-        )
+        return "azure_openai"
 
     # Auto-detect fallback: Claude > GLM-5 > Azure OpenAI
     if settings.has_anthropic:
         logger.debug("Auto-detected LLM: Anthropic (Claude)")
-        return ChatAnthropic(
-            model="claude-sonnet-4-20250514",
-            api_key=settings.anthropic_api_key,
-            temperature=temperature,
-            max_tokens=8192,
-        )
+        return "anthropic"
 
     elif settings.has_zai:
         logger.debug("Auto-detected LLM: z.ai (GLM-5)")
+        return "zai"
+
+    elif settings.has_azure_openai:
+        logger.debug("Auto-detected LLM: Azure OpenAI")
+        return "azure_openai"
+
+    else:
+        raise ValueError(
+            "No LLM configured. Set ANTHROPIC_API_KEY, ZAI_API_KEY, or AZURE_OPENAI_API_KEY + AZURE_OPENAI_ENDPOINT"
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _build_llm(provider: str, temperature: float):
+    """Construct the chat model for a provider, once per (provider, temperature).
+
+    Chat models are stateless between calls, so a single instance (and its
+    HTTP connection pool) is shared by every agent asking for the same one.
+    The provider SDK is imported here so the unused ones never load.
+    """
+    if provider == "zai":
+        from langchain_openai import ChatOpenAI
+
         return ChatOpenAI(
             model=settings.zai_model,
             api_key=settings.zai_api_key,
@@ -85,21 +78,42 @@ def get_default_llm(temperature: float = 0.7):
             max_tokens=8192,
         )
 
-    elif settings.has_azure_openai:
-        logger.debug("Auto-detected LLM: Azure OpenAI")
-        return AzureChatOpenAI(
-            azure_deployment=settings.azure_openai_deployment,
-            azure_endpoint=settings.azure_openai_endpoint,
-            api_key=settings.azure_openai_api_key,
-            api_version=settings.azure_openai_api_version,
+    if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(
+            model="claude-sonnet-4-20250514",
+            api_key=settings.anthropic_api_key,
             temperature=temperature,
             max_tokens=8192,
         )
 
-    else:
-        raise ValueError(
-            "No LLM configured. Set ANTHROPIC_API_KEY, ZAI_API_KEY, or AZURE_OPENAI_API_KEY + AZURE_OPENAI_ENDPOINT"
-        )
+    from langchain_openai import AzureChatOpenAI
+
+    return AzureChatOpenAI(
+        azure_deployment=settings.azure_openai_deployment,
+        azure_endpoint=settings.azure_openai_endpoint,
+        api_key=settings.azure_openai_api_key,
+        api_version=settings.azure_openai_api_version,
+        temperature=temperature,
+        max_tokens=8192,
+    )
+
+
+def get_default_llm(temperature: float = 0.7):
+    """Get default LLM respecting the preferred provider from onboarding.
+
+    If PREFERRED_LLM_PROVIDER is set, use that provider if its key is available.
+    Otherwise, fall back to auto-detection: Claude > GLM-5 > Azure OpenAI.
+    Instances are cached per provider and temperature.
+
+    Args:
+        temperature: Sampling temperature for generation
+
+    Returns:
+        LangChain LLM instance
+    """
+    return _build_llm(_resolve_provider(), temperature)
 
 
 def extract_json_from_llm_output(text: str) -> dict[str, Any] | None:
@@ -116,63 +130,44 @@ def extract_json_from_llm_output(text: str) -> dict[str, Any] | None:
 
     text = text.strip()
 
-    # Try direct JSON parse first
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
-
-    # Try extracting from markdown code blocks
-    # Pattern 1: ```json ... ```
-    json_pattern = r"```json\s*(.*?)\s*```"
-    matches = re.findall(json_pattern, text, re.DOTALL)
-    if matches:
-        try:
-            return json.loads(matches[0].strip())
-        except json.JSONDecodeError:
-            pass
-
-    # Pattern 2: ``` ... ```
-    code_pattern = r"```\s*(.*?)\s*```"
-    matches = re.findall(code_pattern, text, re.DOTALL)
-    if matches:
+    # Try direct JSON parse first, but only if it could be a JSON document;
+    # prose would just raise
+    if text.startswith(("{", "[")):
         try:
-            return json.loads(matches[0].strip())
+            return json.loads(text)
         except json.JSONDecodeError:
             pass
 
-    # Pattern 3: Find first { ... } with brace matching
-    try:
-        start = text.find("{")
-        if start != -1:
-            # Count braces to find matching end
-            depth = 0
-            for i, char in enumerate(text[start:], start):
-                if char == "{":
-                    depth += 1
-                elif char == "}":
-                    depth -= 1
-                    if depth == 0:
-                        json_str = text[start:i + 1]
-                        return json.loads(json_str)
-    except (json.JSONDecodeError, ValueError):
-        pass
-
-    # Pattern 4: Find first [ ... ] for array responses
-    try:
-        start = text.find("[")
-        if start != -1:
-            depth = 0
-            for i, char in enumerate(text[start:], start):
-                if char == "[":
-                    depth += 1
-                elif char == "]":
-                    depth -= 1
-                    if depth == 0:
-                        json_str = text[start:i + 1]
-                        return json.loads(json_str)
-    except (json.JSONDecodeError, ValueError):
-        pass
+    # Try extracting from markdown code blocks (only if there are any)
+    if "```" in text:
+        # Pattern 1: ```json ... ```
+        matches = _JSON_FENCE.findall(text)
+        if matches:
+            try:
+                return json.loads(matches[0].strip())
+            except json.JSONDecodeError:
+                pass
+
+        # Pattern 2: ``` ... ```
+        matches = _CODE_FENCE.findall(text)
+        if matches:
+            try:
+                return json.loads(matches[0].strip())
+            except json.JSONDecodeError:
+                pass
+
+    # Pattern 3/4: first embedded object, then first embedded array. raw_decode
+    # parses from each opener in C and stops at the end of the value, so no
+    # Python-level brace counting is needed. After a failure the scan resumes
+    # past the error offset, so a truncated value never yields one of its
+    # nested parts
+    for opener in ("{", "["):
+        i = text.find(opener)
+        while i != -1:
+            try:
+                return _DECODER.raw_decode(text, i)[0]
+            except json.JSONDecodeError as e:
+                i = text.find(opener, max(i + 1, e.pos))
 
     logger.warning("Failed to extract JSON from LLM output (first 200 chars): %s", text[:200])
     return None
@@ -6,40 +6,113 @@ and request tracing.
 
 from __future__ import annotations
 
+import atexit
+import io
 import logging
+import logging.handlers
+import queue
+import re
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
+from typing import Any, Callable, TextIO
 
-from pythonjsonlogger import jsonlogger
+import orjson
 
 from src.config import settings
 
 
+# Per-record constants, resolved once at import
+_ENV = settings.environment
+_SERVICE = sys.intern("digital_cto")
+_LEVEL_CACHE = {
+    name: sys.intern(name.lower()) for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+
+# %(name)s-style placeholders in a format string
+_FMT_FIELD = re.compile(r"%\((.+?)\)")
+
+# Standard LogRecord attributes, taken from a real record so it tracks the
+# running Python (e.g. taskName in 3.12); anything else came from extra=
+_RESERVED_ATTRS = frozenset(
+    logging.LogRecord("x", logging.INFO, "x", 0, "x", None, None).__dict__
+) | {"message", "asctime"}
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS.") for the most recent record; records
+# within the same second only format the microseconds. One tuple so a
+# reader on another thread never sees a mismatched pair.
+_ts_cache: tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(created: float) -> str:
+    """ISO 8601 UTC timestamp (microseconds, ``+00:00`` offset) for a record's ``created``."""
+    global _ts_cache
+    sec = int(created)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S.", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}{int((created - sec) * 1_000_000):06d}+00:00"
+
+
 # ── Custom JSON Formatter ──
 
 
-class DigitalCTOJsonFormatter(jsonlogger.JsonFormatter):
-    """Custom JSON formatter with Digital CTO specific fields."""
+class DigitalCTOJsonFormatter(logging.Formatter):
+    """Custom JSON formatter with Digital CTO specific fields.
+
+    Emits the attributes named in ``fmt``, any ``extra=`` fields, and the
+    formatted exception/stack, encoded with orjson. The constant
+    ``service``/``environment`` pair is serialized once; each record only
+    encodes its own fields, spliced in after that prefix.
+    """
+
+    def __init__(self, fmt: str | None = None, *args: Any, **kwargs: Any) -> None:
+        super().__init__(fmt, *args, **kwargs)
+        # Record attributes to emit, in fmt order (e.g. "name", "levelname", "message")
+        self._fields = tuple(_FMT_FIELD.findall(self._fmt or ""))
+        # service/environment come from the static prefix; an extra= of the
+        # same name is dropped rather than emitted as a duplicate key
+        self._skip = _RESERVED_ATTRS | frozenset(self._fields) | {"service", "environment"}
+        # b'{"service":"digital_cto","environment":"..."' - object left open
+        self._static_prefix = orjson.dumps({"service": _SERVICE, "environment": _ENV})[:-1]
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        if "asctime" in self._fields:
+            record.asctime = self.formatTime(record, self.datefmt)
+
+        log_record: dict[str, Any] = {field: record.__dict__.get(field) for field in self._fields}
 
-    def add_fields(self, log_record: dict, record: logging.LogRecord, message_dict: dict) -> None:
-        super().add_fields(log_record, record, message_dict)
+        if record.exc_info:
+            log_record["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_record["exc_info"] = record.exc_text
+        if record.stack_info:
+            log_record["stack_info"] = self.formatStack(record.stack_info)
 
-        # Add Digital CTO specific fields
-        log_record["environment"] = settings.environment
-        log_record["service"] = "digital_cto"
+        # Caller-supplied extra= fields; most records have none, which a
+        # single C-level subset test settles without walking the attributes
+        attrs = record.__dict__
+        if not attrs.keys() <= self._skip:
+            for key, value in attrs.items():
+                if key not in self._skip:
+                    log_record[key] = value
 
-        # Add timestamp if not present
+        # Timestamp from the record's own creation time, without building a
+        # datetime per record
         if "timestamp" not in log_record:
-            log_record["timestamp"] = datetime.utcnow().isoformat() + "Z"
+            log_record["timestamp"] = _format_timestamp(record.created)
 
         # Simplify level name
-        log_record["level"] = record.levelname.lower()
+        log_record["level"] = _LEVEL_CACHE.get(record.levelname) or record.levelname.lower()
 
-        # Remove redundant fields
-        log_record.pop("asctime", None)
-        log_record.pop("msecs", None)
-        log_record.pop("relativeCreated", None)
+        # orjson encodes datetimes natively; anything else unknown becomes str()
+        body = orjson.dumps(log_record, default=str)
+        if body == b"{}":
+            return (self._static_prefix + b"}").decode()
+        return (self._static_prefix + b"," + body[1:]).decode()
 
 
 # ── Console Formatter for Development ──
@@ -58,44 +131,179 @@ class ColorFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Colored level names, built once and keyed by levelno
+        self._colored = {
+            logging.getLevelName(name): f"{color}{name}{self.RESET}" for name, color in self.COLORS.items()
+        }
+
     def format(self, record: logging.LogRecord) -> str:
-        # Add color to levelname
-        levelcolor = self.COLORS.get(record.levelname, "")
-        record.levelname = f"{levelcolor}{record.levelname}{self.RESET}"
-        return super().format(record)
+        # Color the levelname for this format only; the record is left
+        # unchanged for any other handler
+        levelname = record.levelname
+        record.levelname = self._colored.get(record.levelno, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+# ── Deferred Formatting ──
+
+# Whether the root logger passes DEBUG records; recomputed by setup_logging().
+# Lets callers skip building debug-only data outright.
+DEBUG_ENABLED = False
+
+
+class lazy:  # noqa: N801 - reads like a function at call sites
+    """Defer an expensive log argument until a record is actually formatted.
+
+    ``logger.debug("state=%s", lazy(pformat, state))`` only calls
+    ``pformat(state)`` if the record is emitted; filtered records cost one
+    small object instead of the formatting work.
+    """
+
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any) -> None:
+        self._func = func
+        self._args = args
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args))
+
+
+# ── Off-thread Output ──
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for a listener in this same process.
+
+    The stock ``prepare`` formats the record on the calling thread and folds
+    any traceback into the message, which would lose the JSON formatter's
+    separate ``exc_info`` field. Here only the message is merged with its
+    args (so later mutation of an arg can't change the logged text); all
+    formatting happens on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that flushes per batch instead of per record.
+
+    Runs on the listener thread. Records accumulate in the stream's buffer
+    and are flushed once the queue has drained, after ``flush_every``
+    records, or immediately for WARNING and above, so a burst costs one
+    ``write()`` instead of one per line while a quiet log is never stale.
+    """
+
+    def __init__(self, stream: TextIO, backlog: Callable[[], bool], flush_every: int = 64) -> None:
+        super().__init__(stream)
+        self._backlog = backlog
+        self._flush_every = flush_every
+        self._unflushed = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            self._unflushed += 1
+            if (
+                record.levelno >= logging.WARNING
+                or self._unflushed >= self._flush_every
+                or not self._backlog()
+            ):
+                self.flush()
+                self._unflushed = 0
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _open_stdout() -> TextIO:
+    """A 1 MiB-buffered text stream on stdout's fd (stdout itself if it has none)."""
+    try:
+        return open(sys.stdout.fileno(), "w", buffering=1 << 20, encoding="utf-8", closefd=False)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        # e.g. stdout replaced by a capture object in tests
+        return sys.stdout
+
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        # The last record before the stop sentinel may still be buffered
+        for handler in _listener.handlers:
+            handler.flush()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 # ── Setup Logging ──
 
 
-def setup_logging() -> logging.Logger:
+_CONFIGURED = False
+
+
+def setup_logging(force: bool = False) -> logging.Logger:
     """Configure structured logging for the application.
 
+    The root logger only enqueues records; a single listener thread formats
+    them and writes to stdout, so logging calls never block on I/O.
+    Configuration happens once per process; later calls return the root
+    logger untouched unless ``force`` is set.
+
+    Args:
+        force: Tear down and rebuild the handlers even if already configured
+
     Returns:
         The root logger
     """
+    global _CONFIGURED, _listener, DEBUG_ENABLED
+
     root_logger = logging.getLogger()
+    if _CONFIGURED and not force:
+        return root_logger
+
     root_logger.setLevel(getattr(logging, settings.log_level.upper(), logging.INFO))
+    DEBUG_ENABLED = root_logger.isEnabledFor(logging.DEBUG)
 
-    # Clear existing handlers
+    # Clear existing handlers (and drain the previous listener, if any)
     root_logger.handlers.clear()
+    _stop_listener()
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    output_handler = _BufferedStreamHandler(_open_stdout(), backlog=lambda: not log_queue.empty())
 
     if settings.environment == "production":
         # JSON handler for production
-        json_handler = logging.StreamHandler(sys.stdout)
-        json_handler.setFormatter(DigitalCTOJsonFormatter(
-            fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
-            timestamp=True,
+        # No %(asctime)s: "timestamp" replaces it, and leaving it out also
+        # spares formatTime() on every record
+        output_handler.setFormatter(DigitalCTOJsonFormatter(
+            fmt="%(name)s %(levelname)s %(message)s",
         ))
-        root_logger.addHandler(json_handler)
     else:
         # Colored console handler for development
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(ColorFormatter(
+        output_handler.setFormatter(ColorFormatter(
             fmt="%(asctime)s | %(name)-30s | %(levelname)-8s | %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         ))
-        root_logger.addHandler(console_handler)
+
+    root_logger.addHandler(_LocalQueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, output_handler, respect_handler_level=True)
+    _listener.start()
 
     # Set log levels for noisy libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -103,6 +311,7 @@ def setup_logging() -> logging.Logger:
     logging.getLogger("websockets").setLevel(logging.WARNING)
     logging.getLogger("uvicorn.access").setLevel(logging.INFO)
 
+    _CONFIGURED = True
     return root_logger
 
 
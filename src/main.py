@@ -24,7 +24,9 @@ import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
+from typing import Any
 
+import orjson
 from fastapi import FastAPI, Header, HTTPException, Request, Response, status
 from slowapi.errors import RateLimitExceeded
 
@@ -33,13 +35,17 @@ from src.logging_config import logger  # Use structured logging
 from src.middleware import (
     limiter,
     verify_api_key,
+    configured_api_key_digests,
+    is_valid_api_key,
     is_public_endpoint,
     is_webhook_endpoint,
 )
 from src.validation import validate_and_exit
-from src.health import get_deep_health_status
+from src.health import close_http_client, get_deep_health_status, register_stores
 from src.integrations.github_client import GitHubClient
-from src.integrations.openclaw_client import OpenClawClient
+from src.integrations.github_client import close_http_client as close_github_rest_client
+from src.integrations.github_graphql import close_http_client as close_github_http_client
+from src.integrations.openclaw_client import get_openclaw_client
 from src.memory.postgres_store import PostgresStore
 from src.memory.qdrant_store import QdrantStore
 from src.memory.redis_store import RedisStore
@@ -66,7 +72,12 @@ from src.integrations.jarvis_handler import JarvisDirectiveHandler
 from src.models.schemas import JarvisDirective, JarvisDirectiveType
 from src.agents.coding_agent.agent import execute_coding_task, get_task_status
 from src.agents.coding_agent.models import CodingTask, CodingComplexity
-from src.integrations.a2a_handler import get_digital_cto_agent_card, A2AProtocolHandler, A2ADirective
+from src.integrations.a2a_handler import (
+    MAX_DIRECTIVE_BYTES,
+    get_digital_cto_agent_card_json,
+    A2AProtocolHandler,
+    A2ADirective,
+)
 from src.memory.knowledge_graph import KnowledgeGraphStore
 
 # ── Shared Resources ──
@@ -74,8 +85,9 @@ from src.memory.knowledge_graph import KnowledgeGraphStore
 redis_store = RedisStore()
 postgres_store = PostgresStore()
 qdrant_store = QdrantStore()
+register_stores(redis_store, postgres_store, qdrant_store)
 github_client = GitHubClient()
-openclaw_client = OpenClawClient() if settings.openclaw_enabled else None
+openclaw_client = get_openclaw_client() if settings.openclaw_enabled else None
 jarvis_handler = JarvisDirectiveHandler(openclaw_client)
 
 # Phase 4: Knowledge Graph and A2A
@@ -202,11 +214,13 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning("OpenClaw close had issues: %s", e)
 
-    # 5. Disconnect memory stores with timeout
+    # 5. Disconnect memory stores and pooled HTTP clients with timeout
     disconnect_tasks = [
         redis_store.disconnect(),
         postgres_store.disconnect(),
         qdrant_store.disconnect(),
+        close_http_client(),
+        close_github_http_client(),
     ]
 
     try:
@@ -215,6 +229,8 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("Some store disconnects had issues: %s", e)
 
+    close_github_rest_client()
+
     shutdown_duration = time.time() - shutdown_start
     logger.info("Shutdown complete in %.2fs. Goodbye.", shutdown_duration)
 
@@ -274,9 +290,9 @@ async def auth_middleware(request: Request, call_next):
 
     # Verify API key
     api_key = request.headers.get("X-API-Key") or request.query_params.get("api_key")
-    configured_keys = settings.digital_cto_api_keys.split(",") if settings.digital_cto_api_keys else []
+    configured_keys = settings.digital_cto_api_keys
 
-    if not configured_keys or not any(k.strip() for k in configured_keys):
+    if not configured_api_key_digests(configured_keys):
         # No keys configured - allow in development
         if settings.environment == "development":
             return await call_next(request)
@@ -286,7 +302,7 @@ async def auth_middleware(request: Request, call_next):
             content={"error": "API authentication not configured on server"},
         )
 
-    if not api_key or api_key not in [k.strip() for k in configured_keys]:
+    if not api_key or not is_valid_api_key(api_key, configured_keys):
         return JSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"error": "Invalid or missing API key"},
@@ -370,7 +386,7 @@ async def health_check(request: Request):
 
 
 @app.get("/health/deep")
-async def deep_health_check():
+async def deep_health_check(response: Response):
     """Comprehensive health check including external services.
 
     Checks:
@@ -379,7 +395,10 @@ async def deep_health_check():
     - GitHub API
     - OpenClaw Gateway
     - Knowledge Graph
+
+    Results are cached server-side for HEALTH_CACHE_TTL_S seconds.
     """
+    response.headers["Cache-Control"] = f"max-age={int(settings.health_cache_ttl_s)}"
     return await get_deep_health_status()
 
 
@@ -493,12 +512,22 @@ async def root():
 # ── Sprint Planner Endpoints ──
 
 
+def _orjson_response(payload: dict[str, Any]) -> Response:
+    """Serialize a sprint payload in a single orjson pass.
+
+    Sprint reports are large nested dicts (metrics, Bayes deliverables,
+    recommendations) with datetime and enum values that orjson encodes
+    natively, skipping FastAPI's jsonable_encoder tree walk.
+    """
+    return Response(content=orjson.dumps(payload), media_type="application/json")
+
+
 @app.get("/sprint/status")
 async def sprint_status(repository: str | None = None):
     """Get quick sprint status with metrics."""
     try:
         metrics = await get_sprint_status(repository)
-        return {"status": "ok", "metrics": metrics}
+        return _orjson_response({"status": "ok", "metrics": metrics})
     except Exception as e:
         logger.error("Failed to get sprint status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -509,7 +538,7 @@ async def sprint_report(repository: str | None = None, sprint_id: str | None = N
     """Get comprehensive sprint report."""
     try:
         report = await get_sprint_report(repository, sprint_id)
-        return {"status": "ok", "report": report}
+        return _orjson_response({"status": "ok", "report": report})
     except Exception as e:
         logger.error("Failed to get sprint report: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -520,7 +549,7 @@ async def bayes_tracking(repository: str | None = None):
     """Get Bayes Consulting deliverable tracking."""
     try:
         bayes = await get_bayes_tracking(repository)
-        return {"status": "ok", "bayes_summary": bayes}
+        return _orjson_response({"status": "ok", "bayes_summary": bayes})
     except Exception as e:
         logger.error("Failed to get Bayes tracking: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -531,7 +560,7 @@ async def sprint_retrospective(repository: str | None = None):
     """Generate a sprint retrospective analysis."""
     try:
         retro = await get_sprint_retrospective(repository)
-        return {"status": "ok", "retrospective": retro}
+        return _orjson_response({"status": "ok", "retrospective": retro})
     except Exception as e:
         logger.error("Failed to generate retrospective: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1222,9 +1251,11 @@ async def agent_card():
     import os
 
     base_url = os.getenv("AGENT_BASE_URL", "https://cto.afcen.org")
-    card = get_digital_cto_agent_card(base_url)
-
-    return card.to_dict()
+    return Response(
+        content=get_digital_cto_agent_card_json(base_url),
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=300"},
+    )
 
 
 @app.post("/webhook/a2a")
@@ -1243,7 +1274,21 @@ async def a2a_webhook(request: Request):
     if not a2a_handler:
         raise HTTPException(status_code=501, detail="A2A protocol not enabled")
 
-    body = await request.json()
+    # Reject oversized or malformed payloads before parsing and HMAC work
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_DIRECTIVE_BYTES:
+        raise HTTPException(status_code=413, detail="Directive payload too large")
+
+    raw = await request.body()
+    if len(raw) > MAX_DIRECTIVE_BYTES:
+        raise HTTPException(status_code=413, detail="Directive payload too large")
+
+    try:
+        body = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON body")
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=400, detail="Directive must be a JSON object")
 
     try:
         directive = await a2a_handler.receive_directive(body)
@@ -55,6 +55,14 @@ def _sanitize_cypher_value(value: str, max_length: int = 2000) -> str:
     return value
 
 
+# ── SQL Statements ──
+
+# Bound parameters keep the statement text constant, so asyncpg's per-connection
+# prepared-statement cache is hit on every call after the first.
+_GRAPH_EXISTS_SQL = text("SELECT graphname FROM ag_graph WHERE graphname = :graph_name")
+_CREATE_GRAPH_SQL = text("SELECT ag_catalog.create_graph(:graph_name);")
+
+
 # ── Cypher Query Templates ──
 
 # Vertex creation
@@ -187,26 +195,26 @@ class KnowledgeGraphStore(PostgresStore):
         try:
             async with self._engine.begin() as conn:
                 # Check if graph exists
-                result = await conn.execute(text(
-                    f"SELECT graphname FROM ag_graph WHERE graphname = '{self.graph_name}'"
-                ))
+                result = await conn.execute(
+                    _GRAPH_EXISTS_SQL, {"graph_name": self.graph_name}
+                )
 
                 if result.rowcount == 0:
                     # Create the graph
-                    await conn.execute(text(
-                        f"SELECT ag_catalog.create_graph('{self.graph_name}');"
-                    ))
-                    logger.info(f"Created knowledge graph: {self.graph_name}")
+                    await conn.execute(
+                        _CREATE_GRAPH_SQL, {"graph_name": self.graph_name}
+                    )
+                    logger.info("Created knowledge graph: %s", self.graph_name)
                 else:
-                    logger.info(f"Knowledge graph {self.graph_name} already exists")
+                    logger.info("Knowledge graph %s already exists", self.graph_name)
 
         except Exception as e:
             # Graph might already exist or other benign errors
             error_str = str(e).lower()
             if "already exists" in error_str:
-                logger.info(f"Knowledge graph '{self.graph_name}' already exists")
+                logger.info("Knowledge graph '%s' already exists", self.graph_name)
             else:
-                logger.warning(f"Failed to initialize knowledge graph: {e}")
+                logger.warning("Failed to initialize knowledge graph: %s", e)
 
     async def log_decision_to_graph(
         self,
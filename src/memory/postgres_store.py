@@ -10,7 +10,7 @@ import logging
 from datetime import datetime
 
 from sqlalchemy import Column, DateTime, Integer, String, Text, JSON, Enum as SAEnum, Float, Boolean, func
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.sql import select
 
@@ -202,12 +202,38 @@ class ActionItem(Base):
 # ── Store Class ──
 
 
+# ── Shared Engines ──
+
+# One engine (and therefore one bounded pool) per database URL, shared by every
+# PostgresStore instance. Agents and scheduler jobs construct stores ad hoc;
+# without this each of them would open and leak a pool of its own.
+_engines: dict[str, AsyncEngine] = {}
+
+
+def _get_engine(url: str) -> AsyncEngine:
+    """Return the shared engine for a database URL, creating it on first use."""
+    engine = _engines.get(url)
+    if engine is None:
+        # Bounded pool; LIFO checkout reuses the most recently returned (warm)
+        # connection and lets surplus idle connections age out.
+        engine = create_async_engine(
+            url,
+            echo=False,
+            pool_size=10,
+            max_overflow=20,
+            pool_timeout=30,
+            pool_use_lifo=True,
+        )
+        _engines[url] = engine
+    return engine
+
+
 class PostgresStore:
     """Async PostgreSQL client for episodic memory."""
 
     def __init__(self, url: str | None = None) -> None:
         self._url = url or settings.postgres_url
-        self._engine = create_async_engine(self._url, echo=False, pool_size=10, max_overflow=20)
+        self._engine = _get_engine(self._url)
         self._session_factory = async_sessionmaker(self._engine, expire_on_commit=False)
 
     async def init_db(self) -> None:
@@ -217,7 +243,10 @@ class PostgresStore:
         logger.info("PostgreSQL episodic memory initialized")
 
     async def disconnect(self) -> None:
-        """Dispose of the engine connection pool."""
+        """Dispose of the shared engine connection pool.
+
+        The engine stays usable afterwards; a fresh pool is created on the next checkout.
+        """
         await self._engine.dispose()
         logger.info("PostgreSQL connection closed")
 
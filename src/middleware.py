@@ -6,8 +6,10 @@ This module provides security and reliability middleware for FastAPI.
 
 from __future__ import annotations
 
+import hashlib
+import hmac
 import os
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Callable
 
 from fastapi import Header, HTTPException, Request, status
@@ -29,6 +31,35 @@ api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 api_key_query = APIKeyQuery(name="api_key", auto_error=False)
 
 
+def _api_key_digest(key: str) -> bytes:
+    """Hash an API key to a fixed-length SHA-256 digest for comparison."""
+    return hashlib.sha256(key.encode("utf-8")).digest()
+
+
+@lru_cache(maxsize=4)
+def configured_api_key_digests(raw_keys: str) -> tuple[bytes, ...]:
+    """Parse a comma-separated API key list into SHA-256 digests.
+
+    Cached on the raw config string, so the split/strip/hash work runs once
+    per distinct configuration instead of on every request.
+    """
+    return tuple(_api_key_digest(k.strip()) for k in raw_keys.split(",") if k.strip())
+
+
+def is_valid_api_key(api_key: str, raw_keys: str) -> bool:
+    """Check an API key against a comma-separated key list in constant time.
+
+    Keys are compared as fixed-length SHA-256 digests with
+    ``hmac.compare_digest`` and every configured key is checked, so the
+    response time leaks neither the matching prefix nor which key matched.
+    """
+    candidate = _api_key_digest(api_key)
+    valid = False
+    for digest in configured_api_key_digests(raw_keys):
+        valid |= hmac.compare_digest(candidate, digest)
+    return valid
+
+
 async def verify_api_key(
     api_key_header: str | None = None,
     api_key_query: str | None = None,
@@ -46,8 +77,8 @@ async def verify_api_key(
     api_key = api_key_header or api_key_query
 
     # If no API keys are configured, allow all (for local dev)
-    configured_keys = os.getenv("DIGITAL_CTO_API_KEYS", "").split(",")
-    if not any(k.strip() for k in configured_keys):
+    configured_keys = os.getenv("DIGITAL_CTO_API_KEYS", "")
+    if not configured_api_key_digests(configured_keys):
         # No keys configured - allow in development only
         if settings.environment == "development":
             return
@@ -63,7 +94,7 @@ async def verify_api_key(
             detail="API key required. Provide via X-API-Key header or api_key query parameter.",
         )
 
-    if api_key not in [k.strip() for k in configured_keys if k.strip()]:
+    if not is_valid_api_key(api_key, configured_keys):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid API key",
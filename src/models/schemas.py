@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import AliasPath, BaseModel, ConfigDict, Field, field_validator
 
 
 # ── GitHub Event Models ──
@@ -54,12 +54,28 @@ class PullRequestData(BaseModel):
     created_at: str = ""
     updated_at: str = ""
 
+    @field_validator("body", mode="before")
+    @classmethod
+    def _none_body_to_empty(cls, v: str | None) -> str:
+        """GitHub sends ``"body": null`` for PRs without a description."""
+        return v or ""
+
 
 class PRWebhookEvent(BaseModel):
-    """Parsed GitHub pull_request webhook event."""
+    """Parsed GitHub pull_request webhook event.
+
+    Validates straight from the raw webhook payload (``repository.full_name``
+    is read via an alias path); the field name still works for direct
+    construction.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
 
     action: str
-    repository_full_name: str = Field(description="e.g. 'afcen/platform'")
+    repository_full_name: str = Field(
+        validation_alias=AliasPath("repository", "full_name"),
+        description="e.g. 'afcen/platform'",
+    )
     pull_request: PullRequestData
 
     @property
@@ -13,6 +13,7 @@ from src.integrations.a2a_handler import (
     A2AProtocolHandler,
     A2A_TYPE_MAP,
     get_digital_cto_agent_card,
+    get_digital_cto_agent_card_json,
 )
 from src.models.schemas import JarvisDirective, JarvisDirectiveType
 
@@ -370,6 +371,27 @@ class TestA2ASendDirective:
 
         assert result is None
 
+    async def test_send_directive_unencodable_payload(self):
+        """Test that a payload orjson can't encode returns None instead of raising."""
+        handler = A2AProtocolHandler(shared_secret="test_secret")
+
+        directive = A2ADirective(
+            directive_id="send-004",
+            type="test_query",
+            payload={"n": 2**70},
+            sender="digital_cto",
+            recipient="jarvis",
+        )
+
+        with patch.object(handler.http_client, "post", new_callable=AsyncMock) as mock_post:
+            result = await handler.send_directive(
+                "https://jarvis.example.com",
+                directive,
+            )
+
+        assert result is None
+        mock_post.assert_not_called()
+
     async def test_send_directive_to_jarvis_found(self):
         """Test send_directive_to_jarvis when JARVIS is discovered."""
         handler = A2AProtocolHandler(shared_secret="test_secret")
@@ -424,6 +446,23 @@ class TestA2ASendDirective:
 
         assert result is None
 
+    async def test_jarvis_endpoint_cached_until_rediscovery(self):
+        """Test that the resolved JARVIS endpoint is reused until discovery runs again."""
+        handler = A2AProtocolHandler()
+        handler.agent_cards["https://jarvis.example.com"] = {"name": "JARVIS"}
+
+        assert handler._resolve_jarvis_endpoint() == "https://jarvis.example.com"
+
+        # Without a new discovery, the cached endpoint is reused
+        handler.agent_cards = {"https://jarvis-v2.example.com": {"name": "JARVIS v2"}}
+        assert handler._resolve_jarvis_endpoint() == "https://jarvis.example.com"
+
+        with patch.object(handler.http_client, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = httpx.ConnectError("down")
+            await handler.discover_agents([])
+
+        assert handler._resolve_jarvis_endpoint() == "https://jarvis-v2.example.com"
+
 
 @pytest.mark.asyncio
 class TestA2ADiscoverAgents:
@@ -525,6 +564,16 @@ class TestDigitalCTOAgentCard:
         assert "code_review" in card.capabilities
         assert "sprint_planning" in card.capabilities
 
+    def test_agent_card_json_is_cached_per_base_url(self):
+        """Test that the serialized card is built once per base URL."""
+        import json
+
+        body = get_digital_cto_agent_card_json("https://cto.example.com")
+
+        assert get_digital_cto_agent_card_json("https://cto.example.com") is body
+        assert json.loads(body) == get_digital_cto_agent_card("https://cto.example.com").to_dict()
+        assert get_digital_cto_agent_card_json("https://other.example.com") is not body
+
 
 @pytest.mark.asyncio
 class TestA2AIntegration:
@@ -561,3 +610,244 @@ async def test_a2a_handler_close():
     handler = A2AProtocolHandler()
     await handler.close()
     # Should not raise an exception
+
+
+@pytest.mark.asyncio
+async def test_a2a_handler_does_not_close_injected_client():
+    """Test that an injected HTTP client is left open on close."""
+    import httpx
+
+    shared = httpx.AsyncClient()
+    handler = A2AProtocolHandler(http_client=shared)
+    assert handler.http_client is shared
+    await handler.close()
+    assert not shared.is_closed
+    await shared.aclose()
+
+
+def test_signature_uses_v2_canonical_form():
+    """Test that new signatures use the v2 field-ordered form and verify."""
+    handler = A2AProtocolHandler(shared_secret="test_secret")
+    directive = A2ADirective(
+        directive_id="sig-001",
+        type="sprint_query",
+        payload={"b": 2, "a": 1},
+        sender="digital_cto",
+        recipient="jarvis",
+    )
+
+    signature = handler._sign_directive(directive)
+    assert signature.startswith("sha256=v2:")
+    # Template must not be consumed by signing
+    assert handler._sign_directive(directive) == signature
+
+    directive.signature = signature
+    data = directive.to_dict()
+    assert handler._verify_signature(data) is True
+
+    # Tampering with any signed field invalidates the signature
+    assert handler._verify_signature({**data, "priority": "high"}) is False
+    assert handler._verify_signature({**data, "payload": {"a": 1, "b": 3}}) is False
+
+
+def test_signature_distinguishes_scalar_types():
+    """Test that retyping a signed field (e.g. False -> "False") breaks the signature."""
+    handler = A2AProtocolHandler(shared_secret="test_secret")
+    directive = A2ADirective(
+        directive_id="sig-002",
+        type="sprint_query",
+        payload={},
+        sender="digital_cto",
+        recipient="jarvis",
+        requires_response=False,
+    )
+    directive.signature = handler._sign_directive(directive)
+    data = directive.to_dict()
+    assert handler._verify_signature(data) is True
+
+    for forged in ("False", "false", None):
+        assert handler._verify_signature({**data, "requires_response": forged}) is False
+    missing = {k: v for k, v in data.items() if k != "requires_response"}
+    assert handler._verify_signature(missing) is False
+
+
+def test_signature_accepts_non_str_payload_keys():
+    """Test that int payload keys sign as their string form, like json.dumps."""
+    handler = A2AProtocolHandler(shared_secret="test_secret")
+    directive = A2ADirective(
+        directive_id="sig-003",
+        type="sprint_query",
+        payload={1: "one"},
+        sender="digital_cto",
+        recipient="jarvis",
+    )
+    directive.signature = handler._sign_directive(directive)
+
+    assert handler._verify_signature({**directive.to_dict(), "payload": {"1": "one"}}) is True
+
+
+def test_verify_accepts_v1_orjson_signature():
+    """Test that plain sha256= signatures over sorted orjson still verify."""
+    import hashlib
+    import hmac
+
+    import orjson
+
+    handler = A2AProtocolHandler(shared_secret="test_secret")
+    directive_data = {
+        "directive_id": "v1-001",
+        "type": "sprint_query",
+        "payload": {"b": 2, "a": 1},
+        "sender": "jarvis",
+        "recipient": "digital_cto",
+    }
+    body = orjson.dumps(directive_data, option=orjson.OPT_SORT_KEYS)
+    directive_data["signature"] = "sha256=" + hmac.new(b"test_secret", body, hashlib.sha256).hexdigest()
+
+    assert handler._verify_signature(directive_data) is True
+
+
+def test_verify_accepts_legacy_json_signature():
+    """Test that signatures from peers using json.dumps still verify."""
+    import hashlib
+    import hmac
+    import json
+
+    handler = A2AProtocolHandler(shared_secret="test_secret")
+    directive_data = {
+        "directive_id": "legacy-001",
+        "type": "sprint_query",
+        "payload": {"query": "status"},
+        "sender": "jarvis",
+        "recipient": "digital_cto",
+        "timestamp": "2026-02-25T10:00:00",
+    }
+    legacy = hmac.new(b"test_secret", json.dumps(directive_data, sort_keys=True).encode(), hashlib.sha256).hexdigest()
+    directive_data["signature"] = f"sha256={legacy}"
+
+    assert handler._verify_signature(directive_data) is True
+
+
+@pytest.mark.asyncio
+class TestA2AWebhookPayloadGuards:
+    """Tests for early rejection of bad webhook payloads."""
+
+    @staticmethod
+    def _request(body: bytes, content_length: str | None = None):
+        request = MagicMock()
+        request.headers = {"content-length": content_length or str(len(body))}
+        request.body = AsyncMock(return_value=body)
+        return request
+
+    async def test_oversized_content_length_rejected_before_read(self):
+        """Test that a large Content-Length is rejected without reading the body."""
+        from fastapi import HTTPException
+
+        import src.main as main
+        from src.integrations.a2a_handler import MAX_DIRECTIVE_BYTES
+
+        request = self._request(b"{}", content_length=str(MAX_DIRECTIVE_BYTES + 1))
+        with patch.object(main, "a2a_handler", A2AProtocolHandler()):
+            with pytest.raises(HTTPException) as exc_info:
+                await main.a2a_webhook(request)
+
+        assert exc_info.value.status_code == 413
+        request.body.assert_not_awaited()
+
+    async def test_malformed_json_rejected(self):
+        """Test that a non-JSON body returns 400 before the handler runs."""
+        from fastapi import HTTPException
+
+        import src.main as main
+
+        handler = A2AProtocolHandler()
+        with patch.object(main, "a2a_handler", handler), \
+             patch.object(handler, "receive_directive", new_callable=AsyncMock) as mock_receive:
+            with pytest.raises(HTTPException) as exc_info:
+                await main.a2a_webhook(self._request(b"{not json"))
+
+        assert exc_info.value.status_code == 400
+        mock_receive.assert_not_awaited()
+
+    async def test_missing_fields_listed(self):
+        """Test that all missing required fields are reported together."""
+        handler = A2AProtocolHandler()
+
+        with pytest.raises(ValueError, match="recipient, sender"):
+            await handler.receive_directive({"directive_id": "x", "type": "t"})
+
+
+def test_message_models_use_slots():
+    """Test that A2A message objects carry no per-instance __dict__."""
+    directive = A2ADirective(
+        directive_id="slots-001",
+        type="sprint_query",
+        payload={},
+        sender="jarvis",
+        recipient="digital_cto",
+    )
+    response = A2AResponse(response_to="slots-001", status="completed")
+
+    assert not hasattr(directive, "__dict__")
+    assert not hasattr(response, "__dict__")
+    assert response.result == {}
+    assert directive.timestamp is not None
+
+
+def test_timestamp_isoformat_memoized_and_refreshed():
+    """Test that to_dict reuses the formatted timestamp until it changes."""
+    from datetime import datetime
+
+    directive = A2ADirective(
+        directive_id="ts-001",
+        type="sprint_query",
+        payload={},
+        sender="jarvis",
+        recipient="digital_cto",
+        timestamp=datetime(2026, 2, 25, 10, 0, 0),
+    )
+
+    first = directive.to_dict()["timestamp"]
+    assert first == "2026-02-25T10:00:00"
+    assert directive.to_dict()["timestamp"] is first
+
+    directive.timestamp = datetime(2026, 2, 26, 8, 0, 0)
+    assert directive.to_dict()["timestamp"] == "2026-02-26T08:00:00"
+    assert directive.timestamp.tzinfo is None
+
+
+@pytest.mark.asyncio
+async def test_discover_agents_concurrent_with_etag_revalidation():
+    """Test that discovery fetches cards concurrently and reuses 304 cards."""
+    import asyncio
+
+    handler = A2AProtocolHandler()
+    in_flight = 0
+    peak = 0
+    seen_headers: list[dict] = []
+
+    async def mock_get(url, headers=None, **kwargs):
+        nonlocal in_flight, peak
+        seen_headers.append(dict(headers or {}))
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        response = MagicMock()
+        if headers and headers.get("If-None-Match") == '"v1"':
+            response.status_code = 304
+            return response
+        response.status_code = 200
+        response.headers = {"ETag": '"v1"'}
+        response.json.return_value = {"name": url.split("/")[2], "capabilities": []}
+        return response
+
+    endpoints = [f"https://agent{i}.example.com" for i in range(3)]
+    with patch.object(handler.http_client, "get", side_effect=mock_get):
+        first = await handler.discover_agents(endpoints)
+        second = await handler.discover_agents(endpoints)
+
+    assert peak == 3
+    assert list(first) == endpoints
+    assert second["https://agent1.example.com"].name == "agent1.example.com"
+    assert seen_headers[-1] == {"If-None-Match": '"v1"'}
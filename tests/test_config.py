@@ -0,0 +1,45 @@
+"""Tests for application configuration loading."""
+
+from __future__ import annotations
+
+import src.config
+from src.config import Settings, get_settings
+
+
+class TestSettingsSingleton:
+    """Test the cached Settings singleton."""
+
+    def test_get_settings_is_cached(self):
+        assert get_settings() is get_settings()
+
+    def test_module_settings_resolves_to_cached_instance(self):
+        from src.config import settings
+
+        assert isinstance(settings, Settings)
+        assert settings is get_settings()
+        assert src.config.settings is settings
+
+    def test_cache_clear_rebuilds_instance(self, monkeypatch):
+        original = get_settings()
+        monkeypatch.setenv("GITHUB_ORG", "afcen-reload")
+        try:
+            get_settings.cache_clear()
+            reloaded = get_settings()
+            assert reloaded is not original
+            assert reloaded.github_org == "afcen-reload"
+        finally:
+            monkeypatch.delenv("GITHUB_ORG")
+            get_settings.cache_clear()
+
+
+class TestDerivedSettings:
+    """Test cached derived settings values."""
+
+    def test_monitored_repos_computed_once(self):
+        s = Settings(github_repos="afcen/platform,afcen/agents")
+        assert s.monitored_repos is s.monitored_repos
+        assert s.monitored_repos == ("afcen/platform", "afcen/agents")
+
+    def test_projects_v2_flag(self):
+        assert Settings(github_org="afcen", github_project_number=3).has_projects_v2 is True
+        assert Settings(github_org="afcen", github_project_number=0).has_projects_v2 is False
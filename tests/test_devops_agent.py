@@ -92,6 +92,33 @@ class TestDevOpsPipeline:
             assert len(result["workflow_runs"]) == 2
             assert len(result["failed_runs"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_fetch_pipeline_data_skips_failed_repo(self):
+        """One failing repo should not drop runs fetched from the others."""
+        state: DevOpsState = {
+            "query_type": "pipeline_status",
+            "repositories": ["afcen/platform", "afcen/down", "afcen/api"],
+            "workflow_runs": [],
+            "failed_runs": [],
+            "failure_details": [],
+            "llm_output": "",
+            "report": None,
+            "error": None,
+        }
+
+        async def fake_runs(repo, limit=20):
+            if repo == "afcen/down":
+                raise RuntimeError("boom")
+            return [{"id": repo, "conclusion": "success"}]
+
+        with patch(
+            "src.integrations.github_graphql.GitHubGraphQLClient.get_workflow_runs",
+            new=lambda self, repo, limit=20: fake_runs(repo, limit),
+        ):
+            result = await fetch_pipeline_data(state)
+
+        assert [r["repository"] for r in result["workflow_runs"]] == ["afcen/platform", "afcen/api"]
+
     @pytest.mark.asyncio
     async def test_analyze_failures_gets_job_details(self):
         """analyze_failures should fetch job details for failed runs."""
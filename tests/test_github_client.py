@@ -0,0 +1,243 @@
+"""Tests for the GitHub REST client."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+import src.integrations.github_client as github_client
+from src.integrations.github_client import GitHubClient
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_client():
+    github_client._http = None
+    github_client._repo_cache.clear()
+    github_client._etag_cache.clear()
+    yield
+    github_client.close_http_client()
+    github_client._repo_cache.clear()
+    github_client._etag_cache.clear()
+
+
+class TestSharedHttpClient:
+    """Test that sync REST calls share one pooled client."""
+
+    def test_client_is_reused_across_instances_until_closed(self):
+        first = GitHubClient(token="a").http
+
+        assert GitHubClient(token="b").http is first
+
+        github_client.close_http_client()
+        assert first.is_closed
+        assert GitHubClient(token="a").http is not first
+
+    def test_get_pr_diff_uses_shared_client(self):
+        client = GitHubClient(token="test-token")
+        mock_response = MagicMock(text="diff --git a/x b/x")
+
+        client._github = MagicMock()
+
+        with patch.object(github_client, "_get_http_client") as mock_http:
+            mock_http.return_value.get.return_value = mock_response
+            diff = client.get_pr_diff("afcen/platform", 7)
+
+        assert diff == "diff --git a/x b/x"
+        client._github.get_repo.assert_not_called()
+        url = mock_http.return_value.get.call_args.args[0]
+        headers = mock_http.return_value.get.call_args.kwargs["headers"]
+        assert url == "https://api.github.com/repos/afcen/platform/pulls/7"
+        assert headers["Accept"] == "application/vnd.github.diff"
+        assert headers["Authorization"] == "Bearer test-token"
+
+
+class TestLazyObjects:
+    """Test that PR operations skip the repo metadata GET."""
+
+    def test_post_review_uses_lazy_repo(self):
+        client = GitHubClient(token="test-token")
+        client._github = MagicMock()
+
+        client.post_review("afcen/platform", 7, body="LGTM")
+
+        client._github.get_repo.assert_called_once_with("afcen/platform", lazy=True)
+        repo = client._github.get_repo.return_value
+        repo.get_pull.return_value.create_review.assert_called_once_with(body="LGTM", event="COMMENT")
+
+    def test_post_review_passes_api_shaped_comments_through(self):
+        client = GitHubClient(token="test-token")
+        client._github = MagicMock()
+        comments = [{"path": "a.py", "line": 3, "body": "nit"}]
+
+        client.post_review("afcen/platform", 7, body="ok", comments=comments)
+        client.post_review("afcen/platform", 7, body="ok", comments=[{"path": "a.py", "body": "x", "severity": "info"}])
+
+        create_review = client._github.get_repo.return_value.get_pull.return_value.create_review
+        assert create_review.call_args_list[0].kwargs["comments"] is comments
+        assert create_review.call_args_list[1].kwargs["comments"] == [{"path": "a.py", "line": 1, "body": "x"}]
+
+
+class TestLabels:
+    """Test label batching."""
+
+    def test_add_labels_posts_once(self):
+        client = GitHubClient(token="test-token")
+        client._github = MagicMock()
+
+        client.add_labels("afcen/platform", 7, ["bug", "needs-review"])
+
+        issue = client._github.get_repo.return_value.get_issue.return_value
+        issue.add_to_labels.assert_called_once_with("bug", "needs-review")
+
+    def test_add_labels_empty_is_noop(self):
+        client = GitHubClient(token="test-token")
+        client._github = MagicMock()
+
+        client.add_labels("afcen/platform", 7, [])
+
+        client._github.get_repo.assert_not_called()
+
+
+class TestRepoCache:
+    """Test short-lived reuse of Repository handles."""
+
+    def test_repo_handle_is_reused_until_not_found(self):
+        client = GitHubClient(token="test-token")
+        client._github = MagicMock()
+
+        first = client._repo("afcen/platform")
+        assert client._repo("afcen/platform") is first
+        client._github.get_repo.assert_called_once()
+
+        client._forget_repo("afcen/platform", MagicMock(status=404))
+        client._repo("afcen/platform")
+        assert client._github.get_repo.call_count == 2
+
+
+class TestPRFiles:
+    """Test PR file listing over REST."""
+
+    @staticmethod
+    def _file(name: str) -> dict:
+        return {
+            "filename": name,
+            "status": "modified",
+            "additions": 1,
+            "deletions": 0,
+            "changes": 1,
+            "patch": "@@ -1 +1 @@",
+            "contents_url": f"https://api.github.com/contents/{name}",
+        }
+
+    def test_follows_next_link_and_can_drop_patches(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if "page=2" in str(request.url):
+                return httpx.Response(200, json=[self._file("b.py")])
+            return httpx.Response(
+                200,
+                json=[self._file("a.py")],
+                headers={"Link": f'<{request.url.copy_with(params={"per_page": 100, "page": 2})}>; rel="next"'},
+            )
+
+        github_client._http = httpx.Client(transport=httpx.MockTransport(handler))
+        client = GitHubClient(token="test-token")
+
+        files = client.get_pr_files("afcen/platform", 7, include_patches=False)
+
+        assert [f["filename"] for f in files] == ["a.py", "b.py"]
+        assert all("patch" not in f for f in files)
+        assert requests[0].url.params["per_page"] == "100"
+        assert len(requests) == 2
+
+    def test_iter_stops_fetching_when_caller_breaks(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json=[self._file("a.py"), self._file("b.py")],
+                headers={"Link": '<https://api.github.com/next?page=2>; rel="next"'},
+            )
+
+        github_client._http = httpx.Client(transport=httpx.MockTransport(handler))
+        client = GitHubClient(token="test-token")
+
+        first = next(client.iter_pr_files("afcen/platform", 7))
+
+        assert first["filename"] == "a.py"
+        assert first["patch"] == "@@ -1 +1 @@"
+        assert len(requests) == 1
+
+
+class TestFileContent:
+    """Test conditional file content fetches."""
+
+    def test_etag_revalidation_reuses_cached_content(self):
+        import base64
+
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            if request.headers.get("If-None-Match") == '"abc"':
+                return httpx.Response(304)
+            content = base64.b64encode(b"print('hi')\n").decode()
+            return httpx.Response(200, json={"content": content, "encoding": "base64"}, headers={"ETag": '"abc"'})
+
+        github_client._http = httpx.Client(transport=httpx.MockTransport(handler))
+        client = GitHubClient(token="test-token")
+
+        first = client.get_file_content("afcen/platform", "app.py", ref="main")
+        second = client.get_file_content("afcen/platform", "app.py", ref="main")
+
+        assert first == second == "print('hi')\n"
+        assert seen[0].url.params["ref"] == "main"
+        assert "If-None-Match" not in seen[0].headers
+        assert seen[1].headers["If-None-Match"] == '"abc"'
+        # The conditional header is added to a copy, never the prebuilt headers
+        assert "If-None-Match" not in client._headers
+
+    def test_path_with_url_delimiters_is_quoted(self):
+        import base64
+
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            content = base64.b64encode(b"notes").decode()
+            return httpx.Response(200, json={"content": content, "encoding": "base64"})
+
+        github_client._http = httpx.Client(transport=httpx.MockTransport(handler))
+        client = GitHubClient(token="test-token")
+
+        assert client.get_file_content("afcen/platform", "docs/notes#1.md") == "notes"
+        assert client.get_file_content("afcen/platform", "a?b.md") == "notes"
+
+        assert seen[0].url.raw_path.decode() == "/repos/afcen/platform/contents/docs/notes%231.md?ref=main"
+        assert seen[1].url.raw_path.decode() == "/repos/afcen/platform/contents/a%3Fb.md?ref=main"
+
+    def test_missing_file_returns_empty(self):
+        github_client._http = httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(404)))
+
+        assert GitHubClient(token="test-token").get_file_content("afcen/platform", "nope.py") == ""
+
+    def test_undecodable_file_returns_empty(self):
+        import base64
+
+        binary = base64.b64encode(b"\xff\xfe\x00png").decode()
+        responses = {
+            "/repos/afcen/platform/contents/logo.png": httpx.Response(200, json={"content": binary}),
+            "/repos/afcen/platform/contents/bad.py": httpx.Response(200, json={"content": "not base64!"}),
+            "/repos/afcen/platform/contents/garbled.py": httpx.Response(200, content=b"<html>"),
+        }
+        github_client._http = httpx.Client(transport=httpx.MockTransport(lambda r: responses[r.url.path]))
+        client = GitHubClient(token="test-token")
+
+        for path in ("logo.png", "bad.py", "garbled.py"):
+            assert client.get_file_content("afcen/platform", path) == ""
@@ -4,11 +4,25 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, patch, MagicMock
 
+import orjson
 import pytest
 
+import src.integrations.github_graphql as github_graphql
 from src.integrations.github_graphql import GitHubGraphQLClient
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_client():
+    github_graphql._http = None
+    github_graphql._iteration_cache.clear()
+    github_graphql._etag_cache.clear()
+    github_graphql._inflight.clear()
+    yield
+    github_graphql._http = None
+    github_graphql._iteration_cache.clear()
+    github_graphql._etag_cache.clear()
+
+
 class TestGraphQLExecution:
     """Test raw GraphQL query execution."""
 
@@ -20,9 +34,9 @@ class TestGraphQLExecution:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.raise_for_status = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "data": {"organization": {"projectV2": {"title": "Test Project"}}}
-        }
+        })
 
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = AsyncMock()
@@ -43,10 +57,10 @@ class TestGraphQLExecution:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.raise_for_status = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "errors": [{"message": "Not found"}],
             "data": None,
-        }
+        })
 
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = AsyncMock()
@@ -101,10 +115,9 @@ class TestProjectV2:
         client = GitHubGraphQLClient(token="test-token")
 
         mock_project = {
-            "id": "PVT_123",
-            "title": "Sprint Board",
             "fields": {
                 "nodes": [
+                    {},
                     {
                         "id": "FIELD_1",
                         "name": "Sprint",
@@ -123,13 +136,86 @@ class TestProjectV2:
             },
         }
 
-        with patch.object(client, "get_project_v2", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_project
+        with patch.object(client, "execute", new_callable=AsyncMock) as mock_exec:
+            mock_exec.return_value = {"organization": {"projectV2": mock_project}}
             result = await client.get_current_sprint_iteration("afcen", 1)
+            assert mock_exec.call_args.args[0] is github_graphql._QUERY_CURRENT_ITERATION
             assert result is not None
             assert result["title"] == "Sprint 5"
             assert result["duration_days"] == 14
 
+            # A second lookup within the TTL is served from cache
+            assert await client.get_current_sprint_iteration("afcen", 1) == result
+            mock_exec.assert_awaited_once()
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent identical requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_project_lookups_share_one_request(self):
+        import asyncio
+
+        client = GitHubGraphQLClient(token="test-token")
+        calls = 0
+
+        async def slow_execute(query, variables=None):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"organization": {"projectV2": {"id": "PVT_1"}}}
+
+        with patch.object(client, "execute", new=slow_execute):
+            results = await asyncio.gather(*(client.get_project_v2("afcen", 1) for _ in range(5)))
+            assert all(r == {"id": "PVT_1"} for r in results)
+            assert calls == 1
+            assert not github_graphql._inflight
+
+            await client.get_project_v2("afcen", 1)
+            assert calls == 2
+
+
+class TestProjectItems:
+    """Test Projects V2 item parsing."""
+
+    @pytest.mark.asyncio
+    async def test_status_and_story_points_from_field_values(self):
+        client = GitHubGraphQLClient(token="test-token")
+        mock_data = {
+            "organization": {
+                "projectV2": {
+                    "items": {
+                        "nodes": [
+                            {
+                                "id": "ITEM_1",
+                                "content": {"number": 10, "title": "Task A", "state": "OPEN"},
+                                "fieldValues": {
+                                    "nodes": [
+                                        {"iterationId": "ITER_1", "title": "Sprint 5"},
+                                        {"name": "In Progress", "field": {"name": "Status"}},
+                                        {"number": 5, "field": {"name": "Story Points"}},
+                                    ]
+                                },
+                            },
+                            {
+                                "id": "ITEM_2",
+                                "content": {"number": 11, "title": "Task B", "state": "OPEN"},
+                                "fieldValues": {"nodes": [{"iterationId": "ITER_0"}]},
+                            },
+                        ]
+                    }
+                }
+            }
+        }
+
+        with patch.object(client, "execute", new_callable=AsyncMock) as mock_exec:
+            mock_exec.return_value = mock_data
+            items = await client.get_project_items("afcen", 1, iteration_id="ITER_1")
+
+        assert len(items) == 1
+        assert items[0]["status"] == "In Progress"
+        assert items[0]["story_points"] == 5
+
 
 class TestWorkflowRuns:
     """Test GitHub Actions workflow run methods."""
@@ -142,7 +228,7 @@ class TestWorkflowRuns:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.raise_for_status = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "workflow_runs": [
                 {
                     "id": 123,
@@ -173,7 +259,7 @@ class TestWorkflowRuns:
                     "run_attempt": 1,
                 },
             ]
-        }
+        })
 
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = AsyncMock()
@@ -195,7 +281,7 @@ class TestWorkflowRuns:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.raise_for_status = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "jobs": [
                 {
                     "id": 1001,
@@ -214,7 +300,7 @@ class TestWorkflowRuns:
                     ],
                 }
             ]
-        }
+        })
 
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = AsyncMock()
@@ -227,3 +313,90 @@ class TestWorkflowRuns:
             assert len(jobs) == 1
             assert jobs[0]["conclusion"] == "failure"
             assert jobs[0]["steps"][0]["name"] == "Run tests"
+
+
+class TestSharedHttpClient:
+    """Test that GraphQL/REST calls share one pooled client."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_across_instances_until_closed(self):
+        first = github_graphql._get_http_client()
+
+        assert github_graphql._get_http_client() is first
+
+        await github_graphql.close_http_client()
+        assert first.is_closed
+        assert github_graphql._get_http_client() is not first
+        await github_graphql.close_http_client()
+
+
+class TestOrjsonBodies:
+    """Test that request bodies are pre-encoded with orjson."""
+
+    @pytest.mark.asyncio
+    async def test_execute_posts_orjson_body(self):
+        client = GitHubGraphQLClient(token="test-token")
+        mock_response = MagicMock()
+        mock_response.content = b'{"data": {"ok": true}}'
+
+        with patch.object(github_graphql, "_get_http_client") as mock_http:
+            mock_http.return_value.post = AsyncMock(return_value=mock_response)
+            assert await client.execute("query { ok }", {"a": 1}) == {"ok": True}
+
+        kwargs = mock_http.return_value.post.call_args.kwargs
+        assert orjson.loads(kwargs["content"]) == {"query": "query { ok }", "variables": {"a": 1}}
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+
+class TestWorkflowRunsETag:
+    """Test conditional workflow run polling."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_reuses_cached_runs(self):
+        import httpx
+
+        run = {"id": 1, "status": "completed", "conclusion": "success", "workflow_id": 7}
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            if request.headers.get("If-None-Match") == 'W/"runs"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"workflow_runs": [run]}, headers={"ETag": 'W/"runs"'})
+
+        github_graphql._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        client = GitHubGraphQLClient(token="test-token")
+
+        first = await client.get_workflow_runs("afcen/platform")
+        second = await client.get_workflow_runs("afcen/platform")
+
+        assert first == second
+        assert seen[1].headers["If-None-Match"] == 'W/"runs"'
+        await github_graphql.close_http_client()
+
+
+class TestNextLink:
+    """Test Link header pagination parsing."""
+
+    def test_extracts_next_url(self):
+        header = (
+            '<https://api.github.com/x?page=2>; rel="next", '
+            '<https://api.github.com/x?page=5>; rel="last"'
+        )
+        assert github_graphql.next_link(header) == "https://api.github.com/x?page=2"
+
+    def test_last_page_and_missing_header(self):
+        assert github_graphql.next_link('<https://api.github.com/x?page=1>; rel="prev"') is None
+        assert github_graphql.next_link(None) is None
+
+
+def test_queries_are_minified():
+    """Query documents are sent on a single line without indentation runs."""
+    for query in (
+        github_graphql._QUERY_GET_PROJECT_V2,
+        github_graphql._QUERY_CURRENT_ITERATION,
+        github_graphql._QUERY_GET_PROJECT_ITEMS,
+    ):
+        assert "\n" not in query
+        assert "  " not in query
+        assert query.startswith("query(")
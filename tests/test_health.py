@@ -0,0 +1,333 @@
+"""Tests for deep health check utilities."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import src.health as health
+
+
+@pytest.fixture(autouse=True)
+def _clear_health_cache():
+    health._cache.clear()
+    health._inflight.clear()
+    yield
+    health._cache.clear()
+    health._inflight.clear()
+
+
+class TestHealthCache:
+    """Test TTL caching of health probe results."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_probe(self):
+        calls = 0
+
+        async def probe():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"status": "healthy"}
+
+        results = await asyncio.gather(*(health._cached("k", 10.0, probe) for _ in range(5)))
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refreshed(self):
+        probe = AsyncMock(side_effect=[1, 2])
+
+        now = [0.0]
+
+        with patch("src.health.time.monotonic", side_effect=lambda: now[0]):
+            assert await health._cached("k", 10.0, probe) == 1
+            now[0] = 5.0
+            assert await health._cached("k", 10.0, probe) == 1
+            now[0] = 20.0
+            assert await health._cached("k", 10.0, probe) == 2
+
+        assert probe.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables_cache(self):
+        probe = AsyncMock(side_effect=[1, 2])
+
+        assert await health._cached("k", 0, probe) == 1
+        assert await health._cached("k", 0, probe) == 2
+        assert "k" not in health._cache
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_still_coalesces_inflight_callers(self):
+        calls = 0
+
+        async def probe():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(health._cached("k", 0, probe) for _ in range(3)))
+
+        assert results == [1, 1, 1]
+        assert await health._cached("k", 0, probe) == 2
+        assert "k" not in health._inflight
+
+    @pytest.mark.asyncio
+    async def test_deep_status_is_cached(self):
+        with patch("src.health._get_deep_health_status", new=AsyncMock(return_value={"status": "healthy"})) as probe:
+            first = await health.get_deep_health_status()
+            second = await health.get_deep_health_status()
+
+        assert first is second
+        probe.assert_awaited_once()
+
+
+class TestDeepHealthStatus:
+    """Test aggregation of internal and external probes."""
+
+    @pytest.mark.asyncio
+    async def test_internal_and_external_probes_run_concurrently(self):
+        async def slow(name):
+            await asyncio.sleep(0.2)
+            return name, {"status": "ok"}, False
+
+        async def external():
+            await asyncio.sleep(0.2)
+            return {"llm": health.HealthCheckResult(service="anthropic", healthy=True)}
+
+        with patch("src.health._check_redis", new=lambda: slow("redis")), \
+             patch("src.health._check_postgres", new=lambda: slow("postgres")), \
+             patch("src.health._check_qdrant", new=lambda: slow("qdrant")), \
+             patch("src.health.check_all_external_services", new=external):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            status = await health._get_deep_health_status()
+            elapsed = loop.time() - start
+
+        assert elapsed < 0.6
+        assert status["status"] == "healthy"
+        assert set(status["components"]) == {"redis", "postgres", "qdrant", "llm"}
+
+    @pytest.mark.asyncio
+    async def test_failed_internal_probe_marks_degraded(self):
+        async def ok(name):
+            return name, {"status": "ok"}, False
+
+        async def boom():
+            raise RuntimeError("redis exploded")
+
+        with patch("src.health._check_redis", new=boom), \
+             patch("src.health._check_postgres", new=lambda: ok("postgres")), \
+             patch("src.health._check_qdrant", new=lambda: ok("qdrant")), \
+             patch("src.health.check_all_external_services", new=AsyncMock(return_value={})):
+            status = await health._get_deep_health_status()
+
+        assert status["status"] == "degraded"
+        assert status["components"]["redis"]["status"] == "error"
+        assert status["components"]["redis"]["message"] == "RuntimeError: redis exploded"
+        assert status["components"]["postgres"] == {"status": "ok"}
+
+
+def test_short_err_bounds_detail():
+    assert health._short_err(ValueError("x" * 500)) == "ValueError: " + "x" * 80
+    assert health._short_err(TimeoutError()) == "TimeoutError"
+
+
+class TestStoreProbes:
+    """Test that internal probes reuse the registered store instances."""
+
+    @pytest.mark.asyncio
+    async def test_registered_stores_are_probed(self):
+        redis = AsyncMock()
+        redis.health_check.return_value = True
+        qdrant = AsyncMock()
+        qdrant.health_check.return_value = False
+
+        with patch("src.health._stores", None):
+            health.register_stores(redis, object(), qdrant)
+            assert await health._check_redis() == ("redis", {"status": "ok"}, False)
+            assert await health._check_qdrant() == ("qdrant", {"status": "down"}, True)
+            assert await health._check_redis() == ("redis", {"status": "ok"}, False)
+
+        assert redis.health_check.await_count == 2
+
+
+class TestLLMCheck:
+    """Test concurrent LLM provider probing."""
+
+    @pytest.mark.asyncio
+    async def test_first_healthy_provider_wins_and_others_are_cancelled(self):
+        cancelled = asyncio.Event()
+
+        async def slow_anthropic(client):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def fast_zai(client):
+            return health.HealthCheckResult(service="zai", healthy=True, message="API responding")
+
+        with patch("src.health.settings") as mock_settings, \
+             patch("src.health._check_anthropic", new=slow_anthropic), \
+             patch("src.health._check_zai", new=fast_zai):
+            mock_settings.has_anthropic = True
+            mock_settings.has_azure_openai = False
+            mock_settings.has_zai = True
+            result = await health.check_llm_api()
+
+        assert result.service == "zai"
+        assert result.healthy is True
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_all_unhealthy_returns_highest_priority_failure(self):
+        async def failing(service):
+            return health.HealthCheckResult(service=service, healthy=False, message="HTTP 500")
+
+        with patch("src.health.settings") as mock_settings, \
+             patch("src.health._check_anthropic", new=lambda c: failing("anthropic")), \
+             patch("src.health._check_azure_openai", new=lambda c: failing("azure_openai")):
+            mock_settings.has_anthropic = True
+            mock_settings.has_azure_openai = True
+            mock_settings.has_zai = False
+            result = await health.check_llm_api()
+
+        assert result.service == "anthropic"
+        assert result.healthy is False
+
+    @pytest.mark.asyncio
+    async def test_no_provider_configured(self):
+        with patch("src.health.settings") as mock_settings:
+            mock_settings.has_anthropic = False
+            mock_settings.has_azure_openai = False
+            mock_settings.has_zai = False
+            result = await health.check_llm_api()
+
+        assert result.service == "llm"
+        assert result.message == "No LLM API configured"
+
+
+class TestSharedHttpClient:
+    """Test the pooled HTTP client used by health probes."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_until_closed(self):
+        client = health._get_http_client()
+        try:
+            assert health._get_http_client() is client
+        finally:
+            await health.close_http_client()
+
+        assert client.is_closed
+        replacement = health._get_http_client()
+        assert replacement is not client
+        await health.close_http_client()
+
+
+class TestProviderProbes:
+    """Test the cheap per-provider liveness probes."""
+
+    @staticmethod
+    def _client(status_code: int):
+        import httpx
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.method == "GET"
+            return httpx.Response(status_code, json={"data": []})
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    @pytest.mark.asyncio
+    async def test_models_listing_success_is_healthy(self):
+        async with self._client(200) as client:
+            with patch("src.health.settings") as mock_settings:
+                mock_settings.zai_base_url = "https://api.z.ai/v1"
+                mock_settings.zai_api_key = "key"
+                result = await health._check_zai(client)
+
+        assert result.healthy is True
+        assert result.message == "API responding"
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_reports_auth_failure(self):
+        async with self._client(401) as client:
+            with patch("src.health.settings") as mock_settings:
+                mock_settings.anthropic_api_key = "bad"
+                result = await health._check_anthropic(client)
+
+        assert result.healthy is False
+        assert result.message == "Authentication failed"
+
+
+class TestGitHubCheck:
+    """Test the GitHub rate-limit probe."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_probe_is_cached(self):
+        import httpx
+
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            assert request.url.path == "/rate_limit"
+            assert request.headers["Authorization"] == "Bearer ghp_test"
+            return httpx.Response(200, json={"resources": {"core": {"remaining": 4999}}})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("src.health.settings") as mock_settings, \
+             patch("src.health._get_http_client", return_value=client):
+            mock_settings.github_token = "ghp_test"
+            first = await health.check_github_api()
+            second = await health.check_github_api()
+        await client.aclose()
+
+        assert first is second
+        assert calls == 1
+        assert first.healthy is True
+        assert first.details == {"rate_limit_remaining": 4999}
+
+    @pytest.mark.asyncio
+    async def test_bad_token_is_unhealthy(self):
+        import httpx
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(401)))
+        with patch("src.health.settings") as mock_settings, \
+             patch("src.health._get_http_client", return_value=client):
+            mock_settings.github_token = "bad"
+            result = await health.check_github_api()
+        await client.aclose()
+
+        assert result.healthy is False
+        assert "401" in result.message
+
+
+class TestExternalChecksBudget:
+    """Test the overall deadline on external service checks."""
+
+    @pytest.mark.asyncio
+    async def test_hung_check_times_out_without_blocking_others(self):
+        async def ok(service):
+            return health.HealthCheckResult(service=service, healthy=True)
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        with patch("src.health._EXTERNAL_CHECKS_BUDGET_S", 0.1), \
+             patch("src.health.check_llm_api", new=lambda: ok("anthropic")), \
+             patch("src.health.check_github_api", new=hang), \
+             patch("src.health.check_openclaw_gateway", new=lambda: ok("openclaw")), \
+             patch("src.health.check_knowledge_graph", new=lambda: ok("knowledge_graph")):
+            results = await health._check_all_external_services()
+
+        assert list(results) == ["llm", "github", "openclaw", "knowledge_graph"]
+        assert results["llm"].healthy is True
+        assert results["github"].healthy is False
+        assert results["github"].message == "check timed out"
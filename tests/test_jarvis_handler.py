@@ -52,6 +52,7 @@ class TestDirectiveModels:
         assert DIRECTIVE_TO_EVENT["review_pr"] == "pull_request"
         assert DIRECTIVE_TO_EVENT["architecture_query"] == "architecture_query"
         assert DIRECTIVE_TO_EVENT["devops_status"] == "devops_status"
+        assert DIRECTIVE_TO_EVENT[JarvisDirectiveType.REVIEW_PR] == "pull_request"
 
 
 class TestDirectiveHandler:
@@ -192,3 +193,44 @@ class TestDirectiveHandler:
         """register_event_handlers should not crash without a client."""
         handler = JarvisDirectiveHandler(openclaw_client=None)
         handler.register_event_handlers()  # Should not raise
+
+    async def test_registered_handler_reads_raw_event_frame(self):
+        """The agent.message handler builds a directive from the event dict's payload."""
+        client = MagicMock()
+        handler = JarvisDirectiveHandler(openclaw_client=client)
+        handler.register_event_handlers()
+        on_agent_message = client.on_event.call_args.args[1]
+
+        with patch.object(handler, "handle_directive", new=AsyncMock()) as handle, \
+             patch.object(handler, "send_response", new=AsyncMock()):
+            await on_agent_message({
+                "type": "event",
+                "event": "agent.message",
+                "payload": {"directive_id": "dir-9", "type": "devops_status", "payload": {"repo": "x"}},
+            })
+
+        directive = handle.call_args.args[0]
+        assert directive.directive_id == "dir-9"
+        assert directive.type == JarvisDirectiveType.DEVOPS_STATUS
+        assert directive.payload == {"repo": "x"}
+
+
+def test_pending_approvals_expire_and_are_bounded():
+    """Unanswered approvals are dropped after the TTL or when over capacity."""
+    from src.integrations.jarvis_handler import _PendingApprovals
+
+    now = [0.0]
+    with patch("src.integrations.jarvis_handler.time.monotonic", side_effect=lambda: now[0]):
+        pending = _PendingApprovals(ttl=10.0, maxsize=2)
+        pending["a"] = {"n": 1}
+        pending["b"] = {"n": 2}
+        pending["c"] = {"n": 3}
+
+        assert "a" not in pending
+        assert len(pending) == 2
+
+        now[0] = 11.0
+        assert "b" not in pending
+        pending["d"] = {"n": 4}
+        assert len(pending) == 1
+        assert pending.pop("d") == {"n": 4}
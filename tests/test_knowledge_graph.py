@@ -106,6 +106,26 @@ class TestKnowledgeGraphStore:
         # AFFECTS edge (repository), RELATES_TO edge (pr_number) = 5 calls
         assert mock_conn.execute.call_count == 5
 
+    async def test_init_graph_binds_graph_name(self):
+        """Graph lookup/creation should use bound parameters, not interpolation."""
+        kg = KnowledgeGraphStore(url=None)
+
+        mock_conn = AsyncMock()
+        mock_conn.execute.return_value = MagicMock(rowcount=0)
+        mock_engine = MagicMock()
+        mock_engine.begin.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
+        mock_engine.begin.return_value.__aexit__ = AsyncMock(return_value=False)
+        kg._engine = mock_engine
+
+        await kg.init_graph()
+
+        # LOAD 'age', graph lookup, graph creation
+        assert mock_conn.execute.call_count == 3
+        for c in mock_conn.execute.call_args_list[1:]:
+            stmt, params = c.args
+            assert kg.graph_name not in str(stmt)
+            assert params == {"graph_name": kg.graph_name}
+
     async def test_log_decision_without_context(self):
         """Test log_decision with no context (no AFFECTS/RELATES_TO edges)."""
         kg = KnowledgeGraphStore(url=None)
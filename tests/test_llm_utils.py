@@ -0,0 +1,59 @@
+"""Tests for shared LLM utilities."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from src.llm import utils
+from src.llm.utils import extract_json_from_llm_output, get_default_llm
+
+
+class TestExtractJson:
+    """Test JSON extraction from raw LLM responses."""
+
+    def test_plain_json(self):
+        assert extract_json_from_llm_output('  {"a": 1}  ') == {"a": 1}
+
+    def test_json_fence(self):
+        text = 'Sure, here it is:\n```json\n{"a": [1, 2]}\n```\nAnything else?'
+        assert extract_json_from_llm_output(text) == {"a": [1, 2]}
+
+    def test_bare_code_fence(self):
+        assert extract_json_from_llm_output('```\n{"a": 1}\n```') == {"a": 1}
+
+    def test_embedded_object_with_trailing_text(self):
+        text = 'Result: {"a": {"b": "}"}} and a stray } after'
+        assert extract_json_from_llm_output(text) == {"a": {"b": "}"}}
+
+    def test_skips_non_json_braces(self):
+        text = "Set {placeholder} first, then: {\"ok\": true}"
+        assert extract_json_from_llm_output(text) == {"ok": True}
+
+    def test_truncated_object_does_not_return_nested_part(self):
+        assert extract_json_from_llm_output('Result: {"items": [{"a": 1}, {"b": 2}') is None
+
+    def test_embedded_array(self):
+        assert extract_json_from_llm_output("items: [1, 2, 3] done") == [1, 2, 3]
+
+    def test_no_json(self):
+        assert extract_json_from_llm_output("no structured data here") is None
+        assert extract_json_from_llm_output("") is None
+
+
+class TestDefaultLLM:
+    """Test provider resolution and instance caching."""
+
+    def test_instances_cached_per_temperature(self):
+        utils._build_llm.cache_clear()
+        with patch("src.llm.utils._resolve_provider", return_value="anthropic"), \
+             patch("langchain_anthropic.ChatAnthropic") as chat:
+            chat.side_effect = lambda **kwargs: object()
+
+            first = get_default_llm(temperature=0.2)
+            again = get_default_llm(temperature=0.2)
+            other = get_default_llm(temperature=0.7)
+
+        utils._build_llm.cache_clear()
+        assert first is again
+        assert other is not first
+        assert chat.call_count == 2
@@ -0,0 +1,151 @@
+"""Tests for structured logging configuration."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+
+from src.logging_config import (
+    ColorFormatter,
+    DigitalCTOJsonFormatter,
+    _BufferedStreamHandler,
+    _format_timestamp,
+    lazy,
+    setup_logging,
+)
+
+
+def _record(msg: str = "hello", level: int = logging.INFO, created: float | None = None) -> logging.LogRecord:
+    record = logging.LogRecord("src.test", level, __file__, 1, msg, None, None)
+    if created is not None:
+        record.created = created
+    return record
+
+
+class TestTimestamp:
+    """Test ISO 8601 timestamps built from record.created."""
+
+    def test_format(self):
+        assert _format_timestamp(1_700_000_000.123456) == "2023-11-14T22:13:20.123456+00:00"
+        assert _format_timestamp(1_700_000_000.5) == "2023-11-14T22:13:20.500000+00:00"
+        assert _format_timestamp(1_700_000_001.0) == "2023-11-14T22:13:21.000000+00:00"
+
+
+class TestJsonFormatter:
+    """Test the production JSON log shape."""
+
+    def test_fields(self):
+        formatter = DigitalCTOJsonFormatter(fmt="%(name)s %(levelname)s %(message)s")
+
+        out = json.loads(formatter.format(_record(level=logging.WARNING, created=1_700_000_000.25)))
+
+        assert out["message"] == "hello"
+        assert out["name"] == "src.test"
+        assert out["level"] == "warning"
+        assert out["service"] == "digital_cto"
+        assert out["timestamp"] == "2023-11-14T22:13:20.250000+00:00"
+        assert set(out) == {"service", "environment", "name", "levelname", "message", "timestamp", "level"}
+
+    def test_static_fields_lead_and_extras_are_encoded(self):
+        formatter = DigitalCTOJsonFormatter(fmt="%(name)s %(levelname)s %(message)s")
+        record = _record()
+        record.repo = "afcen/platform"
+        record.opaque = object()
+
+        raw = formatter.format(record)
+        out = json.loads(raw)
+
+        assert raw.startswith('{"service":"digital_cto","environment":')
+        assert out["repo"] == "afcen/platform"
+        assert out["opaque"].startswith("<object object")
+
+    def test_extra_service_and_environment_not_duplicated(self):
+        formatter = DigitalCTOJsonFormatter(fmt="%(message)s")
+        record = _record()
+        record.service = "other"
+        record.environment = "other"
+
+        raw = formatter.format(record)
+
+        assert raw.count('"service"') == 1
+        assert raw.count('"environment"') == 1
+        assert json.loads(raw)["service"] == "digital_cto"
+
+
+class TestColorFormatter:
+    """Test the development console formatter."""
+
+    def test_colors_level_without_mutating_record(self):
+        record = _record(level=logging.ERROR)
+
+        out = ColorFormatter(fmt="%(levelname)s %(message)s").format(record)
+
+        assert out == "\033[31mERROR\033[0m hello"
+        assert record.levelname == "ERROR"
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+class TestBufferedStreamHandler:
+    """Test batch flushing on the listener thread."""
+
+    def test_flushes_when_backlog_drains(self):
+        stream = _CountingStream()
+        backlog = [True, True, False]
+        handler = _BufferedStreamHandler(stream, backlog=lambda: backlog.pop(0))
+
+        for _ in range(3):
+            handler.emit(_record())
+
+        assert stream.getvalue().count("hello") == 3
+        assert stream.flushes == 1
+
+    def test_warnings_and_batch_size_flush_immediately(self):
+        stream = _CountingStream()
+        handler = _BufferedStreamHandler(stream, backlog=lambda: True, flush_every=2)
+
+        handler.emit(_record(level=logging.WARNING))
+        assert stream.flushes == 1
+        handler.emit(_record())
+        handler.emit(_record())
+        assert stream.flushes == 2
+
+
+class TestLazy:
+    """Test deferred log arguments."""
+
+    def test_only_evaluated_when_emitted(self):
+        calls: list[int] = []
+
+        def expensive(x: int) -> str:
+            calls.append(x)
+            return f"value={x}"
+
+        logger = logging.getLogger("src.test.lazy")
+        logger.setLevel(logging.INFO)
+        logger.debug("skipped %s", lazy(expensive, 1))
+        assert calls == []
+
+        record = logging.LogRecord("src.test.lazy", logging.INFO, __file__, 1, "got %s", (lazy(expensive, 2),), None)
+        assert record.getMessage() == "got value=2"
+        assert calls == [2]
+
+
+class TestSetupLogging:
+    """Test one-time handler configuration."""
+
+    def test_repeat_calls_keep_handlers(self):
+        root = setup_logging()
+        handlers = list(root.handlers)
+
+        assert setup_logging() is root
+        assert root.handlers == handlers
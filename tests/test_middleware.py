@@ -0,0 +1,40 @@
+"""Tests for API key authentication middleware."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import HTTPException
+
+from src.middleware import configured_api_key_digests, is_valid_api_key, verify_api_key
+
+
+class TestApiKeyValidation:
+    """Test constant-time API key checks."""
+
+    def test_accepts_configured_key(self):
+        assert is_valid_api_key("key-b", "key-a, key-b") is True
+
+    def test_rejects_unknown_key(self):
+        assert is_valid_api_key("key-c", "key-a, key-b") is False
+
+    def test_rejects_prefix_of_configured_key(self):
+        assert is_valid_api_key("key", "key-a") is False
+
+    def test_no_configured_keys(self):
+        assert is_valid_api_key("key-a", "") is False
+        assert is_valid_api_key("key-a", " , ") is False
+
+    def test_configured_digests_are_cached(self):
+        first = configured_api_key_digests("key-a,key-b")
+        assert len(first) == 2
+        assert configured_api_key_digests("key-a,key-b") is first
+
+    @pytest.mark.asyncio
+    async def test_verify_api_key_rejects_invalid(self, monkeypatch):
+        monkeypatch.setenv("DIGITAL_CTO_API_KEYS", "key-a, key-b")
+        monkeypatch.delenv("DEVELOPMENT_MODE", raising=False)
+
+        await verify_api_key(api_key_header="key-b")
+        with pytest.raises(HTTPException) as exc:
+            await verify_api_key(api_key_header="nope")
+        assert exc.value.status_code == 403
@@ -0,0 +1,254 @@
+"""Tests for the OpenClaw Gateway WebSocket client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import orjson
+import pytest
+
+from src.integrations import openclaw_client
+from src.integrations.openclaw_client import OpenClawClient
+
+
+class FakeWebSocket:
+    """In-memory stand-in for a websockets ClientConnection.
+
+    Every request sent is answered with an ``ok`` response echoing its
+    params, unless ``auto_reply`` is off.
+    """
+
+    def __init__(self, auto_reply: bool = True) -> None:
+        self.sent: list[tuple[Any, dict[str, Any]]] = []
+        self.inbox: asyncio.Queue[Any] = asyncio.Queue()
+        self.auto_reply = auto_reply
+        self.recv_decode: list[bool | None] = []
+
+    async def send(self, message: Any, **kwargs: Any) -> None:
+        self.sent.append((message, kwargs))
+        if self.auto_reply:
+            req = orjson.loads(message)
+            self.inbox.put_nowait(
+                orjson.dumps({"type": "res", "id": req["id"], "ok": True, "payload": req["params"]})
+            )
+
+    async def recv(self, decode: bool | None = None) -> Any:
+        self.recv_decode.append(decode)
+        return await self.inbox.get()
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+async def connected_client():
+    """OpenClawClient wired to a FakeWebSocket with the receive loop running."""
+    client = OpenClawClient(gateway_url="http://gateway.test", gateway_token="tok")
+    client._ws = FakeWebSocket()
+    client._ws_connected = True
+    client._loop = asyncio.get_running_loop()
+    client._receive_task = asyncio.create_task(client._receive_loop())
+    yield client
+    await client.disconnect()
+
+
+class TestRPC:
+    """Test request framing and response correlation."""
+
+    async def test_call_sends_text_frame_and_returns_response(self, connected_client):
+        response = await connected_client.call("agent.notify", {"n": 1})
+
+        message, kwargs = connected_client._ws.sent[0]
+        frame = orjson.loads(message)
+        assert kwargs.get("text") is True
+        assert frame["type"] == "req"
+        assert frame["method"] == "agent.notify"
+        assert frame["params"] == {"n": 1}
+        assert response.ok is True
+        assert response.id == frame["id"]
+        assert response.payload == {"n": 1}
+        assert connected_client._pending_requests == {}
+        # Frames are read as raw bytes for orjson
+        assert set(connected_client._ws.recv_decode) == {False}
+
+    async def test_request_ids_are_sequential(self, connected_client):
+        await connected_client.call("agent.notify", {})
+        await connected_client.call("agent.notify", {})
+
+        ids = [orjson.loads(message)["id"] for message, _ in connected_client._ws.sent]
+        assert ids == ["1", "2"]
+
+    async def test_call_timeout_clears_pending(self, connected_client):
+        connected_client._ws.auto_reply = False
+
+        response = await connected_client.call("agent.notify", {}, timeout=0.01)
+
+        assert response.ok is False
+        assert "timed out" in response.error
+        assert connected_client._pending_requests == {}
+
+    async def test_send_failure_clears_pending(self, connected_client):
+        async def broken_send(message, **kwargs):
+            raise OSError("socket gone")
+
+        connected_client._ws.send = broken_send
+
+        response = await connected_client.call("agent.notify", {})
+        await asyncio.sleep(0)
+
+        assert response.ok is False
+        assert response.error == "socket gone"
+        assert connected_client._pending_requests == {}
+
+    async def test_malformed_frame_does_not_stop_loop(self, connected_client):
+        connected_client._ws.inbox.put_nowait(b"{not json")
+
+        response = await connected_client.call("agent.notify", {"n": 2})
+
+        assert response.ok is True
+
+    async def test_burst_of_bad_frames_logged_once(self, connected_client, caplog):
+        for _ in range(5):
+            connected_client._ws.inbox.put_nowait(b"{not json")
+
+        with caplog.at_level("WARNING", logger="src.integrations.openclaw_client"):
+            response = await connected_client.call("agent.notify", {"n": 4})
+
+        assert response.ok is True
+        messages = [r.getMessage() for r in caplog.records]
+        assert sum(m.startswith("Failed to decode") for m in messages) == 1
+        assert "Skipped 4 more bad WebSocket frames" in messages
+
+
+class TestHealthCheck:
+    """Test the HTTP liveness probe."""
+
+    async def test_head_probe(self):
+        methods: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            return httpx.Response(200)
+
+        client = OpenClawClient(gateway_url="http://gateway.test")
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await client.health_check() is True
+        assert methods == ["HEAD"]
+        await client.close()
+
+    async def test_falls_back_to_get_when_head_not_allowed(self):
+        methods: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            return httpx.Response(405 if request.method == "HEAD" else 200)
+
+        client = OpenClawClient(gateway_url="http://gateway.test")
+        client._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert await client.health_check() is True
+        assert methods == ["HEAD", "GET"]
+        await client.close()
+
+
+class TestEvents:
+    """Test event dispatch from the receive loop."""
+
+    async def test_event_dispatched_to_handler(self, connected_client):
+        received = asyncio.Event()
+        seen: list[Any] = []
+
+        async def handler(event):
+            seen.append(event)
+            received.set()
+
+        connected_client.on_event("agent.message", handler)
+        connected_client._ws.inbox.put_nowait(
+            orjson.dumps({"type": "event", "event": "agent.message", "payload": {"type": "general_query"}})
+        )
+        await asyncio.wait_for(received.wait(), timeout=1.0)
+
+        assert seen[0]["event"] == "agent.message"
+        assert seen[0]["payload"] == {"type": "general_query"}
+
+    async def test_slow_handler_does_not_block_responses(self, connected_client):
+        release = asyncio.Event()
+
+        async def slow_handler(event):
+            await release.wait()
+
+        connected_client.on_event("agent.message", slow_handler)
+        connected_client._ws.inbox.put_nowait(
+            orjson.dumps({"type": "event", "event": "agent.message", "payload": {}})
+        )
+
+        response = await connected_client.call("agent.notify", {"n": 3}, timeout=1.0)
+
+        assert response.ok is True
+        assert len(connected_client._handler_tasks) == 1
+        release.set()
+        await asyncio.sleep(0)
+
+    async def test_close_cancels_in_flight_handlers(self, connected_client):
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def slow_handler(event):
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        connected_client.on_event("agent.message", slow_handler)
+        connected_client._ws.inbox.put_nowait(
+            orjson.dumps({"type": "event", "event": "agent.message", "payload": {}})
+        )
+        await asyncio.wait_for(started.wait(), timeout=1.0)
+
+        await connected_client.close()
+
+        assert cancelled.is_set()
+        assert connected_client._handler_tasks == set()
+
+    async def test_handler_concurrency_is_bounded(self, connected_client):
+        release = asyncio.Event()
+        running: list[int] = []
+
+        async def slow_handler(event):
+            running.append(event["payload"]["n"])
+            await release.wait()
+
+        connected_client.on_event("agent.message", slow_handler)
+        burst = openclaw_client._EVENT_HANDLER_CONCURRENCY + 3
+        for n in range(burst):
+            connected_client._ws.inbox.put_nowait(
+                orjson.dumps({"type": "event", "event": "agent.message", "payload": {"n": n}})
+            )
+        await connected_client.call("agent.notify", {}, timeout=1.0)
+        await asyncio.sleep(0)
+
+        # The rest wait for a slot, and handlers start in arrival order
+        assert running == list(range(openclaw_client._EVENT_HANDLER_CONCURRENCY))
+        release.set()
+        await asyncio.gather(*connected_client._handler_tasks)
+        assert running == list(range(burst))
+
+
+class TestTimestamps:
+    """Test the per-second memoized message timestamp."""
+
+    def test_iso_now_reused_within_a_second(self):
+        with patch.object(openclaw_client.time, "time", side_effect=[1_700_000_000.1, 1_700_000_000.9, 1_700_000_001.0]):
+            first = openclaw_client._iso_now()
+            second = openclaw_client._iso_now()
+            third = openclaw_client._iso_now()
+
+        assert first is second
+        assert first == "2023-11-14T22:13:20+00:00"
+        assert third == "2023-11-14T22:13:21+00:00"
@@ -11,8 +11,11 @@ from src.agents.sprint_planner.agent import (
     SprintPlannerState,
     fetch_sprint_data,
     generate_recommendations,
+    generate_report,
+    track_bayes_deliverables,
     _static_recommendations,
     _default_state,
+    _parse_json_object,
 )
 
 
@@ -31,6 +34,93 @@ class TestSprintQueryTypes:
         assert "retrospective" in types
 
 
+class TestSprintModels:
+    """Test sprint planner data models."""
+
+    def test_validators_built_at_import(self):
+        from src.agents.sprint_planner import models
+
+        for model in (
+            models.SprintMetrics,
+            models.Deliverable,
+            models.SprintReport,
+            models.BayesSOWSummary,
+            models.SprintPlannerInput,
+        ):
+            assert model.__pydantic_complete__, model.__name__
+
+    def test_deliverable_is_frozen(self):
+        from pydantic import ValidationError
+        from src.agents.sprint_planner.models import Deliverable
+
+        deliverable = Deliverable(deliverable_id="1", title="Auth API")
+        with pytest.raises(ValidationError):
+            deliverable.title = "Changed"
+
+    def test_deliverable_is_bayes(self):
+        from src.agents.sprint_planner.models import Deliverable, VendorType
+
+        assert Deliverable(deliverable_id="1", title="A", labels=["Bayes-Review"]).is_bayes
+        assert Deliverable(
+            deliverable_id="2", title="B", vendor=VendorType.BAYES_CONSULTING
+        ).is_bayes
+        assert not Deliverable(deliverable_id="3", title="C", labels=["frontend"]).is_bayes
+
+    def test_is_overdue_uses_coarse_clock(self):
+        from datetime import datetime, timedelta
+        from src.agents.sprint_planner import models
+
+        past = models.Deliverable(
+            deliverable_id="1", title="A", due_date=datetime.utcnow() - timedelta(days=1)
+        )
+        future = models.Deliverable(
+            deliverable_id="2", title="B", due_date=datetime.utcnow() + timedelta(days=1)
+        )
+        assert past.is_overdue is True
+        assert future.is_overdue is False
+        with patch("src.agents.sprint_planner.models.time.monotonic", return_value=42.5):
+            assert models._coarse_utcnow() is models._coarse_utcnow()
+
+    def test_metrics_rejects_unknown_fields(self):
+        from datetime import datetime
+        from pydantic import ValidationError
+        from src.agents.sprint_planner.models import SprintMetrics
+
+        with pytest.raises(ValidationError):
+            SprintMetrics(
+                sprint_id="s1",
+                sprint_name="Sprint 1",
+                start_date=datetime(2026, 1, 1),
+                end_date=datetime(2026, 1, 15),
+                velocitty=1.0,
+            )
+
+    @pytest.mark.parametrize(
+        ("completed", "blocked", "expected"),
+        [
+            (8, 0, "healthy"),
+            (8, 1, "at_risk"),
+            (5, 5, "at_risk"),
+            (2, 2, "at_risk"),
+            (2, 3, "critical"),
+        ],
+    )
+    def test_health_status_table(self, completed, blocked, expected):
+        from datetime import datetime
+        from src.agents.sprint_planner.models import SprintMetrics
+
+        metrics = SprintMetrics(
+            sprint_id="s1",
+            sprint_name="Sprint 1",
+            start_date=datetime(2026, 1, 1),
+            end_date=datetime(2026, 1, 15),
+            total_story_points=10,
+            completed_story_points=completed,
+            blocked_items=blocked,
+        )
+        assert metrics.health_status == expected
+
+
 class TestDefaultState:
     """Test the _default_state helper."""
 
@@ -81,6 +171,45 @@ class TestProjectsV2Fallback:
                 assert result["use_projects_v2"] is False
                 assert len(result["issues"]) >= 1
 
+    @pytest.mark.asyncio
+    async def test_fetch_data_deduplicates_monitored_repos(self):
+        """Duplicate monitored repos should only be fetched once."""
+        state = _default_state()
+
+        with patch("src.config.settings") as mock_settings:
+            mock_settings.has_projects_v2 = False
+            mock_settings.monitored_repos = ["afcen/platform", "afcen/api", "afcen/platform"]
+
+            with patch(
+                "src.agents.sprint_planner.agent.GitHubClient"
+            ) as mock_gh_cls:
+                mock_gh = MagicMock()
+                mock_gh.get_repository_issues.return_value = []
+                mock_gh_cls.return_value = mock_gh
+
+                await fetch_sprint_data(state)
+
+                repos = [c.args[0] for c in mock_gh.get_repository_issues.call_args_list]
+                assert repos == ["afcen/platform", "afcen/api", "afcen/platform", "afcen/api"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_data_short_circuits_without_sources(self):
+        """With no repos and no Projects V2, no GitHub client should be created."""
+        state = _default_state()
+
+        with patch("src.config.settings") as mock_settings:
+            mock_settings.has_projects_v2 = False
+            mock_settings.monitored_repos = []
+
+            with patch(
+                "src.agents.sprint_planner.agent.GitHubClient"
+            ) as mock_gh_cls:
+                result = await fetch_sprint_data(state)
+
+                mock_gh_cls.assert_not_called()
+                assert result["issues"] == []
+                assert result["use_projects_v2"] is False
+
     @pytest.mark.asyncio
     async def test_fetch_data_uses_projects_v2_when_available(self):
         """When has_projects_v2 is True, should fetch from Projects V2."""
@@ -148,6 +277,87 @@ class TestStaticRecommendations:
         assert any("bayes" in r.lower() for r in recs)
 
 
+class TestParseJsonObject:
+    """Test extraction of the JSON payload from LLM output."""
+
+    def test_parses_object_wrapped_in_prose(self):
+        content = 'Here you go:\n```json\n{"recommendations": ["Fix {auth}", "Say \\"hi\\""]}\n```'
+        parsed = _parse_json_object(content)
+        assert parsed["recommendations"] == ["Fix {auth}", 'Say "hi"']
+
+    def test_parses_bare_object(self):
+        assert _parse_json_object('  {"recommendations": []}  ') == {"recommendations": []}
+
+
+class TestBayesTracking:
+    """Test Bayes deliverable tracking."""
+
+    @pytest.mark.asyncio
+    async def test_tracks_only_bayes_issues(self):
+        state = _default_state()
+        state["issues"] = [
+            {"number": 1, "title": "Agent A", "state": "closed", "labels": [{"name": "Bayes"}]},
+            {"number": 2, "title": "Agent B", "state": "open", "labels": [{"name": "bayes-blocked"}]},
+            {"number": 3, "title": "Agent C", "state": "open",
+             "labels": [{"name": "bayes-review"}, {"name": "sp:3"}]},
+            {"number": 4, "title": "Internal", "state": "open", "labels": [{"name": "blocked"}]},
+        ]
+
+        result = await track_bayes_deliverables(state)
+
+        summary = result["bayes_summary"]
+        assert summary["status_counts"] == {
+            "not_started": 0,
+            "in_progress": 0,
+            "review": 1,
+            "done": 1,
+            "blocked": 1,
+        }
+        assert summary["sow_summary"]["total_deliverables"] == 3
+        assert summary["sow_summary"]["overdue_deliverables"] == 0
+        assert [d["story_points"] for d in summary["deliverables"]] == [0, 0, 3]
+
+    def test_is_overdue_at(self):
+        from datetime import datetime
+        from src.agents.sprint_planner.models import Deliverable, DeliverableStatus
+
+        due = datetime(2026, 3, 1)
+        open_item = Deliverable(deliverable_id="1", title="A", due_date=due)
+        done_item = Deliverable(
+            deliverable_id="2", title="B", due_date=due, status=DeliverableStatus.DONE
+        )
+        assert open_item.is_overdue_at(datetime(2026, 3, 2)) is True
+        assert open_item.is_overdue_at(datetime(2026, 2, 28)) is False
+        assert done_item.is_overdue_at(datetime(2026, 3, 2)) is False
+
+
+class TestGenerateReport:
+    """Test issue categorization in generate_report."""
+
+    @pytest.mark.asyncio
+    async def test_report_counts_issue_buckets(self):
+        state = _default_state()
+        state["metrics"] = {"health_status": "at_risk", "completion_rate": 50, "velocity": 1.0}
+        state["bayes_summary"] = {}
+        state["issues"] = [
+            {"number": 1, "state": "closed", "labels": [{"name": "Blocked"}],
+             "milestone": {"due_on": "2020-01-01T00:00:00Z"}},
+            {"number": 2, "state": "open", "labels": [{"name": "Bayes-Blocked"}]},
+            {"number": 3, "state": "open", "labels": [{"name": "feature"}]},
+            {"number": 4, "state": "OPEN", "labels": []},
+        ]
+
+        result = await generate_report(state)
+
+        assert result["report"]["counts"] == {
+            "completed": 1,
+            "in_progress": 2,
+            "blocked": 1,
+            "overdue": 0,
+            "total": 4,
+        }
+
+
 class TestLLMRecommendations:
     """Test LLM-powered recommendations."""
 
@@ -166,6 +376,20 @@ class TestLLMRecommendations:
             result = await generate_recommendations(state)
             assert len(result["recommendations"]) >= 1
 
+    @pytest.mark.asyncio
+    async def test_retrospective_without_llm_returns_notice(self):
+        """Retrospective bails out early when no LLM is configured."""
+        state = _default_state(
+            include_recommendations=True,
+            query_type="retrospective",
+        )
+        state["metrics"] = {}
+        state["issues"] = [{"number": 1, "state": "closed", "labels": []}]
+
+        with patch("src.agents.sprint_planner.agent._get_llm", return_value=None):
+            result = await generate_recommendations(state)
+            assert "requires an LLM" in result["recommendations"][0]
+
 
 class TestSprintPrompts:
     """Test sprint planner prompt formatting."""
@@ -194,3 +418,55 @@ class TestSprintPrompts:
         )
         assert "2.5" in formatted
         assert "8" in formatted
+
+    def test_precompiled_templates_match_str_format(self):
+        from src.agents.sprint_planner.agent import (
+            _REC_PROMPT_PARTS,
+            _RETRO_PROMPT_PARTS,
+            _render_template,
+        )
+        from src.agents.sprint_planner.prompts import (
+            SPRINT_RECOMMENDATIONS_PROMPT,
+            SPRINT_RETROSPECTIVE_PROMPT,
+        )
+
+        rec_fields = {
+            "metrics_summary": "Completion: 75%",
+            "bayes_summary": "2 deliverables blocked",
+            "issue_highlights": "- [BLOCKED] #42: Auth middleware",
+        }
+        retro_fields = {
+            "metrics_summary": "Velocity: 2.5 pts/day",
+            "completed_count": 8,
+            "in_progress_count": 3,
+            "blocked_count": 1,
+            "overdue_count": 0,
+            "bayes_summary": "5/10 completed",
+        }
+        assert _render_template(_REC_PROMPT_PARTS, **rec_fields) == (
+            SPRINT_RECOMMENDATIONS_PROMPT.format(**rec_fields)
+        )
+        assert _render_template(_RETRO_PROMPT_PARTS, **retro_fields) == (
+            SPRINT_RETROSPECTIVE_PROMPT.format(**retro_fields)
+        )
+
+
+class TestSprintEndpoints:
+    """Test sprint endpoint JSON serialization."""
+
+    @pytest.mark.asyncio
+    async def test_sprint_status_serializes_datetimes(self):
+        import json
+        from datetime import datetime
+
+        import src.main as main
+
+        metrics = {"sprint_id": "current", "start_date": datetime(2026, 2, 17, 9, 30)}
+        with patch.object(main, "get_sprint_status", AsyncMock(return_value=metrics)):
+            response = await main.sprint_status()
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {
+            "status": "ok",
+            "metrics": {"sprint_id": "current", "start_date": "2026-02-17T09:30:00"},
+        }
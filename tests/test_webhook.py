@@ -45,6 +45,17 @@ class TestWebhookSignatureVerification:
 
         assert client.verify_webhook_signature(sample_pr_payload_bytes, "") is False
 
+    def test_malformed_signature_is_rejected(self, sample_pr_payload_bytes):
+        """Wrong scheme, wrong length, or non-hex signatures should be rejected."""
+        from src.integrations.github_client import GitHubClient
+
+        client = GitHubClient(token="fake", webhook_secret="test-secret")
+        hex_sig = _sign_payload(sample_pr_payload_bytes, "test-secret").split("=", 1)[1]
+
+        assert client.verify_webhook_signature(sample_pr_payload_bytes, f"sha1={hex_sig}") is False
+        assert client.verify_webhook_signature(sample_pr_payload_bytes, f"sha256={hex_sig[:-2]}") is False
+        assert client.verify_webhook_signature(sample_pr_payload_bytes, "sha256=" + "zz" * 32) is False
+
     def test_no_secret_configured_passes(self, sample_pr_payload_bytes):
         """If no webhook secret is set, verification is skipped (dev mode)."""
         from src.integrations.github_client import GitHubClient
@@ -80,3 +91,28 @@ class TestPREventParsing:
 
         assert event.action == "closed"
         assert event.is_reviewable is False
+
+    def test_null_body_and_missing_optionals(self, sample_pr_payload):
+        """GitHub's null body and absent optional fields fall back to defaults."""
+        from src.integrations.github_client import GitHubClient
+
+        pr = sample_pr_payload["pull_request"]
+        pr["body"] = None
+        del pr["user"]["avatar_url"], pr["created_at"]
+
+        event = GitHubClient.parse_pr_event(sample_pr_payload)
+
+        assert event.pull_request.body == ""
+        assert event.pull_request.user.avatar_url == ""
+        assert event.pull_request.created_at == ""
+
+    def test_missing_required_field_raises(self, sample_pr_payload):
+        """A payload without the repository cannot be parsed."""
+        import pydantic
+
+        from src.integrations.github_client import GitHubClient
+
+        del sample_pr_payload["repository"]
+
+        with pytest.raises(pydantic.ValidationError):
+            GitHubClient.parse_pr_event(sample_pr_payload)